@@ -0,0 +1,208 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Benchmark for the memory used by the subclient records of the inventory.
+
+Builds the same subclients, as received in the JSON response of the commcell, in 3 forms:
+
+    raw         --  the subclient property dictionaries, as parsed from the JSON response
+
+    namedtuple  --  namedtuple records with string ids and lower case names, as stored by the
+                        inventory before the compact records
+
+    compact     --  the slotted SubclientRecord of the inventory, with integer ids and
+                        interned names
+
+and prints the memory allocated by each of them, measured with tracemalloc.
+
+Only the records of the inventory are compared. The Client, Agent, Backupset, Subclient, and
+Job objects have no compact mode, as they keep their properties to post them back on update.
+
+Usage:
+    python benchmarks/inventory_memory.py [number of subclients]
+
+        default: 500000 subclients, of 100 subclients per client
+
+Requires Python 3, for tracemalloc.
+
+Output with Python 3.11, for the default 500,000 subclients:
+
+    500,000 subclient records
+    raw              793.2 MB
+    namedtuple       182.9 MB
+    compact          110.3 MB
+
+"""
+
+from __future__ import absolute_import
+from __future__ import print_function
+
+import gc
+import os
+import sys
+import tracemalloc
+
+from collections import namedtuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from cvpysdk.inventory import SubclientRecord, _checksum, _name     # noqa: E402
+
+
+NamedTupleSubclientRecord = namedtuple('NamedTupleSubclientRecord', SubclientRecord.__slots__)
+
+SUBCLIENTS_PER_CLIENT = 100
+
+
+def get_subclient_properties(count):
+    """Returns the properties of the subclients, in the form parsed from the JSON response,
+        with a new string object for every name, as the JSON decoder creates.
+
+        Args:
+            count   (int)   --  number of subclients
+
+        Returns:
+            list - list of the subclient property dictionaries
+    """
+    subclients = []
+
+    for index in range(count):
+        client_id = index // SUBCLIENTS_PER_CLIENT + 1
+
+        subclients.append({
+            'subClientEntity': {
+                'clientId': client_id,
+                'clientName': 'Client{0}'.format(client_id),
+                'applicationId': 33,
+                'appName': 'File System',
+                'instanceId': 1,
+                'instanceName': 'DefaultInstanceName',
+                'backupsetId': client_id * 10,
+                'backupsetName': 'defaultBackupSet',
+                'subclientId': index + 1,
+                'subclientName': 'Subclient{0}'.format(index % SUBCLIENTS_PER_CLIENT)
+            },
+            'commonProperties': {
+                'enableBackup': index % 2 == 0,
+                'lastBackupTime': 1500000000 + index,
+                'nextBackupTime': 1500086400 + index,
+                'storageDevice': {
+                    'dataBackupStoragePolicy': {
+                        'storagePolicyName': 'SP-{0}'.format(index % 20)
+                    }
+                }
+            },
+            'content': [{'path': '/data/{0}'.format(index)}]
+        })
+
+    return subclients
+
+
+def to_namedtuple(properties):
+    """Returns the namedtuple record for the subclient, with string ids, and lower case names.
+
+        Args:
+            properties  (dict)  --  properties of the subclient
+
+        Returns:
+            object - NamedTupleSubclientRecord for the subclient
+    """
+    entity = properties['subClientEntity']
+    common_properties = properties['commonProperties']
+    storage_policy = common_properties['storageDevice']['dataBackupStoragePolicy'][
+        'storagePolicyName'
+    ]
+
+    return NamedTupleSubclientRecord(
+        str(entity['subclientId']),
+        str(entity['subclientName']).lower(),
+        str(storage_policy).lower(),
+        bool(common_properties['enableBackup']),
+        common_properties['lastBackupTime'],
+        common_properties['nextBackupTime'],
+        _checksum(properties['content'])
+    )
+
+
+def to_compact(properties):
+    """Returns the compact record for the subclient, as built by the InventoryCrawler.
+
+        Args:
+            properties  (dict)  --  properties of the subclient
+
+        Returns:
+            object - SubclientRecord for the subclient
+    """
+    entity = properties['subClientEntity']
+    common_properties = properties['commonProperties']
+    storage_policy = common_properties['storageDevice']['dataBackupStoragePolicy'][
+        'storagePolicyName'
+    ]
+
+    return SubclientRecord(
+        int(entity['subclientId']),
+        _name(entity['subclientName']),
+        _name(storage_policy),
+        bool(common_properties['enableBackup']),
+        common_properties['lastBackupTime'],
+        common_properties['nextBackupTime'],
+        _checksum(properties['content'])
+    )
+
+
+def measure(function, count):
+    """Returns the memory allocated by the result of the function, and still in use.
+
+        Args:
+            function    (callable)  --  function building the records, for the count given
+
+            count       (int)       --  number of subclients
+
+        Returns:
+            int - number of bytes allocated by the records
+    """
+    gc.collect()
+    tracemalloc.start()
+
+    records = function(count)
+
+    gc.collect()
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    del records
+    return size
+
+
+def main(count):
+    """Builds the subclient records in each of the forms, and prints the memory used by them.
+
+        Args:
+            count   (int)   --  number of subclients
+    """
+    results = [
+        ('raw', measure(get_subclient_properties, count)),
+        ('namedtuple', measure(
+            lambda count: [to_namedtuple(item) for item in get_subclient_properties(count)],
+            count
+        )),
+        ('compact', measure(
+            lambda count: [to_compact(item) for item in get_subclient_properties(count)],
+            count
+        ))
+    ]
+
+    print('{0:,} subclient records'.format(count))
+
+    for name, size in results:
+        print('{0:<12}{1:>10.1f} MB'.format(name, size / 1024.0 / 1024.0))
+
+
+if __name__ == '__main__':
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500000)
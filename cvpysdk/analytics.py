@@ -0,0 +1,504 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""File for computing the statistics of the job history of a commcell.
+
+JobHistory: Class for the columnar store of the job records, with the distributions of the
+                duration, size, throughput, failure rate, and delay causes of the jobs,
+                per client, agent, or storage policy
+
+The jobs are stored in compact columns, using the array module: integer codes for the names of
+the clients, agents, storage policies, statuses, and delay causes, and doubles for the numbers.
+All the statistics are computed with a single pass over the group code column, and sorting the
+values of each group.
+
+If NumPy is installed, the grouping and the aggregations are vectorized NumPy operations over
+views of the same arrays, without copying the columns. NumPy is an optional dependency, imported
+only when the statistics are computed; without it, they are plain Python loops over the elements
+of the arrays, giving the same results.
+
+A job is counted as failed, if its status is failed, or killed. The delay cause of a job is its
+delay reason, or its pending reason, if the summary of the job has no delay reason.
+
+Usage:
+    >>> history = JobHistory(commcell.jobs.finished_jobs(lookup_time=30 * 86400))
+    >>> history.distribution('client', 'duration')
+    >>> history.failure_rate('storage_policy')
+
+
+JobHistory:
+    __init__(records)           --  initialise object of the JobHistory class, with the columns
+                                        of the job records given
+
+    __repr__()                  --  returns the string for the instance of the JobHistory class
+
+    __len__()                   --  returns the number of jobs in the history
+
+    _column()                   --  returns the NumPy view of the column, without copying it
+
+    from_summaries()            --  returns the history for the job summaries received from
+                                        the server, or recorded as fixtures
+
+    _encode()                   --  returns the integer code for the name, in the column
+
+    _groups()                   --  returns the positions of the jobs, for each group
+
+    _statistics()               --  returns the statistics of the values given
+
+    distribution()              --  returns the distribution of the metric, for each group
+
+    failure_rate()              --  returns the fraction of the jobs failed, for each group
+
+    delay_causes()              --  returns the most frequent delay causes, for each group
+
+    summary()                   --  returns all the statistics, for each group
+
+"""
+
+from __future__ import absolute_import
+from __future__ import division
+
+import math
+
+from array import array
+
+from .jobcontroller import JobRecord
+from .exception import SDKException
+
+
+def _import_numpy():
+    """Returns the numpy module, or None if NumPy is not installed."""
+    try:
+        import numpy
+    except ImportError:
+        return None
+
+    return numpy
+
+
+class JobHistory(object):
+    """Class for the columnar store of the job records, and their statistics."""
+
+    GROUPS = ('client', 'agent', 'storage_policy')
+
+    METRICS = ('duration', 'size', 'throughput')
+
+    def __init__(self, records):
+        """Initialize object of the JobHistory class, with the columns of the job records.
+
+            Args:
+                records (iterable)  --  instances of the JobRecord class,
+                                            e.g.; from commcell.jobs.finished_jobs()
+
+            Returns:
+                object - instance of the JobHistory class
+        """
+        self._names = dict((column, []) for column in self.GROUPS + ('status', 'delay_cause'))
+        self._codes = dict((column, {}) for column in self._names)
+
+        self._columns = dict((column, array('i')) for column in self._names)
+        self._duration = array('d')
+        self._size = array('d')
+        self._failed = array('b')
+
+        nan = float('nan')
+
+        for record in records:
+            self._columns['client'].append(self._encode('client', record.client_name))
+            self._columns['agent'].append(self._encode('agent', record.agent_name))
+            self._columns['storage_policy'].append(
+                self._encode('storage_policy', record.storage_policy)
+            )
+            self._columns['status'].append(self._encode('status', record.status))
+            self._columns['delay_cause'].append(
+                self._encode('delay_cause', record.delay_reason or record.pending_reason)
+            )
+
+            duration = record.duration
+
+            if duration is None and record.start_time and record.end_time:
+                duration = record.end_time - record.start_time
+
+            self._duration.append(nan if duration is None else float(duration))
+            self._size.append(nan if record.size is None else float(record.size))
+            status = str(record.status).lower()
+            self._failed.append(int('fail' in status or 'kill' in status))
+
+    def __repr__(self):
+        """Representation string for the instance of the JobHistory class."""
+        return "JobHistory class instance of '{0}' jobs".format(len(self))
+
+    def __len__(self):
+        """Returns the number of jobs in the history."""
+        return len(self._failed)
+
+    @staticmethod
+    def _column(numpy, values, dtype):
+        """Returns the NumPy view of the array of the column, sharing its memory.
+
+            Args:
+                numpy   (module)    --  the numpy module
+
+                values  (array)     --  array of the column
+
+                dtype   (object)    --  NumPy data type of the elements of the array
+
+            Returns:
+                object - NumPy array of the values
+        """
+        if not len(values):
+            return numpy.zeros(0, dtype)
+
+        return numpy.frombuffer(values, dtype)
+
+    @classmethod
+    def from_summaries(cls, job_summaries):
+        """Returns the history for the job summaries received from the server, e.g.; the
+            jobSummary of each of the jobs in the response of the jobs query, or fixtures.
+
+            Args:
+                job_summaries   (iterable)  --  job summary dicts
+
+            Returns:
+                object - instance of the JobHistory class
+        """
+        return cls(JobRecord.from_summary(job_summary) for job_summary in job_summaries)
+
+    def _encode(self, column, name):
+        """Returns the integer code for the name, adding it to the names of the column if new.
+
+            Args:
+                column  (str)   --  name of the column
+
+                name    (str)   --  value to encode, or None
+
+            Returns:
+                int - code of the name, -1 for None
+        """
+        if not name:
+            return -1
+
+        codes = self._codes[column]
+
+        if name not in codes:
+            codes[name] = len(self._names[column])
+            self._names[column].append(name)
+
+        return codes[name]
+
+    def _groups(self, group_by):
+        """Returns the positions of the jobs for each group, with a single pass over the
+            codes of the group column.
+
+            Args:
+                group_by    (str)   --  column to group the jobs by: client / agent /
+                                            storage_policy, or None for all the jobs
+
+            Returns:
+                dict - array of the positions of the jobs, with the group name as key;
+                           NumPy array, if NumPy is installed
+
+            Raises:
+                SDKException:
+                    if group by is not valid
+        """
+        if group_by is not None and group_by not in self.GROUPS:
+            raise SDKException('Analytics', '101')
+
+        numpy = _import_numpy()
+
+        if group_by is None:
+            if numpy is not None:
+                return {None: numpy.arange(len(self))}
+
+            return {None: array('i', range(len(self)))}
+
+        names = self._names[group_by]
+
+        if numpy is not None:
+            # sort the positions by their group codes, and split them where the code changes
+            codes = self._column(numpy, self._columns[group_by], numpy.intc)
+
+            if not len(codes):
+                return {}
+
+            order = numpy.argsort(codes, kind='mergesort')
+            sorted_codes = codes[order]
+            boundaries = numpy.flatnonzero(numpy.diff(sorted_codes)) + 1
+            starts = numpy.concatenate(([0], boundaries))
+
+            return dict(
+                (names[code] if code >= 0 else None, group_positions)
+                for code, group_positions in zip(
+                    sorted_codes[starts].tolist(), numpy.split(order, boundaries)
+                )
+            )
+
+        positions = {}
+
+        for position, code in enumerate(self._columns[group_by]):
+            if code not in positions:
+                positions[code] = array('i')
+
+            positions[code].append(position)
+
+        return dict(
+            (names[code] if code >= 0 else None, group_positions)
+            for code, group_positions in positions.items()
+        )
+
+    @staticmethod
+    def _statistics(values):
+        """Returns the statistics of the values given, ignoring the missing (NaN) values.
+
+            Args:
+                values  (iterable)  --  numbers to compute the statistics of, or NumPy array
+
+            Returns:
+                dict - count, min, mean, median, p90, and max of the values,
+                           with None for all but count, if there are no values
+        """
+        numpy = _import_numpy()
+
+        if numpy is not None and isinstance(values, numpy.ndarray):
+            values = numpy.sort(values[~numpy.isnan(values)])
+            mean = float(values.mean()) if len(values) else None
+            values = values.tolist()
+        else:
+            values = sorted(value for value in values if not math.isnan(value))
+            mean = sum(values) / len(values) if values else None
+
+        count = len(values)
+
+        if not count:
+            return {
+                'count': 0, 'min': None, 'mean': None, 'median': None, 'p90': None, 'max': None
+            }
+
+        def percentile(fraction):
+            """Returns the nearest rank percentile of the sorted values."""
+            return values[min(count - 1, max(0, int(math.ceil(fraction * count)) - 1))]
+
+        return {
+            'count': count,
+            'min': values[0],
+            'mean': mean,
+            'median': percentile(0.5),
+            'p90': percentile(0.9),
+            'max': values[-1]
+        }
+
+    def distribution(self, group_by='client', metric='duration'):
+        """Returns the distribution of the metric of the jobs, for each group.
+
+            Args:
+                group_by    (str)   --  column to group the jobs by
+
+                    Valid values are:
+
+                        client
+
+                        agent
+
+                        storage_policy
+
+                        None; all the jobs as a single group
+
+                    default: client
+
+                metric      (str)   --  metric to compute the distribution of
+
+                    Valid values are:
+
+                        duration    -   elapsed time of the job, in seconds
+
+                        size        -   size of the application data backed up, in bytes
+
+                        throughput  -   size per second of elapsed time
+
+                    default: duration
+
+            Returns:
+                dict - statistics of the metric, with the group name as key
+                    {
+                        "group_name": {
+                            "count": 10,
+                            "min": 1.0,
+                            "mean": 5.5,
+                            "median": 5.0,
+                            "p90": 9.0,
+                            "max": 10.0
+                        }
+                    }
+
+            Raises:
+                SDKException:
+                    if group by, or metric is not valid
+        """
+        if metric not in self.METRICS:
+            raise SDKException('Analytics', '102')
+
+        groups = self._groups(group_by)
+        numpy = _import_numpy()
+        result = {}
+
+        if numpy is not None:
+            duration = self._column(numpy, self._duration, numpy.float64)
+            size = self._column(numpy, self._size, numpy.float64)
+
+            for group, positions in groups.items():
+                if metric == 'duration':
+                    values = duration[positions]
+                elif metric == 'size':
+                    values = size[positions]
+                else:
+                    group_duration = duration[positions]
+                    valid = group_duration > 0
+                    values = size[positions][valid] / group_duration[valid]
+
+                result[group] = self._statistics(values)
+
+            return result
+
+        for group, positions in groups.items():
+            if metric == 'duration':
+                values = (self._duration[position] for position in positions)
+            elif metric == 'size':
+                values = (self._size[position] for position in positions)
+            else:
+                values = (
+                    self._size[position] / self._duration[position]
+                    for position in positions if self._duration[position] > 0
+                )
+
+            result[group] = self._statistics(values)
+
+        return result
+
+    def failure_rate(self, group_by='client'):
+        """Returns the fraction of the jobs with a failed, or killed status, for each group.
+
+            Args:
+                group_by    (str)   --  column to group the jobs by: client / agent /
+                                            storage_policy, or None for all the jobs
+                    default: client
+
+            Returns:
+                dict - fraction of the jobs failed or killed, between 0 and 1,
+                           with the group name as key
+
+            Raises:
+                SDKException:
+                    if group by is not valid
+        """
+        groups = self._groups(group_by)
+        numpy = _import_numpy()
+
+        if numpy is not None:
+            failed = self._column(numpy, self._failed, numpy.int8)
+
+            return dict(
+                (group, float(failed[positions].mean())) for group, positions in groups.items()
+            )
+
+        return dict(
+            (group, sum(self._failed[position] for position in positions) / len(positions))
+            for group, positions in groups.items()
+        )
+
+    def delay_causes(self, group_by=None, top=5):
+        """Returns the most frequent delay reasons of the jobs, for each group, using the
+            pending reason of the jobs without a delay reason.
+
+            Args:
+                group_by    (str)   --  column to group the jobs by: client / agent /
+                                            storage_policy, or None for all the jobs
+                    default: None
+
+                top         (int)   --  number of the most frequent causes to return
+                    default: 5
+
+            Returns:
+                dict - list of (cause, number of jobs) tuples, most frequent first,
+                           with the group name as key
+
+            Raises:
+                SDKException:
+                    if group by is not valid
+        """
+        causes = self._columns['delay_cause']
+        names = self._names['delay_cause']
+        groups = self._groups(group_by)
+        numpy = _import_numpy()
+        result = {}
+
+        if numpy is not None:
+            causes = self._column(numpy, causes, numpy.intc)
+
+        for group, positions in groups.items():
+            counts = {}
+
+            if numpy is not None:
+                group_causes = causes[positions]
+                group_counts = numpy.bincount(
+                    group_causes[group_causes >= 0], minlength=len(names)
+                )
+
+                for code in numpy.flatnonzero(group_counts).tolist():
+                    counts[code] = int(group_counts[code])
+            else:
+                for position in positions:
+                    code = causes[position]
+
+                    if code >= 0:
+                        counts[code] = counts.get(code, 0) + 1
+
+            result[group] = [
+                (names[code], number) for code, number in sorted(
+                    counts.items(), key=lambda item: (-item[1], names[item[0]])
+                )[:top]
+            ]
+
+        return result
+
+    def summary(self, group_by='client'):
+        """Returns all the statistics of the jobs, for each group.
+
+            Args:
+                group_by    (str)   --  column to group the jobs by: client / agent /
+                                            storage_policy, or None for all the jobs
+                    default: client
+
+            Returns:
+                dict - number of jobs, failure rate, the distribution of each metric, and
+                           the delay causes, with the group name as key
+
+            Raises:
+                SDKException:
+                    if group by is not valid
+        """
+        failure_rates = self.failure_rate(group_by)
+        delay_causes = self.delay_causes(group_by)
+        distributions = dict(
+            (metric, self.distribution(group_by, metric)) for metric in self.METRICS
+        )
+
+        result = {}
+
+        for group, positions in self._groups(group_by).items():
+            result[group] = {
+                'jobs': len(positions),
+                'failure_rate': failure_rates[group],
+                'delay_causes': delay_causes[group]
+            }
+
+            for metric in self.METRICS:
+                result[group][metric] = distributions[metric][group]
+
+        return result
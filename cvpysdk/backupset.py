@@ -51,10 +51,6 @@ Backupset:
 
     _get_backupset_properties()     -- get the properties of this backupset
 
-    _run_backup(subclient_name,
-                return_list)        -- runs full backup for the specified subclient,
-                                        and appends the job object to the return list
-
     _update()                       -- updates the properties of the backupset
 
     set_default_backupset()         -- sets the backupset as the default backup set for the agent,
@@ -67,8 +63,6 @@ Backupset:
 
 from __future__ import absolute_import
 
-import threading
-
 from .subclient import Subclients
 from .schedules import Schedules
 from .exception import SDKException
@@ -524,23 +518,6 @@ class Backupset(object):
             response_string = self._commcell_object._update_response_(response.text)
             raise SDKException('Response', '101', response_string)
 
-    def _run_backup(self, subclient_name, return_list):
-        """Triggers full backup job for the given subclient, and appends its Job object to the list.
-            The SDKExcpetion class instance is appended to the list,
-            if any exception is raised while running the backup job for the Subclient.
-
-            Args:
-                subclient_name (str)   --  name of the subclient to trigger the backup for
-
-                return_list    (list)  --  list to append the job object to
-        """
-        try:
-            job = self.subclients.get(subclient_name).backup()
-            if job:
-                return_list.append(job)
-        except SDKException as excp:
-            return_list.append(excp)
-
     def _update(self, backupset_name, backupset_description, default_backupset):
         """Updates the properties of the backupset.
 
@@ -713,28 +690,24 @@ class Backupset(object):
                 o_str = 'Failed to set this as the Default Backup Set\nError: "{0}"'
                 raise SDKException('Backupset', '102', o_str.format(output[2]))
 
-    def backup(self):
-        """Runs Incremental backup job for all subclients in this backupset.
+    def backup(self, max_workers=8, stagger=0):
+        """Runs the default level of backup of the agent, e.g.; Incremental, for all subclients
+            in this backupset.
             Runs Full Backup job for a subclient, if no job had been ran earlier for it.
 
-            Returns:
-                list  -  list consisting of the job objects for the backup jobs started for
-                             the subclients in the backupset
-        """
-        return_list = []
-        thread_list = []
-
-        all_subclients = self.subclients._subclients
+            Args:
+                max_workers (int)   --  maximum number of backup requests to run concurrently
+                    default: 8
 
-        if all_subclients:
-            for subclient in all_subclients:
-                thread = threading.Thread(
-                    target=self._run_backup, args=(subclient, return_list)
-                )
-                thread_list.append(thread)
-                thread.start()
+                stagger     (float) --  minimum number of seconds between the start of
+                                            two consecutive backup requests
+                    default: 0
 
-        for thread in thread_list:
-            thread.join()
+            Returns:
+                list  -  list consisting of the job objects for the backup jobs started for
+                             the subclients in the backupset, sorted by the subclient name
 
-        return return_list
+                             the SDKException instance is returned in place of the job,
+                             for the subclients the backup failed to start for
+        """
+        return self.subclients.backup(max_workers=max_workers, stagger=stagger)
@@ -0,0 +1,879 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""File for the compact entries of the backup content of a subclient, got by browse / find.
+
+BrowseEntry, BrowseWalker, BrowseCache, and BrowseResult are the 4 classes defined in this file.
+
+BrowseEntry:    Record for a single file or folder in the backup content, yielded by the
+                    iter_browse and iter_find methods of the Subclient class
+
+BrowseWalker:   Class for walking the backup content recursively, browsing the folders
+                    concurrently, with a bounded number of threads
+
+BrowseCache:    Class for the opt-in cache of the browse / find results of the subclients,
+                    bounded by the total size of the responses, and with a TTL
+
+BrowseResult:   Class for the columnar result of a browse / find, with the raw sizes and times
+                    in compact arrays, and formatted only when asked for
+
+Usage:
+    >>> commcell.browse_cache = BrowseCache(max_bytes=128 * 1024 * 1024, ttl=600)
+    >>> subclient.browse('C:\\Users')    # sent to the server
+    >>> subclient.browse('C:\\Users\\')  # returned from the cache
+
+    >>> result = subclient.browse('C:\\Users', columnar=True)
+    >>> result.where(is_file=True, min_size=1024 ** 3).sort('size', reverse=True)
+
+
+BrowseEntry:
+    from_result()               --  returns the entry for a result of the DoBrowse response
+
+
+BrowseWalker:
+    __init__(subclient_object,
+             path,
+             max_depth,
+             workers,
+             filters)           --  initialise object of the BrowseWalker class
+
+    __repr__()                  --  returns the string for the instance of the BrowseWalker class
+
+    __iter__()                  --  yields the files and folders, as they are browsed
+
+    _matches()                  --  checks if the entry matches the filters of the walk
+
+    _put()                      --  adds the item to the results, waiting while they are full
+
+    _worker()                   --  browses the folders in the queue, until the walk is done
+
+
+BrowseCache:
+    __init__(max_bytes, ttl)    --  initialise object of the BrowseCache class
+
+    __repr__()                  --  returns the string for the instance of the BrowseCache class
+
+    __len__()                   --  returns the number of results in the cache
+
+    size                        --  returns the total size of the results in the cache
+
+    key()                       --  returns the key of the result, with the path normalized
+
+    _remove()                   --  removes the result of the key from the cache
+
+    get()                       --  returns the result for the key, if present and not expired
+
+    put()                       --  stores the result for the key, evicting the least recently
+                                        used results beyond the maximum size
+
+    invalidate()                --  removes the results of the subclient, or all the results
+
+
+BrowseResult:
+    __init__(paths,
+             names,
+             is_file,
+             sizes,
+             modification_times,
+             metadata)          --  initialise object of the BrowseResult class
+
+    __repr__()                  --  returns the string for the instance of the BrowseResult class
+
+    __len__()                   --  returns the number of files / folders in the result
+
+    __getitem__()               --  returns the entry at the index, as a BrowseEntry
+
+    __iter__()                  --  yields the entries, as BrowseEntry instances
+
+    from_result_set()           --  returns the columnar result for the DoBrowse results
+
+    extend()                    --  appends the DoBrowse results to the columns
+
+    copy()                      --  returns a copy of the result, with copies of the columns
+
+    paths                       --  returns the full paths of the files / folders
+
+    names                       --  returns the names of the files / folders
+
+    is_file                     --  returns the file flags of the files / folders
+
+    sizes                       --  returns the sizes of the files / folders, in bytes
+
+    modification_times          --  returns the modification times, in epoch seconds
+
+    metadata                    --  returns the virtual server metadata of the entries
+
+    _select()                   --  returns a new result, with the entries at the positions
+
+    where()                     --  returns a new result, with the entries matching the filters
+
+    sort()                      --  returns a new result, sorted by the column given
+
+    format_size()               --  returns the size of the entry in human readable format
+
+    format_time()               --  returns the modification time in human readable format
+
+    to_dict()                   --  returns the paths along with their formatted details
+
+"""
+
+from __future__ import absolute_import
+
+import time
+
+from array import array
+from collections import OrderedDict
+from fnmatch import fnmatch
+from threading import Thread, Lock, Event
+
+try:
+    # Python 2 import
+    from Queue import Queue, Empty, Full
+except ImportError:
+    # Python 3 import
+    from queue import Queue, Empty, Full
+
+from .inventory import InventoryRecord
+from .exception import SDKException
+
+# marks the end of the walk, in the results queue
+_DONE = object()
+
+
+class BrowseEntry(InventoryRecord):
+    """Record for a single file or folder in the backup content of a subclient.
+
+        The size is in bytes, and the modification time is in epoch seconds,
+        or None if not returned by the server.
+    """
+
+    __slots__ = ('path', 'name', 'is_file', 'size', 'modification_time')
+
+    @classmethod
+    def from_result(cls, result):
+        """Returns the entry for a single result of the dataResultSet of the DoBrowse response.
+
+            Args:
+                result  (dict)  --  result of the browse / find response
+
+            Returns:
+                object - instance of the BrowseEntry class
+        """
+        return cls(
+            str(result['path']),
+            str(result['displayName']),
+            result.get('flags', {}).get('file') is True,
+            int(result['size']) if 'size' in result else None,
+            int(result['modificationTime']) if 'modificationTime' in result else None
+        )
+
+
+class BrowseWalker(object):
+    """Class for walking the backup content of a subclient recursively, browsing the folders
+        concurrently with a bounded number of threads.
+    """
+
+    FILTERS = ('name', 'min_size', 'max_size', 'modified_after', 'modified_before')
+
+    def __init__(
+            self,
+            subclient_object,
+            path='\\',
+            max_depth=None,
+            workers=8,
+            filters=None,
+            show_deleted_files=True,
+            page_size=1000):
+        """Initialize object of the BrowseWalker class.
+
+            Args:
+                subclient_object    (object)    --  instance of the Subclient class to walk
+
+                path                (str)       --  folder path to start the walk at
+                    default: '\\'
+
+                max_depth           (int)       --  number of levels of folders to browse,
+                                                        starting with the folder at the path
+                    default: None; browse all the levels
+
+                workers             (int)       --  maximum number of folders to browse
+                                                        concurrently
+                    default: 8
+
+                filters             (dict)      --  conditions the files should match,
+                                                        to be yielded
+
+                        name            -   name pattern, e.g.; '*.log'
+
+                        min_size        -   minimum size of the file, in bytes
+
+                        max_size        -   maximum size of the file, in bytes
+
+                        modified_after  -   epoch time the file should be modified after
+
+                        modified_before -   epoch time the file should be modified before
+
+                    default: None; yield all the files
+
+                show_deleted_files  (bool)      --  include deleted files in the content or not
+                    default: True
+
+                page_size           (int)       --  number of files / folders to get in a
+                                                        single page of a folder
+                    default: 1000
+
+            Returns:
+                object - instance of the BrowseWalker class
+
+            Raises:
+                SDKException:
+                    if type of the max depth, or workers argument is not int
+
+                    if any of the filters is not valid
+        """
+        if max_depth is not None and not isinstance(max_depth, int):
+            raise SDKException('Subclient', '101')
+
+        if not isinstance(workers, int) or workers <= 0:
+            raise SDKException('Subclient', '101')
+
+        filters = dict(filters or {})
+
+        for key in filters:
+            if key not in self.FILTERS:
+                raise SDKException('Subclient', '113', 'Filter: {0}'.format(key))
+
+        self._subclient_object = subclient_object
+        self._path = path
+        self._max_depth = max_depth
+        self._workers = workers
+        self._filters = filters
+        self._show_deleted_files = show_deleted_files
+        self._page_size = page_size
+
+    def __repr__(self):
+        """Representation string for the instance of the BrowseWalker class."""
+        return "BrowseWalker class instance for path: '{0}'".format(self._path)
+
+    def _matches(self, entry):
+        """Checks if the entry matches the filters of the walk.
+            The folders always match, as the filters are only applied on the files.
+
+            Args:
+                entry   (object)    --  instance of the BrowseEntry class
+
+            Returns:
+                bool - boolean output whether the entry matches the filters or not
+        """
+        if not entry.is_file:
+            return True
+
+        filters = self._filters
+
+        if 'name' in filters and not fnmatch(entry.name.lower(), filters['name'].lower()):
+            return False
+
+        if entry.size is not None:
+            if 'min_size' in filters and entry.size < filters['min_size']:
+                return False
+
+            if 'max_size' in filters and entry.size > filters['max_size']:
+                return False
+
+        if entry.modification_time is not None:
+            if ('modified_after' in filters and
+                    entry.modification_time <= filters['modified_after']):
+                return False
+
+            if ('modified_before' in filters and
+                    entry.modification_time >= filters['modified_before']):
+                return False
+
+        return True
+
+    def _put(self, results, item, stop_event):
+        """Adds the item to the results queue, waiting while the queue is full,
+            until the walk is stopped.
+        """
+        while not stop_event.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return
+            except Full:
+                continue
+
+    def _worker(self, folders, results, state, stop_event):
+        """Browses the folders in the queue, adding the sub-folders to expand to the queue,
+            and the entries matching the filters to the results, until the walk is done.
+
+            Args:
+                folders     (Queue)     --  queue of (path, depth) tuples of the folders
+
+                results     (Queue)     --  queue of the (folder path, entry) tuples to yield,
+                                                or the exception raised
+
+                state       (dict)      --  number of folders pending, and the lock on it
+
+                stop_event  (Event)     --  event set, when the walk is done or stopped
+        """
+        while not stop_event.is_set():
+            try:
+                path, depth = folders.get(timeout=0.1)
+            except Empty:
+                continue
+
+            try:
+                entries = self._subclient_object.iter_browse(
+                    path, show_deleted_files=self._show_deleted_files, page_size=self._page_size
+                )
+
+                for entry in entries:
+                    if stop_event.is_set():
+                        return
+
+                    if not entry.is_file and (
+                            self._max_depth is None or depth < self._max_depth):
+                        with state['lock']:
+                            state['pending'] += 1
+
+                        folders.put((entry.path, depth + 1))
+
+                    if self._matches(entry):
+                        self._put(results, (path, entry), stop_event)
+            except Exception as excp:
+                self._put(results, excp, stop_event)
+
+            with state['lock']:
+                state['pending'] -= 1
+                done = state['pending'] == 0
+
+            if done:
+                self._put(results, _DONE, stop_event)
+
+    def __iter__(self):
+        """Yields the files and folders of the backup content, as they are browsed.
+
+            Yields:
+                tuple - (path of the parent folder, instance of the BrowseEntry class)
+
+            Raises:
+                SDKException:
+                    if failed to browse any of the folders
+        """
+        folders = Queue()
+        results = Queue(self._workers * self._page_size)
+        state = {'pending': 1, 'lock': Lock()}
+        stop_event = Event()
+
+        folders.put((self._path, 1))
+
+        for _ in range(self._workers):
+            thread = Thread(target=self._worker, args=(folders, results, state, stop_event))
+            thread.daemon = True
+            thread.start()
+
+        try:
+            while True:
+                item = results.get()
+
+                if item is _DONE:
+                    return
+
+                if isinstance(item, Exception):
+                    raise item
+
+                yield item
+        finally:
+            stop_event.set()
+
+
+class BrowseCache(object):
+    """Class for the cache of the browse / find results of the subclients, evicting the least
+        recently used results beyond the maximum size, and the results older than the TTL.
+    """
+
+    def __init__(self, max_bytes=64 * 1024 * 1024, ttl=300):
+        """Initialize object of the BrowseCache class.
+
+            Args:
+                max_bytes   (int)   --  maximum total size of the responses of the results
+                                            to keep, in bytes
+                    default: 64 MB
+
+                ttl         (int)   --  number of seconds to keep a result for
+                    default: 300
+
+            Returns:
+                object - instance of the BrowseCache class
+
+            Raises:
+                SDKException:
+                    if type of the max bytes, or ttl argument is not a number
+
+                    if max bytes, or ttl is not a positive value
+        """
+        if not (isinstance(max_bytes, int) and isinstance(ttl, (int, float))):
+            raise SDKException('Subclient', '101')
+
+        if max_bytes <= 0 or ttl <= 0:
+            raise SDKException('Subclient', '114')
+
+        self._max_bytes = max_bytes
+        self._ttl = ttl
+        self._lock = Lock()
+
+        # key -> (expiry time, size, result), in the order of the least recently used first
+        self._results = OrderedDict()
+        self._size = 0
+
+        self.hits = 0
+        self.misses = 0
+
+    def __repr__(self):
+        """Representation string for the instance of the BrowseCache class."""
+        return "BrowseCache class instance of '{0}' results, using '{1}' bytes".format(
+            len(self._results), self._size
+        )
+
+    def __len__(self):
+        """Returns the number of results in the cache."""
+        return len(self._results)
+
+    @property
+    def size(self):
+        """Treats the total size of the results in the cache, in bytes, as read-only attribute."""
+        return self._size
+
+    @staticmethod
+    def key(subclient_id, option, path, *options):
+        """Returns the key of the result, with the path normalized.
+
+            Args:
+                subclient_id    (str)   --  id of the subclient
+
+                option          (str)   --  Browse / Find
+
+                path            (str)   --  path browsed, or the name searched
+
+                *options                --  other options of the request, e.g.; show deleted
+                                                files, and the time range
+
+            Returns:
+                tuple - key of the result
+        """
+        path = str(path).replace('/', '\\')
+
+        if len(path) > 1:
+            path = path.rstrip('\\')
+
+        return (str(subclient_id), option, path) + options
+
+    def _remove(self, key):
+        """Removes the result of the key from the cache."""
+        self._size -= self._results.pop(key)[1]
+
+    def get(self, key):
+        """Returns the result for the key, if present in the cache, and not expired.
+
+            Args:
+                key     (tuple)     --  key of the result
+
+            Returns:
+                object - result stored for the key
+
+                None   - if no result is present, or if it has expired
+        """
+        with self._lock:
+            if key in self._results:
+                if self._results[key][0] > time.time():
+                    # move to the end, as the most recently used result
+                    self._results[key] = self._results.pop(key)
+                    self.hits += 1
+
+                    return self._results[key][2]
+
+                self._remove(key)
+
+            self.misses += 1
+
+    def put(self, key, result, size):
+        """Stores the result for the key, evicting the least recently used results, until the
+            total size is within the maximum size.
+
+            A result larger than the maximum size is not stored.
+
+            Args:
+                key     (tuple)     --  key of the result
+
+                result  (object)    --  result to store
+
+                size    (int)       --  size of the response of the result, in bytes
+        """
+        with self._lock:
+            if key in self._results:
+                self._remove(key)
+
+            if size > self._max_bytes:
+                return
+
+            while self._size + size > self._max_bytes:
+                self._remove(next(iter(self._results)))
+
+            self._results[key] = (time.time() + self._ttl, size, result)
+            self._size += size
+
+    def invalidate(self, subclient_id=None):
+        """Removes all the results of the subclient, or all the results, from the cache.
+
+            Args:
+                subclient_id    (str)   --  id of the subclient to remove the results of
+                    default: None; remove all the results
+        """
+        with self._lock:
+            for key in list(self._results):
+                if subclient_id is None or key[0] == str(subclient_id):
+                    self._remove(key)
+
+
+class BrowseResult(object):
+    """Class for the columnar result of a browse / find of the backup content of a subclient.
+
+        The sizes are in bytes, and the modification times are in epoch seconds,
+        with -1 for the values not returned by the server.
+    """
+
+    FILTERS = ('is_file', 'name', 'min_size', 'max_size', 'modified_after', 'modified_before')
+
+    SORT_KEYS = ('path', 'name', 'size', 'modification_time')
+
+    def __init__(
+            self,
+            paths=None,
+            names=None,
+            is_file=None,
+            sizes=None,
+            modification_times=None,
+            metadata=None):
+        """Initialize object of the BrowseResult class, with the columns given.
+
+            Args:
+                paths               (list)  --  full paths of the files / folders
+                    default: None
+
+                names               (list)  --  names of the files / folders
+                    default: None
+
+                is_file             (array) --  1 for the files, and 0 for the folders
+                    default: None
+
+                sizes               (array) --  sizes of the files / folders, in bytes
+                    default: None
+
+                modification_times  (array) --  modification times, in epoch seconds
+                    default: None
+
+                metadata            (list)  --  virtual server metadata of the entries,
+                                                    only for the virtual server browse
+                    default: None
+
+            Returns:
+                object - instance of the BrowseResult class
+        """
+        self._paths = paths if paths is not None else []
+        self._names = names if names is not None else []
+        self._is_file = is_file if is_file is not None else array('b')
+        self._sizes = sizes if sizes is not None else array('q')
+        self._modification_times = (
+            modification_times if modification_times is not None else array('q')
+        )
+        self._metadata = metadata
+
+    def __repr__(self):
+        """Representation string for the instance of the BrowseResult class."""
+        return "BrowseResult class instance of '{0}' files / folders".format(len(self))
+
+    def __len__(self):
+        """Returns the number of files / folders in the result."""
+        return len(self._paths)
+
+    def __getitem__(self, index):
+        """Returns the file / folder at the index, as an instance of the BrowseEntry class."""
+        size = self._sizes[index]
+        modification_time = self._modification_times[index]
+
+        return BrowseEntry(
+            self._paths[index],
+            self._names[index],
+            bool(self._is_file[index]),
+            size if size >= 0 else None,
+            modification_time if modification_time >= 0 else None
+        )
+
+    def __iter__(self):
+        """Yields the files / folders of the result, as instances of the BrowseEntry class."""
+        for index in range(len(self)):
+            yield self[index]
+
+    @classmethod
+    def from_result_set(cls, result_set, is_vs_browse=False):
+        """Returns the columnar result for the dataResultSet of the DoBrowse response,
+            without formatting any of the values.
+
+            Args:
+                result_set      (list)  --  results of the browse / find response
+
+                is_vs_browse    (bool)  --  boolean, specifying a Virtual Server subclient browse
+                    default: False
+
+            Returns:
+                object - instance of the BrowseResult class
+        """
+        browse_result = cls(metadata=[] if is_vs_browse else None)
+        browse_result.extend(result_set)
+
+        return browse_result
+
+    def extend(self, result_set):
+        """Appends the results of the dataResultSet of the DoBrowse response to the columns.
+
+            Args:
+                result_set  (list)  --  results of the browse / find response
+        """
+        for result in result_set:
+            self._paths.append(str(result['path']))
+            self._names.append(str(result['displayName']))
+            self._is_file.append(result.get('flags', {}).get('file') is True)
+            self._sizes.append(int(result.get('size', -1)))
+            self._modification_times.append(int(result.get('modificationTime', -1)))
+
+            if self._metadata is not None:
+                self._metadata.append(
+                    result.get('advancedData', {}).get(
+                        'browseMetaData', {}
+                    ).get('virtualServerMetaData')
+                )
+
+    def copy(self):
+        """Returns a copy of the result, with copies of all the columns, so the copy can be
+            extended, or its columns modified, without changing this result.
+
+            Returns:
+                object - instance of the BrowseResult class
+        """
+        return BrowseResult(
+            self._paths[:],
+            self._names[:],
+            self._is_file[:],
+            self._sizes[:],
+            self._modification_times[:],
+            None if self._metadata is None else self._metadata[:]
+        )
+
+    @property
+    def paths(self):
+        """Treats the list of the full paths of the files / folders as a read-only attribute."""
+        return self._paths
+
+    @property
+    def names(self):
+        """Treats the list of the names of the files / folders as a read-only attribute."""
+        return self._names
+
+    @property
+    def is_file(self):
+        """Treats the array of the file flags of the entries as a read-only attribute."""
+        return self._is_file
+
+    @property
+    def sizes(self):
+        """Treats the array of the sizes of the entries in bytes as a read-only attribute."""
+        return self._sizes
+
+    @property
+    def modification_times(self):
+        """Treats the array of the modification times of the entries as a read-only attribute."""
+        return self._modification_times
+
+    @property
+    def metadata(self):
+        """Treats the list of the virtual server metadata as a read-only attribute."""
+        return self._metadata
+
+    def _select(self, positions):
+        """Returns a new result, with the entries at the positions given.
+
+            Args:
+                positions   (list)  --  positions of the entries to select
+
+            Returns:
+                object - instance of the BrowseResult class
+        """
+        return BrowseResult(
+            [self._paths[position] for position in positions],
+            [self._names[position] for position in positions],
+            array('b', [self._is_file[position] for position in positions]),
+            array('q', [self._sizes[position] for position in positions]),
+            array('q', [self._modification_times[position] for position in positions]),
+            None if self._metadata is None else [
+                self._metadata[position] for position in positions
+            ]
+        )
+
+    def where(self, **filters):
+        """Returns a new result, with the files / folders matching all the filters given.
+            The entries without the value for a filter, e.g.; size, are not filtered out by it.
+
+            Args:
+                **filters   --  conditions the entries should match
+
+                    is_file         (bool)  --  True for the files, False for the folders
+
+                    name            (str)   --  name pattern, e.g.; '*.log'
+
+                    min_size        (int)   --  minimum size, in bytes
+
+                    max_size        (int)   --  maximum size, in bytes
+
+                    modified_after  (int)   --  epoch time the entry should be modified after
+
+                    modified_before (int)   --  epoch time the entry should be modified before
+
+            Returns:
+                object - instance of the BrowseResult class for the matching entries
+
+            Raises:
+                SDKException:
+                    if any of the filters is not valid
+        """
+        for key in filters:
+            if key not in self.FILTERS:
+                raise SDKException('Subclient', '115', 'Filter: {0}'.format(key))
+
+        positions = range(len(self))
+        sizes = self._sizes
+        times = self._modification_times
+
+        if 'is_file' in filters:
+            value = int(bool(filters['is_file']))
+            positions = [index for index in positions if self._is_file[index] == value]
+
+        if 'name' in filters:
+            pattern = filters['name'].lower()
+            names = self._names
+            positions = [index for index in positions if fnmatch(names[index].lower(), pattern)]
+
+        if 'min_size' in filters:
+            value = filters['min_size']
+            positions = [index for index in positions if sizes[index] < 0 or sizes[index] >= value]
+
+        if 'max_size' in filters:
+            value = filters['max_size']
+            positions = [index for index in positions if sizes[index] <= value]
+
+        if 'modified_after' in filters:
+            value = filters['modified_after']
+            positions = [index for index in positions if times[index] < 0 or times[index] > value]
+
+        if 'modified_before' in filters:
+            value = filters['modified_before']
+            positions = [index for index in positions if times[index] < value]
+
+        return self._select(positions)
+
+    def sort(self, by='name', reverse=False):
+        """Returns a new result, with the entries sorted by the column given.
+
+            Args:
+                by          (str)   --  column to sort by: path / name / size / modification_time
+                    default: name
+
+                reverse     (bool)  --  sort in the descending order
+                    default: False
+
+            Returns:
+                object - instance of the BrowseResult class, with the entries sorted
+
+            Raises:
+                SDKException:
+                    if the column to sort by is not valid
+        """
+        if by not in self.SORT_KEYS:
+            raise SDKException('Subclient', '116')
+
+        column = {
+            'path': self._paths,
+            'name': self._names,
+            'size': self._sizes,
+            'modification_time': self._modification_times
+        }[by]
+
+        return self._select(
+            sorted(range(len(self)), key=column.__getitem__, reverse=reverse)
+        )
+
+    def format_size(self, index):
+        """Returns the size of the entry at the index, in human readable format.
+
+            Args:
+                index   (int)   --  position of the entry
+
+            Returns:
+                str - size in B / KB / MB / GB, etc., or None if the size is not known
+        """
+        from .subclient import Subclient
+
+        size = self._sizes[index]
+
+        return Subclient._convert_size(float(size)) if size >= 0 else None
+
+    def format_time(self, index):
+        """Returns the modification time of the entry at the index, in human readable format.
+
+            Args:
+                index   (int)   --  position of the entry
+
+            Returns:
+                str - modification time in the dd/mm/YYYY HH:MM:SS format,
+                          or None if the time is not known
+        """
+        modification_time = self._modification_times[index]
+
+        if modification_time < 0:
+            return None
+
+        return time.strftime('%d/%m/%Y %H:%M:%S', time.localtime(modification_time))
+
+    def to_dict(self):
+        """Returns the paths along with their formatted details, in the same format as the
+            dict returned by the browse and find methods of the Subclient class.
+
+            Returns:
+                dict - path along with the details like name, file/folder, size,
+                           modification time
+        """
+        paths_dict = {}
+
+        for index, path in enumerate(self._paths):
+            path_list = [self._names[index], 'File' if self._is_file[index] else 'Folder']
+
+            size = self.format_size(index)
+            modification_time = self.format_time(index)
+
+            if size:
+                path_list.append(size)
+
+            if modification_time:
+                path_list.append(modification_time)
+
+            if self._metadata is not None:
+                path_list.append(self._metadata[index])
+
+            paths_dict[path] = path_list
+
+        return paths_dict
@@ -0,0 +1,613 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""File for running the backups of many subclients of the commcell, in bulk.
+
+BulkBackup and BulkBackupResult are the 2 classes defined in this file.
+
+BulkBackup: Class for resolving the targets to subclients using the inventory of the commcell,
+                and running the backup for all of them, with a bounded number of requests
+
+BulkBackupResult: Class for the job ids and failures of a bulk backup, for each target
+
+The targets can be given as:
+
+    str     -   name of a client group, or a client
+
+    dict    -   inventory filters, e.g.; {'client': 'client1', 'backupset': 'defaultbackupset'}
+
+    object  -   instance of the Client, ClientGroup, Backupset, or Subclient class
+
+The subclients of the client, client group, backupset, and filter targets are resolved from the
+inventory given, or from a new snapshot of the commcell, taken for the run, so the subclients
+added or deleted since the last snapshot are seen. Only the subclients with backup enabled are
+included. A subclient matched by more than one target is backed up only once.
+
+The backup level is checked, and the backup request is built, as per the Subclient class of the
+agent of each subclient, e.g.; Transaction_Log is run only for the SQL Server subclients, and
+is reported as a failure for the other subclients, without sending their requests.
+
+If a WorkQueue is given, each subclient submitted is checkpointed to it along with its job id, and
+running the same bulk backup again with the queue resumes it, without submitting the subclients
+already done again. The jobs of these subclients are reported as resumed in the result. Clear
+the queue to run a new bulk backup with it.
+
+Usage:
+    >>> result = commcell.backup_many(['client1', 'servers'], level='Full', concurrency=16)
+    >>> result.failures
+    >>> result.wait()
+
+
+BulkBackup:
+    __init__(commcell_object)   --  initialise object of the BulkBackup class
+
+    __repr__()                  --  returns the string for the instance of the BulkBackup class
+
+    _target_label()             --  returns the label of the target, used in the result
+
+    _inventory_rows()           --  returns the inventory rows of the subclients to back up,
+                                        for the filters given
+
+    _resolve()                  --  returns the ids, paths, and agents of the subclients of
+                                        the target
+
+    _get_backup_requests()      --  returns the backup request for each subclient, as per
+                                        the Subclient class of its agent
+
+    _submit()                   --  runs the backup for the subclient ids, through the work
+                                        queue, if given
+
+    run()                       --  runs the backup for the subclients of all the targets
+
+
+BulkBackupResult:
+    __init__(commcell_object)   --  initialise object of the BulkBackupResult class
+
+    __repr__()                  --  returns the string for the instance of the
+                                        BulkBackupResult class
+
+    __len__()                   --  returns the number of backup jobs started
+
+    _add()                      --  adds the result of a subclient backup, for a target
+
+    targets                     --  returns the labels of the targets, in the order given
+
+    jobs                        --  returns the Job objects of all the backup jobs started
+
+    job_ids                     --  returns the job ids started, for each target
+
+    resumed                     --  returns the job ids started by an earlier run of the work
+                                        queue, for each target
+
+    failures                    --  returns the exceptions raised, for each target
+
+    wait()                      --  waits for all the backup jobs to finish
+
+"""
+
+from __future__ import absolute_import
+
+from .job import Job
+from .client import Client
+from .clientgroup import ClientGroup
+from .backupset import Backupset
+from .subclient import Subclients, Subclient
+from .inventory import Inventory
+from .pool import WorkerPool
+from .exception import SDKException
+
+
+class BulkBackup(object):
+    """Class for running the backups of the subclients of many targets, in bulk."""
+
+    def __init__(self, commcell_object):
+        """Initialize object of the BulkBackup class.
+
+            Args:
+                commcell_object (object)  --  instance of the Commcell class
+
+            Returns:
+                object - instance of the BulkBackup class
+        """
+        self._commcell_object = commcell_object
+
+    def __repr__(self):
+        """Representation string for the instance of the BulkBackup class."""
+        return "BulkBackup class instance for Commcell: '{0}'".format(
+            self._commcell_object._headers['Host']
+        )
+
+    @staticmethod
+    def _target_label(target):
+        """Returns the label of the target, to identify it in the result.
+
+            Args:
+                target  (str / dict / object)   --  target of the backup
+
+            Returns:
+                str - name of the target, or its filters joined, for a dict
+        """
+        if isinstance(target, dict):
+            return ', '.join(
+                '{0}={1}'.format(key, target[key]) for key in sorted(target)
+            )
+
+        if isinstance(target, Client):
+            return target.client_name
+
+        if isinstance(target, ClientGroup):
+            return target.clientgroup_name
+
+        if isinstance(target, Backupset):
+            return '/'.join([
+                target._agent_object._client_object.client_name,
+                target._agent_object.agent_name,
+                target._instance_object.instance_name,
+                target.backupset_name
+            ])
+
+        if isinstance(target, Subclient):
+            return '/'.join([
+                BulkBackup._target_label(target._backupset_object), target.subclient_name
+            ])
+
+        return target
+
+    @staticmethod
+    def _inventory_rows(inventory, **filters):
+        """Returns the inventory rows of the subclients with backup enabled, matching the filters.
+
+            Args:
+                inventory   (object)    --  instance of the Inventory class to query
+
+                **filters   --  filters of the subclients, as accepted by the where method
+                                    of the SubclientQuery class
+
+            Returns:
+                list - (subclient id, path, agent name) tuples of the matching subclients
+
+            Raises:
+                SDKException:
+                    if any of the filters is not valid
+        """
+        query = inventory.subclients.where(is_backup_enabled=True, **filters)
+
+        return [
+            (
+                str(subclient.subclient_id),
+                '/'.join([
+                    client.client_name,
+                    agent.agent_name,
+                    instance.instance_name,
+                    backupset.backupset_name,
+                    subclient.subclient_name
+                ]),
+                agent.agent_name
+            ) for client, agent, instance, backupset, subclient in query
+        ]
+
+    def _resolve(self, target, inventory):
+        """Returns the ids, paths, and agents of the subclients to back up, for the target.
+
+            Args:
+                target      (str / dict / object)   --  target of the backup
+
+                inventory   (object)                --  instance of the Inventory class,
+                                                            to resolve the target from
+
+            Returns:
+                list - (subclient id, path, agent name) tuples of the subclients of the target
+
+            Raises:
+                SDKException:
+                    if type of the target is not valid
+
+                    if no client / client group exists with the given name
+        """
+        if isinstance(target, Subclient):
+            return [(
+                str(target.subclient_id),
+                self._target_label(target),
+                target._backupset_object._agent_object.agent_name
+            )]
+
+        if isinstance(target, dict):
+            return self._inventory_rows(inventory, **target)
+
+        if isinstance(target, Client):
+            return self._inventory_rows(inventory, client=target.client_name)
+
+        if isinstance(target, ClientGroup):
+            return self._inventory_rows(inventory, client=target._associated_clients)
+
+        if isinstance(target, Backupset):
+            return self._inventory_rows(
+                inventory,
+                client=target._agent_object._client_object.client_name,
+                agent=target._agent_object.agent_name,
+                instance=target._instance_object.instance_name,
+                backupset=target.backupset_name
+            )
+
+        if not isinstance(target, str):
+            raise SDKException('BulkBackup', '101')
+
+        client_groups = self._commcell_object.client_groups
+
+        if client_groups.has_clientgroup(target):
+            return self._resolve(client_groups.get(target), inventory)
+
+        if inventory.has_client(target):
+            return self._inventory_rows(inventory, client=target)
+
+        raise SDKException(
+            'BulkBackup', '102', 'No client / client group exists with name: {0}'.format(target)
+        )
+
+    @staticmethod
+    def _get_backup_requests(agent_names, level, incremental_backup, incremental_level):
+        """Returns the backup request for each subclient, after checking the level of backup is
+            supported by the Subclient class of the agent of the subclient.
+
+            Args:
+                agent_names         (dict)  --  name of the agent, with the subclient id as key
+
+                level               (str)   --  level of backup to run, or None for the default
+                                                    level of each agent
+
+                incremental_backup  (bool)  --  run incremental backup, for Synthetic_full
+
+                incremental_level   (str)   --  run incremental backup before/after synthetic full
+
+            Returns:
+                dict - backup request, or the exception raised for the level, with the
+                           subclient id as key
+        """
+        subclient_classes = Subclients._get_subclient_classes()
+        backup_requests = {}
+        agent_requests = {}
+
+        for subclient_id, agent_name in agent_names.items():
+            agent_name = str(agent_name).lower()
+
+            if agent_name not in agent_requests:
+                subclient_class = subclient_classes.get(agent_name, Subclient)
+
+                try:
+                    agent_requests[agent_name] = subclient_class._get_backup_request(
+                        level or subclient_class._DEFAULT_BACKUP_LEVEL,
+                        incremental_backup,
+                        incremental_level
+                    )
+                except SDKException as excp:
+                    agent_requests[agent_name] = SDKException(
+                        excp.exception_module,
+                        excp.exception_id,
+                        'Level: {0} is not supported for the agent: {1}'.format(level, agent_name)
+                    )
+
+            backup_requests[subclient_id] = agent_requests[agent_name]
+
+        return backup_requests
+
+    def _submit(
+            self,
+            subclient_ids,
+            backup_requests,
+            concurrency,
+            stagger,
+            work_queue,
+            reuse_running_job):
+        """Runs the backup for the subclient ids given, through the work queue, if given.
+
+            Args:
+                subclient_ids       (list)      --  ids of the subclients to back up
+
+                backup_requests     (dict)      --  backup request specifying the backup level,
+                                                        with the subclient id as key
+
+                concurrency         (int)       --  maximum number of backup requests to run
+                                                        concurrently
+
+                stagger             (float)     --  minimum number of seconds between the start
+                                                        of two consecutive backup requests
+
+                work_queue          (object)    --  instance of the WorkQueue class, or None
+
+                reuse_running_job   (bool)      --  return the backup job already running for
+                                                        a subclient, instead of starting another
+
+            Returns:
+                tuple - (list of the Job object, or the exception raised, for each of the
+                             subclient ids, set of the subclient ids submitted by an earlier
+                             run of the work queue)
+        """
+        def backup(subclient_id, payload=None):
+            """Runs the backup for the subclient with the given id."""
+            return Subclients._backup_subclient(
+                self._commcell_object,
+                subclient_id,
+                backup_requests[subclient_id],
+                reuse_running_job
+            )
+
+        if work_queue is None:
+            return WorkerPool(concurrency, stagger).map(
+                backup, subclient_ids, return_exceptions=True
+            ), set()
+
+        work_queue.add(
+            (subclient_id, {'level': backup_requests[subclient_id]})
+            for subclient_id in subclient_ids
+        )
+
+        results = work_queue.run(backup, subclient_ids, concurrency, stagger)
+        job_ids = work_queue.job_ids()
+
+        jobs = []
+        resumed_ids = set()
+
+        for subclient_id in subclient_ids:
+            if subclient_id in results:
+                jobs.append(results[subclient_id])
+            elif job_ids.get(subclient_id) is not None:
+                # submitted by an earlier run of the queue
+                jobs.append(Job(self._commcell_object, job_ids[subclient_id], 'Backup'))
+                resumed_ids.add(subclient_id)
+            else:
+                # left in the started state by an earlier run, which was interrupted
+                jobs.append(SDKException('WorkQueue', '102'))
+
+        return jobs, resumed_ids
+
+    def run(
+            self,
+            targets,
+            level=None,
+            concurrency=8,
+            stagger=0,
+            work_queue=None,
+            reuse_running_job=False,
+            incremental_backup=False,
+            incremental_level='BEFORE_SYNTH',
+            inventory=None):
+        """Runs the backup for the subclients of all the targets, with at most concurrency
+            requests running at a time, started at least stagger seconds apart.
+
+            The jobs started are tracked by the job monitor of the commcell.
+
+            Args:
+                targets     (list)  --  targets to run the backup for
+
+                level       (str)   --  level of backup to run, checked against the levels
+                                            supported by the agent of each subclient
+                        Full / Incremental / Differential / Synthetic_full / Transaction_Log
+                    default: None; default level of each agent, e.g.; Incremental for
+                        File System, and Differential for SQL Server
+
+                concurrency (int)   --  maximum number of backup requests to run concurrently
+                    default: 8
+
+                stagger     (float) --  minimum number of seconds between the start of
+                                            two consecutive backup requests
+                    default: 0
+
+                work_queue  (object)    --  instance of the WorkQueue class, to checkpoint the
+                                                subclients submitted to, and resume from
+                    default: None
+
+                reuse_running_job   (bool)  --  return the backup job already running for a
+                                                    subclient, instead of starting another one
+                    default: False
+
+                incremental_backup  (bool)  --  run incremental backup
+                        only applicable in case of Synthetic_full backup
+                    default: False
+
+                incremental_level   (str)   --  run incremental backup before/after synthetic full
+                        BEFORE_SYNTH / AFTER_SYNTH
+                    default: BEFORE_SYNTH
+
+                inventory   (object)    --  instance of the Inventory class, to resolve the
+                                                targets from
+                    default: None; a new snapshot of the commcell is taken, if any of the
+                        targets is not a Subclient
+
+            Returns:
+                object - instance of the BulkBackupResult class
+
+            Raises:
+                SDKException:
+                    if type of the targets, level, or inventory argument is not valid
+
+                    if backup level specified is not correct
+        """
+        if not isinstance(targets, (list, tuple)):
+            raise SDKException('BulkBackup', '101')
+
+        if level is not None and not isinstance(level, str):
+            raise SDKException('BulkBackup', '101')
+
+        if inventory is not None and not isinstance(inventory, Inventory):
+            raise SDKException('BulkBackup', '101')
+
+        if level is not None and level.lower() not in Subclients._BACKUP_LEVELS:
+            raise SDKException('Subclient', '103')
+
+        if inventory is None and not all(isinstance(target, Subclient) for target in targets):
+            inventory = self._commcell_object.snapshot()
+
+        result = BulkBackupResult(self._commcell_object)
+        subclients = {}
+        agent_names = {}
+
+        for target in targets:
+            label = self._target_label(target)
+            result._add(label)
+
+            try:
+                for subclient_id, path, agent_name in self._resolve(target, inventory):
+                    subclients.setdefault(subclient_id, []).append((label, path))
+                    agent_names[subclient_id] = agent_name
+            except SDKException as excp:
+                result._add(label, label, excp)
+
+        backup_requests = self._get_backup_requests(
+            agent_names, level, incremental_backup, incremental_level
+        )
+
+        subclient_ids = []
+
+        for subclient_id in subclients:
+            if isinstance(backup_requests[subclient_id], SDKException):
+                # level not supported by the agent of the subclient, no request is sent
+                for label, path in subclients[subclient_id]:
+                    result._add(label, path, backup_requests[subclient_id])
+            else:
+                subclient_ids.append(subclient_id)
+
+        jobs, resumed_ids = self._submit(
+            subclient_ids, backup_requests, concurrency, stagger, work_queue, reuse_running_job
+        )
+
+        for subclient_id, job in zip(subclient_ids, jobs):
+            for label, path in subclients[subclient_id]:
+                result._add(label, path, job, subclient_id in resumed_ids)
+
+        return result
+
+
+class BulkBackupResult(object):
+    """Class for the job ids and failures of a bulk backup, for each target."""
+
+    def __init__(self, commcell_object):
+        """Initialize object of the BulkBackupResult class.
+
+            Args:
+                commcell_object (object)  --  instance of the Commcell class
+
+            Returns:
+                object - instance of the BulkBackupResult class
+        """
+        self._commcell_object = commcell_object
+        self._targets = []
+        self._jobs = {}
+        self._job_ids = {}
+        self._resumed = {}
+        self._failures = {}
+
+    def __repr__(self):
+        """Representation string for the instance of the BulkBackupResult class."""
+        return "BulkBackupResult class instance of '{0}' jobs, and '{1}' failures".format(
+            len(self), sum(len(failures) for failures in self._failures.values())
+        )
+
+    def __len__(self):
+        """Returns the number of backup jobs started."""
+        return len(self._jobs)
+
+    def _add(self, label, path=None, job=None, resumed=False):
+        """Adds the target, and the result of the backup of its subclient, if given.
+
+            Args:
+                label   (str)                   --  label of the target
+
+                path    (str)                   --  path of the subclient backed up
+                    default: None
+
+                job     (object / Exception)    --  instance of the Job class started for the
+                                                        subclient, or the exception raised
+                    default: None
+
+                resumed (bool)                  --  whether the job was started by an earlier
+                                                        run of the work queue
+                    default: False
+        """
+        if label not in self._job_ids:
+            self._targets.append(label)
+            self._job_ids[label] = {}
+            self._resumed[label] = {}
+            self._failures[label] = {}
+
+        if path is None:
+            return
+
+        if isinstance(job, Exception):
+            self._failures[label][path] = job
+        else:
+            self._jobs[job.job_id] = job
+            self._job_ids[label][path] = job.job_id
+
+            if resumed:
+                self._resumed[label][path] = job.job_id
+
+    @property
+    def targets(self):
+        """Returns the list of the labels of the targets, in the order given."""
+        return list(self._targets)
+
+    @property
+    def jobs(self):
+        """Returns the list of the Job objects of all the backup jobs started."""
+        return list(self._jobs.values())
+
+    @property
+    def job_ids(self):
+        """Returns the dict of the target labels, and the job id started for each subclient.
+
+            dict - consists of the job ids, for each target
+                {
+                    "target_label": {
+                        "client/agent/instance/backupset/subclient": job_id
+                    }
+                }
+        """
+        return dict((label, dict(job_ids)) for label, job_ids in self._job_ids.items())
+
+    @property
+    def resumed(self):
+        """Returns the dict of the target labels, and the job id started for each subclient by
+            an earlier run of the work queue, which was not submitted again by this run.
+
+            These jobs are also included in the job ids, and the jobs of the result.
+
+            dict - consists of the job ids, for each target
+                {
+                    "target_label": {
+                        "client/agent/instance/backupset/subclient": job_id
+                    }
+                }
+        """
+        return dict((label, dict(job_ids)) for label, job_ids in self._resumed.items())
+
+    @property
+    def failures(self):
+        """Returns the dict of the target labels, and the exception raised for each subclient,
+            or for the target itself, if it could not be resolved.
+
+            dict - consists of the exceptions, for each target
+                {
+                    "target_label": {
+                        "client/agent/instance/backupset/subclient": exception
+                    }
+                }
+        """
+        return dict((label, dict(failures)) for label, failures in self._failures.items())
+
+    def wait(self, timeout=None):
+        """Waits for all the backup jobs to finish, using the job monitor of the commcell.
+
+            Args:
+                timeout (int)   --  maximum number of seconds to wait
+                    default: None; wait until all the jobs finish
+
+            Returns:
+                bool - boolean output whether all the jobs finished or not, within the timeout
+        """
+        return self._commcell_object.job_monitor.wait_all(self.jobs, timeout)
@@ -29,14 +29,20 @@ Clients:
 
     _member_servers()         --  returns member clients to be associated with the Virtual Client
 
+    _name_index()             --  returns the index of the client names, for searching the clients
+
     has_client(client_name)   --  checks if a client exists with the given name or not
 
+    search(pattern)           --  returns the names of the clients matching the given pattern
+
     add_vmware_client()       --  adds a new VMWare Virtualization Client to the Commcell
 
     get(client_name)          --  returns the Client class object of the input client name
 
     delete(client_name)       --  deletes the client specified by the client name from the commcell
 
+    refresh()                 --  refresh the clients associated with the commcell
+
 
 Client:
     __init__(commcell_object,
@@ -78,6 +84,7 @@ from base64 import b64encode
 
 from .agent import Agents
 from .schedules import Schedules
+from .nameindex import NameIndex
 from .exception import SDKException
 
 
@@ -97,6 +104,7 @@ class Clients(object):
         self._CLIENTS = self._commcell_object._services.GET_ALL_CLIENTS
         self._ADD_CLIENT = self._commcell_object._services.GET_ALL_CLIENTS
         self._clients = self._get_clients()
+        self._index = None
 
     def __str__(self):
         """Representation string consisting of all clients of the commcell.
@@ -226,6 +234,52 @@ class Clients(object):
 
         return self._clients and str(client_name).lower() in self._clients
 
+    def _name_index(self):
+        """Returns the index of the client names, built again only if the clients were refreshed.
+
+            Returns:
+                object - instance of the NameIndex class for the names of the clients
+        """
+        clients = self._clients
+
+        if self._index is None or self._index[0] is not clients:
+            self._index = (clients, NameIndex(clients))
+
+        return self._index[1]
+
+    def search(self, pattern, search_type='glob'):
+        """Returns the names of the clients matching the given pattern.
+
+            Args:
+                pattern     (str)   --  prefix, glob pattern, or regular expression to search
+
+                    e.g.: 'sql-prod-*'
+
+                search_type (str)   --  type of the search to run
+
+                    Valid values are:
+
+                        prefix
+
+                        glob
+
+                        regex
+
+                    default: glob
+
+            Returns:
+                list - names of the clients matching the pattern, in sorted order
+
+            Raises:
+                SDKException:
+                    if type of the pattern argument is not string
+
+                    if search type is not valid
+
+                    if the regular expression is not valid
+        """
+        return self._name_index().search(pattern, search_type)
+
     def add_vmware_client(
             self,
             client_name,
@@ -415,6 +469,13 @@ class Clients(object):
                     'Client', '102', 'No client exists with name: {0}'.format(client_name)
                 )
 
+    def refresh(self):
+        """Refresh the clients associated with the Commcell.
+
+            The existing clients are kept, if the refresh fails.
+        """
+        self._clients = self._get_clients()
+
 
 class Client(object):
     """Class for performing client operations for a specific client."""
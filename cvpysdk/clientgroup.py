@@ -35,6 +35,8 @@ ClientGroups:
 
     delete(clientgroup_name)   -- deletes the client group from the commcell
 
+    refresh()                  -- refresh the client groups associated with the commcell
+
 
 ClientGroup:
     __init__(commcell_object,
@@ -428,6 +430,13 @@ class ClientGroups(object):
                     'No ClientGroup exists with name: "{0}"'.format(clientgroup_name)
                 )
 
+    def refresh(self):
+        """Refresh the client groups associated with the Commcell.
+
+            The existing client groups are kept, if the refresh fails.
+        """
+        self._clientgroups = self._get_clientgroups()
+
 
 class ClientGroup(object):
     """Class for performing operations for a specific ClientGroup."""
@@ -36,11 +36,35 @@ Commcell:
     _remove_attribs_()           --  removes all the attributs associated with the commcell
                                         object upon logout
 
+    _auto_refresh_()             --  refreshes the cached collections periodically,
+                                        until the auto refresh is stopped
+
     logout()                     --  logs out the user associated with the current instance
 
     request()                    --  runs an input HTTP request on the API specified,
                                         and returns its response
 
+    refresh()                    --  refreshes the cached clients, client groups,
+                                        storage policies, and schedule policies
+
+    snapshot()                   --  crawls the commcell concurrently, and returns an immutable
+                                        inventory of all clients, agents, instances, backupsets,
+                                        subclients, and schedules
+
+    inventory                    --  returns the latest inventory of the commcell, taking a
+                                        snapshot if none was taken yet
+
+    start_auto_refresh()         --  starts refreshing the cached collections in the background
+
+    stop_auto_refresh()          --  stops the background refresh of the cached collections
+
+    wait_any()                   --  waits for any of the jobs to finish, and returns it
+
+    wait_all()                   --  waits for all of the jobs to finish
+
+    backup_many()                --  runs the backup for the subclients of many clients,
+                                        client groups, backupsets, or subclients, in bulk
+
 """
 
 from __future__ import absolute_import
@@ -48,8 +72,8 @@ from __future__ import absolute_import
 import getpass
 
 from base64 import b64encode
-from threading import Thread
-from requests.exceptions import ConnectionError, SSLError
+from threading import Thread, Event, current_thread
+from requests.exceptions import ConnectionError, SSLError, RequestException
 
 try:
     # Python 2 import
@@ -71,6 +95,10 @@ from .usergroup import UserGroups
 from .workflow import WorkFlow
 from .exception import SDKException
 from .clientgroup import ClientGroups
+from .inventory import InventoryCrawler
+from .jobmonitor import JobMonitor
+from .jobcontroller import JobController
+from .bulkbackup import BulkBackup
 
 
 class Commcell(object):
@@ -174,6 +202,17 @@ class Commcell(object):
         self.workflows = sdk_dict[WorkFlow]
         self.client_groups = sdk_dict[ClientGroups]
 
+        # single poller for the status of all the jobs started using this commcell
+        self.job_monitor = JobMonitor(self)
+        self.jobs = JobController(self)
+
+        self._refresh_thread = None
+        self._refresh_event = Event()
+        self._inventory = None
+
+        # opt-in cache of the browse results of the subclients, set to a BrowseCache to enable
+        self.browse_cache = None
+
     def __repr__(self):
         """String representation of the instance of this class.
 
@@ -252,8 +291,45 @@ class Commcell(object):
         else:
             return input_string
 
+    def _auto_refresh_(self, interval, stop_event):
+        """Refreshes the cached collections every interval seconds, until the auto refresh
+            is stopped.
+
+            Readers keep getting the last good snapshot of a collection, as the refreshed
+            collection is swapped in only after it is fetched completely.
+
+            Args:
+                interval    (int)       --  number of seconds to wait between two refreshes
+
+                stop_event  (object)    --  event set to stop this refresh thread
+        """
+        while not stop_event.wait(interval):
+            collections = [
+                self.clients,
+                self.client_groups,
+                self.storage_policies,
+                self.schedule_policies
+            ]
+
+            for collection in collections:
+                if stop_event.is_set():
+                    return
+
+                if collection is None:
+                    continue
+
+                try:
+                    collection.refresh()
+                except (SDKException, RequestException):
+                    # keep serving the last good snapshot, and try again on the next cycle
+                    continue
+
     def _remove_attribs_(self):
         """Removes all the attributes associated with the instance of this class."""
+        # let the refresh in progress finish, before removing the collections it refreshes
+        self.stop_auto_refresh(timeout=60)
+        self.job_monitor.stop()
+
         del self.clients
         del self.alerts
         del self.media_agents
@@ -263,6 +339,9 @@ class Commcell(object):
         del self.user_groups
         del self.workflows
         del self.client_groups
+        del self.job_monitor
+        del self.jobs
+        del self.browse_cache
         del self.__user_guid
         del self._web_service
         del self._cvpysdk_object
@@ -303,3 +382,254 @@ class Commcell(object):
         )
 
         return response
+
+    def refresh(self):
+        """Refreshes the clients, client groups, storage policies, and schedule policies
+            cached for the Commcell.
+
+            Raises:
+                SDKException:
+                    if failed to refresh any of the collections
+
+                    if response is empty
+
+                    if response is not success
+        """
+        collections = [
+            self.clients,
+            self.client_groups,
+            self.storage_policies,
+            self.schedule_policies
+        ]
+
+        for collection in collections:
+            if collection is not None:
+                collection.refresh()
+
+    def snapshot(self, max_workers=16, include_content=False):
+        """Crawls all the clients of the Commcell concurrently, and returns an immutable
+            in-memory inventory of the clients, agents, instances, backupsets, subclients
+            (along with their storage policy associations), and schedules.
+
+            Args:
+                max_workers     (int)   --  maximum number of clients to crawl concurrently
+                    default: 16
+
+                include_content (bool)  --  store the checksum of the content of each subclient,
+                                                to compare the content in InventoryDiff,
+                                                at the cost of a request for every subclient
+                    default: False
+
+            The snapshot is also kept as the latest inventory of the Commcell.
+
+            Returns:
+                object - instance of the Inventory class
+
+            Raises:
+                SDKException:
+                    if type of the max workers argument is not int
+
+                    if max workers is not a positive value
+
+                    if failed to get the clients of the commcell
+        """
+        self._inventory = InventoryCrawler(self, max_workers, include_content).crawl()
+        return self._inventory
+
+    @property
+    def inventory(self):
+        """Returns the latest inventory of the Commcell, taking a snapshot if none was taken.
+
+            Queries on the inventory are answered from memory, e.g.:
+
+                commcell.inventory.subclients.where(storage_policy='SP-Gold')
+
+            Call snapshot() to take a new snapshot of the Commcell.
+        """
+        if self._inventory is None:
+            self.snapshot()
+
+        return self._inventory
+
+    def start_auto_refresh(self, interval=300):
+        """Starts refreshing the cached collections of the Commcell in the background,
+            every interval seconds.
+
+            Calls to methods like has_client and get keep returning immediately
+            using the last good snapshot of the collection, while it is refreshed.
+
+            Args:
+                interval (int)  --  number of seconds to wait between two refreshes
+                    default: 300
+
+            Raises:
+                SDKException:
+                    if type of the interval argument is not a number
+
+                    if interval is not a positive value
+        """
+        if not isinstance(interval, (int, float)):
+            raise SDKException('Commcell', '103')
+
+        if interval <= 0:
+            raise SDKException('Commcell', '104')
+
+        self.stop_auto_refresh()
+
+        self._refresh_event = Event()
+        self._refresh_thread = Thread(
+            target=self._auto_refresh_, args=(interval, self._refresh_event)
+        )
+        self._refresh_thread.daemon = True
+        self._refresh_thread.start()
+
+    def stop_auto_refresh(self, timeout=None):
+        """Stops the background refresh of the cached collections, if running, and waits for
+            the refresh in progress, if any, to finish.
+
+            Args:
+                timeout (int)   --  maximum number of seconds to wait for the refresh thread
+                    default: None; wait until the refresh thread ends
+
+            Returns:
+                bool - boolean output whether the refresh thread ended or not, within the timeout
+        """
+        refresh_thread = self._refresh_thread
+
+        if refresh_thread is None:
+            return True
+
+        self._refresh_event.set()
+        self._refresh_thread = None
+
+        if refresh_thread is not current_thread():
+            refresh_thread.join(timeout)
+
+        return not refresh_thread.is_alive()
+
+    def wait_any(self, jobs, timeout=None):
+        """Waits for any of the jobs to finish, using the single poller of the Commcell.
+
+            Args:
+                jobs    (list)  --  list of instances of the Job class to wait for
+
+                timeout (int)   --  maximum number of seconds to wait
+                    default: None; wait until any of the jobs finishes
+
+            Returns:
+                object - instance of the Job class, which finished first in the list
+
+                None   - if none of the jobs finished within the timeout
+
+            Raises:
+                SDKException:
+                    if type of the jobs argument is not list
+
+                    if type of the timeout argument is not a number
+        """
+        return self.job_monitor.wait_any(jobs, timeout)
+
+    def wait_all(self, jobs, timeout=None):
+        """Waits for all of the jobs to finish, using the single poller of the Commcell.
+
+            Args:
+                jobs    (list)  --  list of instances of the Job class to wait for
+
+                timeout (int)   --  maximum number of seconds to wait
+                    default: None; wait until all the jobs finish
+
+            Returns:
+                bool - boolean output whether all the jobs finished or not, within the timeout
+
+            Raises:
+                SDKException:
+                    if type of the jobs argument is not list
+
+                    if type of the timeout argument is not a number
+        """
+        return self.job_monitor.wait_all(jobs, timeout)
+
+    def backup_many(
+            self,
+            targets,
+            level=None,
+            concurrency=8,
+            stagger=0,
+            work_queue=None,
+            reuse_running_job=False,
+            incremental_backup=False,
+            incremental_level='BEFORE_SYNTH',
+            inventory=None):
+        """Runs the backup for the subclients of all the targets given, with at most
+            concurrency backup requests running at a time.
+
+            The subclients of the targets are resolved from the inventory given, or from a new
+            snapshot of the Commcell, and the jobs started are tracked by the job monitor of
+            the Commcell. The level is checked against the levels supported by the agent of
+            each subclient, and the subclients not supporting it are reported as failures.
+
+            Args:
+                targets     (list)  --  targets to run the backup for, each one of:
+
+                        name of a client group, or a client
+
+                        dict of the inventory filters, e.g.; {'client': 'client1',
+                        'storage_policy': 'SP-Gold'}
+
+                        instance of the Client, ClientGroup, Backupset, or Subclient class
+
+                level       (str)   --  level of backup to run
+                        Full / Incremental / Differential / Synthetic_full / Transaction_Log
+                    default: None; default level of the agent of each subclient
+
+                concurrency (int)   --  maximum number of backup requests to run concurrently
+                    default: 8
+
+                stagger     (float) --  minimum number of seconds between the start of
+                                            two consecutive backup requests
+                    default: 0
+
+                work_queue  (object)    --  instance of the WorkQueue class, to checkpoint each
+                                                subclient submitted, and its job id to, so that
+                                                running it again resumes where it stopped;
+                                                clear the queue to run a new bulk backup
+                    default: None
+
+                reuse_running_job   (bool)  --  return the backup job already running for a
+                                                    subclient, instead of starting another one
+                    default: False
+
+                incremental_backup  (bool)  --  run incremental backup
+                        only applicable in case of Synthetic_full backup
+                    default: False
+
+                incremental_level   (str)   --  run incremental backup before/after synthetic full
+                        BEFORE_SYNTH / AFTER_SYNTH
+                    default: BEFORE_SYNTH
+
+                inventory   (object)    --  inventory to resolve the targets from, e.g.; the
+                                                inventory returned by snapshot()
+                    default: None; a new snapshot is taken, unless all the targets are
+                        Subclient objects
+
+            Returns:
+                object - instance of the BulkBackupResult class, with the job ids and the
+                             failures, for each target
+
+            Raises:
+                SDKException:
+                    if type of the targets, level, or inventory argument is not valid
+
+                    if backup level specified is not correct
+        """
+        return BulkBackup(self).run(
+            targets,
+            level,
+            concurrency,
+            stagger,
+            work_queue,
+            reuse_running_job,
+            incremental_backup,
+            incremental_level,
+            inventory
+        )
@@ -11,6 +11,9 @@
 
 CVPySDK: Class for common operations for the CS, as well as the python package
 
+_NotModifiedResponse: Class for the response returned for a conditional GET request, when the
+                          server responds with 304, with the body of the last response
+
 CVPySDK:
     __init__(commcell_object)   --  initialise object of the CVPySDK class and bind to the commcell
 
@@ -21,13 +24,30 @@ CVPySDK:
     _logout_()                  --  sign out the current logged in user from the commcell,
                                         and end the session
 
+    _is_conditional_get_()      --  checks if the GET request on the URL should be conditional
+
+    _cache_validators_()        --  stores the validators and the body of the response
+
     make_request()              --  run the http request specified on the URL/WebService provided,
                                         and return the flag specifying success/fail, and response
 
+
+_NotModifiedResponse:
+    __init__(content,
+             encoding,
+             headers)           --  initialise object with the body, and the headers of the
+                                        last response
+
+    text                        --  returns the body of the response, decoded to a string
+
+    json()                      --  returns a new object decoded from the JSON body, on every call
+
 """
 
 from __future__ import absolute_import
 
+import json
+
 import requests
 
 try:
@@ -57,6 +77,13 @@ class CVPySDK(object):
         """
         self._commcell_object = commcell_object
 
+        # ETag / Last-Modified validators, and the body of the last response, along with its
+        # encoding and headers, for the conditional GET URLs
+        # {
+        #     "url": (etag, last_modified, content, encoding, headers)
+        # }
+        self._validators = {}
+
     def _is_valid_service_(self):
         """Checks if the service url is a valid url or not.
 
@@ -120,7 +147,7 @@ class CVPySDK(object):
                 response_string = self._commcell_object._update_response_(response.text)
                 raise SDKException('Response', '101', response_string)
         except requests.exceptions.ConnectionError as con_err:
-            raise con_err.message
+            raise con_err
 
     def _logout_(self):
         """Posts a logout request to the server
@@ -139,6 +166,50 @@ class CVPySDK(object):
         else:
             return 'User already logged out'
 
+    def _is_conditional_get_(self, url):
+        """Checks if the GET request on the URL should be sent as a conditional request.
+
+            Only the large lists which rarely change are fetched conditionally.
+
+            Args:
+                url (str)  --  the web url or service to run the GET request on
+
+            Returns:
+                bool - boolean output whether the request should be conditional or not
+        """
+        services = self._commcell_object._services
+
+        return url in (
+            services.GET_ALL_CLIENTS,
+            services.GET_WORKFLOWS,
+            services.STORAGE_POLICY,
+            services.GET_ALL_ALERTS,
+            services.CLIENTGROUPS
+        )
+
+    def _cache_validators_(self, url, response):
+        """Stores the ETag / Last-Modified validators received in the response for the URL,
+            along with its body, to be returned when the server responds with 304.
+
+            Only the bytes of the body are kept, and not the response, so each 304 response
+            decodes its own copy of the JSON, which the caller can modify.
+
+            Args:
+                url       (str)     --  the web url or service the GET request was run on
+
+                response  (object)  --  response received from the server
+        """
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+
+        if etag is None and last_modified is None:
+            self._validators.pop(url, None)
+            return
+
+        self._validators[url] = (
+            etag, last_modified, response.content, response.encoding, response.headers.copy()
+        )
+
     def make_request(self, method, url, payload=None, attempts=0):
         """Makes the request of the type specified in the argument 'method'
 
@@ -177,7 +248,23 @@ class CVPySDK(object):
                     headers['Content-type'] = 'application/xml'
                     response = requests.post(url, headers=headers, data=payload)
             elif method == 'GET':
+                is_conditional = self._is_conditional_get_(url)
+                cached = self._validators.get(url) if is_conditional else None
+
+                if cached is not None:
+                    if cached[0] is not None:
+                        headers['If-None-Match'] = cached[0]
+
+                    if cached[1] is not None:
+                        headers['If-Modified-Since'] = cached[1]
+
                 response = requests.get(url, headers=headers)
+
+                if cached is not None and response.status_code == httplib.NOT_MODIFIED:
+                    # list has not changed since the last request, reuse the body
+                    response = _NotModifiedResponse(*cached[2:])
+                elif is_conditional and response.status_code == httplib.OK:
+                    self._cache_validators_(url, response)
             elif method == 'PUT':
                 response = requests.put(url, headers=headers, json=payload)
             elif method == 'DELETE':
@@ -198,4 +285,40 @@ class CVPySDK(object):
             else:
                 return (False, response)
         except requests.exceptions.ConnectionError as con_err:
-            raise con_err.message
+            raise con_err
+
+
+class _NotModifiedResponse(object):
+    """Response returned for a conditional GET request, when the server responds with 304,
+        with the body of the last response received for the URL.
+    """
+
+    status_code = httplib.OK
+
+    ok = True
+
+    def __init__(self, content, encoding, headers):
+        """Initialize the response with the body, and the headers of the last response.
+
+            Args:
+                content     (bytes) --  body of the last response
+
+                encoding    (str)   --  encoding of the body, or None for UTF-8
+
+                headers     (dict)  --  headers of the last response
+
+            Returns:
+                object - instance of the _NotModifiedResponse class
+        """
+        self.content = content
+        self.encoding = encoding
+        self.headers = headers
+
+    @property
+    def text(self):
+        """Returns the body of the response, decoded to a string."""
+        return self.content.decode(self.encoding or 'utf-8', 'replace')
+
+    def json(self):
+        """Returns the object decoded from the JSON body, which is a new object on every call."""
+        return json.loads(self.text)
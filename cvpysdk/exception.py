@@ -26,7 +26,9 @@ EXCEPTION_DICT = {
     },
     'Commcell': {
         '101': 'Commcell is not reachable. Please check the commcell name and services again',
-        '102': 'Authtoken not received. Please try again.'
+        '102': 'Authtoken not received. Please try again.',
+        '103': 'Data type of the input(s) is not valid',
+        '104': 'Refresh interval should be a positive value'
     },
     'CVPySDK': {
         '101': 'Failed to Login with the credentials provided',
@@ -67,7 +69,13 @@ EXCEPTION_DICT = {
         '109': 'Time Value entered is not of correct format',
         '110': 'No data found at the path specified',
         '111': 'No File/Folder matched the input value',
-        '112': 'Method Not Implemented'
+        '112': 'Method Not Implemented',
+        '113': 'Filter is not valid, it should be one of: name, min_size, max_size, '
+               'modified_after, modified_before',
+        '114': 'Cache size and TTL should be positive values',
+        '115': 'Filter is not valid, it should be one of: is_file, name, min_size, max_size, '
+               'modified_after, modified_before',
+        '116': 'Sort key is not valid, it should be one of: path, name, size, modification_time'
     },
     'Job': {
         '101': 'Incorrect JobId',
@@ -103,6 +111,47 @@ EXCEPTION_DICT = {
     'Workflow': {
         '101': 'Data type of the input(s) is not valid',
         '102': ''
+    },
+    'WorkerPool': {
+        '101': 'Data type of the input(s) is not valid',
+        '102': 'Number of workers should be a positive value',
+        '103': 'Stagger should not be a negative value'
+    },
+    'Inventory': {
+        '101': 'Data type of the input(s) is not valid',
+        '102': '',
+        '103': 'Query filter is not valid'
+    },
+    'JobController': {
+        '101': 'Data type of the input(s) is not valid',
+        '102': '',
+        '103': 'Job category should be one of: active, finished, all',
+        '104': 'Max age should not be a negative value'
+    },
+    'WorkQueue': {
+        '101': 'Data type of the input(s) is not valid',
+        '102': 'Backup may have been started by an earlier run, which was interrupted'
+    },
+    'BulkBackup': {
+        '101': 'Data type of the input(s) is not valid',
+        '102': ''
+    },
+    'Analytics': {
+        '101': 'Group by should be one of: client, agent, storage_policy, or None',
+        '102': 'Metric should be one of: duration, size, throughput'
+    },
+    'JobProgress': {
+        '101': 'Data type of the input(s) is not valid',
+        '102': 'Capacity should be a positive value',
+        '103': 'pyarrow is required to export the progress to Parquet'
+    },
+    'JobMonitor': {
+        '101': 'Data type of the input(s) is not valid'
+    },
+    'NameIndex': {
+        '101': 'Data type of the input(s) is not valid',
+        '102': 'Search type should be one of: prefix, glob, regex',
+        '103': ''
     }
 }
 
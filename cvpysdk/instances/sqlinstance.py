@@ -21,9 +21,6 @@ SQLServerInstance:
 
     _get_sql_restore_options()      --  returns the dict containing destination sql server names
 
-    _run_backup()                   --  runs full backup for this subclients and appends the
-                                            job object to the return list
-
     _process_browse_request()       --  processes response received for Browse request
 
     backup()                        --  runs full backup for all subclients associated
@@ -43,7 +40,6 @@ SQLServerInstance:
 import datetime
 import time
 import re
-import threading
 
 from ..instance import Instance
 from ..exception import SDKException
@@ -171,7 +167,7 @@ class SQLServerInstance(Instance):
             if response.json():
                 if "jobIds" in response.json():
                     time.sleep(1)
-                    return Job(self._commcell_object, response.json()['jobIds'][0])
+                    return Job(self._commcell_object, response.json()['jobIds'][0], 'Restore')
                 elif "errorCode" in response.json():
                     error_message = response.json()['errorMessage']
                     o_str = 'Restore job failed\nError: "{0}"'.format(error_message)
@@ -249,23 +245,6 @@ class SQLServerInstance(Instance):
             response_string = self._commcell_object._update_response_(response.text)
             raise SDKException('Response', '101', response_string)
 
-    def _run_backup(self, subclient_name, return_list):
-        """Triggers full backup job for the given subclient, and appends its Job object to list
-            The SDKExcpetion class instance is appended to the list,
-            if any exception is raised while running the backup job for the Subclient.
-
-            Args:
-                subclient_name (str)   --  name of the subclient to trigger the backup for
-
-                return_list    (list)  --  list to append the job object to
-        """
-        try:
-            job = self.subclients.get(subclient_name).backup('Full')
-            if job:
-                return_list.append(job)
-        except SDKException as excp:
-            return_list.append(excp)
-
     def _process_browse_request(self, browse_request):
         """Runs the SQL Instance Browse API with the request JSON provided for the operation
             specified, and returns the contents after parsing the response.
@@ -317,30 +296,27 @@ class SQLServerInstance(Instance):
             response_string = self._commcell_object._update_response_(response.text)
             raise SDKException('Response', '101', response_string)
 
-    def backup(self):
+    def backup(self, max_workers=8, stagger=0):
         """Run full backup job for all subclients in this instance.
 
-            Returns:
-                list - list containing the job objects for the full backup jobs started for
-                           the subclients in the backupset
-        """
-        return_list = []
-        thread_list = []
-
-        all_subclients = self.subclients._subclients
+            Args:
+                max_workers (int)   --  maximum number of backup requests to run concurrently
+                    default: 8
 
-        if all_subclients:
-            for subclient in all_subclients:
-                thread = threading.Thread(
-                    target=self._run_backup, args=(subclient, return_list)
-                )
-                thread_list.append(thread)
-                thread.start()
+                stagger     (float) --  minimum number of seconds between the start of
+                                            two consecutive backup requests
+                    default: 0
 
-        for thread in thread_list:
-            thread.join()
+            Returns:
+                list - list containing the job objects for the full backup jobs started for
+                           the subclients in the instance, sorted by the subclient name
 
-        return return_list
+                           the SDKException instance is returned in place of the job,
+                           for the subclients the backup failed to start for
+        """
+        return self.subclients.backup(
+            backup_level='Full', max_workers=max_workers, stagger=stagger
+        )
 
     def browse(self):
         """Gets the list of the backed up databases for this instance.
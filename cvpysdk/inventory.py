@@ -0,0 +1,632 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""File for building an in-memory inventory of all the entities of a commcell.
+
+Inventory and InventoryCrawler are the 2 classes defined in this file.
+
+Inventory:          Class for the immutable inventory tree of the commcell,
+                        clients -> agents -> instances -> backupsets -> subclients
+
+InventoryCrawler:   Class for crawling the commcell with a bounded pool of threads,
+                        and building the Inventory
+
+InventoryRecord:    Base class for the immutable, slotted records stored in the inventory
+
+ClientRecord, AgentRecord, InstanceRecord, BackupsetRecord, SubclientRecord,
+ScheduleRecord:     Records for the entities stored in the inventory, with integer ids
+                        and interned names
+
+The compact records are used only by the inventory. The Client, Agent, Backupset, Subclient,
+and Job classes have no compact mode, as they keep the properties received from the commcell,
+to post them back on update. benchmarks/inventory_memory.py measures the memory used by the
+subclient records of the inventory: 110 MB for 500,000 compact records, against 183 MB for
+namedtuple records with string ids, and 793 MB for the raw property dictionaries.
+
+
+Inventory:
+    __init__(clients,
+             failed_clients,
+             created_time)          --  initialise object of the Inventory class
+
+    __repr__()                      --  returns the string for the instance of the Inventory class
+
+    __len__()                       --  returns the number of clients in the inventory
+
+    has_client(client_name)         --  checks if a client exists with the given name or not
+
+    get_client(client_name)         --  returns the client record of the input client name
+
+    get_client_by_id(client_id)     --  returns the client record of the input client id
+
+    subclients                      --  returns the query over all the subclients in the
+                                            inventory, along with their parent records
+
+    diff(old_inventory)             --  returns the changes from the old inventory to this one
+
+
+InventoryCrawler:
+    __init__(commcell_object,
+             max_workers,
+             include_content)       --  initialise object of the InventoryCrawler class
+
+    __repr__()                      --  returns the string for the instance of the
+                                            InventoryCrawler class
+
+    _get_json()                     --  runs the GET request on the URL, and returns the JSON
+
+    _get_clients()                  --  gets the names and ids of all clients of the commcell
+
+    _get_schedules()                --  gets the schedules associated with the client
+
+    _get_subclient_content()        --  gets the content of the subclient from its properties
+
+    _crawl_client()                 --  builds the record of a single client
+
+    crawl()                         --  crawls the commcell, and returns the Inventory
+
+"""
+
+from __future__ import absolute_import
+
+import json
+import time
+import zlib
+
+try:
+    # Python 3 import
+    from sys import intern
+except ImportError:
+    # Python 2 has intern as a builtin
+    pass
+
+from .pool import WorkerPool
+from .inventoryquery import SubclientIndex, SubclientQuery
+from .exception import SDKException
+
+
+class InventoryRecord(object):
+    """Base class for the immutable records stored in the inventory.
+
+        Records use __slots__ instead of a per-instance __dict__, and the derived classes
+        store the ids as integers, and the names as interned strings, to keep the memory
+        footprint small for commcells with a very large number of entities.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, *args):
+        """Initialise the record with the values given, in the order of the slots.
+
+            Raises:
+                TypeError:
+                    if number of values does not match the number of slots
+        """
+        if len(args) != len(self.__slots__):
+            raise TypeError('{0} takes {1} values, but {2} were given'.format(
+                self.__class__.__name__, len(self.__slots__), len(args)
+            ))
+
+        for slot, value in zip(self.__slots__, args):
+            object.__setattr__(self, slot, value)
+
+    def __setattr__(self, name, value):
+        """Records are immutable, and no attribute can be set after initialization."""
+        raise AttributeError("'{0}' object is read-only".format(self.__class__.__name__))
+
+    def __repr__(self):
+        """Representation string for the instance of the record class."""
+        return '{0}({1})'.format(self.__class__.__name__, ', '.join(
+            '{0}={1!r}'.format(slot, getattr(self, slot)) for slot in self.__slots__
+        ))
+
+    def __eq__(self, other):
+        """Records are equal, if they are of the same type and have the same values."""
+        return type(self) is type(other) and self._values() == other._values()
+
+    def __ne__(self, other):
+        """Records are not equal, if either the type or any of the values are different."""
+        return not self == other
+
+    def __hash__(self):
+        """Hash of the record, computed from all its values."""
+        return hash(self._values())
+
+    def __reduce__(self):
+        """Returns the class and values of the record, to be able to pickle it."""
+        return self.__class__, self._values()
+
+    def _values(self):
+        """Returns the values of the record as a tuple, in the order of the slots."""
+        return tuple(getattr(self, slot) for slot in self.__slots__)
+
+
+class ClientRecord(InventoryRecord):
+    """Record for a client in the inventory."""
+
+    __slots__ = ('client_id', 'client_name', 'agents', 'schedules')
+
+
+class AgentRecord(InventoryRecord):
+    """Record for an agent of a client in the inventory."""
+
+    __slots__ = ('agent_id', 'agent_name', 'instances')
+
+
+class InstanceRecord(InventoryRecord):
+    """Record for an instance of an agent in the inventory."""
+
+    __slots__ = ('instance_id', 'instance_name', 'backupsets')
+
+
+class BackupsetRecord(InventoryRecord):
+    """Record for a backupset of an instance in the inventory."""
+
+    __slots__ = ('backupset_id', 'backupset_name', 'is_default', 'subclients')
+
+
+class SubclientRecord(InventoryRecord):
+    """Record for a subclient of a backupset in the inventory."""
+
+    __slots__ = (
+        'subclient_id',
+        'subclient_name',
+        'storage_policy',
+        'is_backup_enabled',
+        'last_backup_time',
+        'next_backup_time',
+        'content_checksum'
+    )
+
+
+class ScheduleRecord(InventoryRecord):
+    """Record for a schedule of a client in the inventory."""
+
+    __slots__ = ('schedule_id', 'schedule_name')
+
+
+def _checksum(value):
+    """Returns the CRC32 checksum of the JSON value, to compare values without storing them.
+
+        Args:
+            value (object)  --  JSON value to compute the checksum of, e.g.; subclient content
+
+        Returns:
+            int  - checksum of the value
+
+            None - if value is None
+    """
+    if value is None:
+        return None
+
+    return zlib.crc32(json.dumps(value, sort_keys=True).encode('utf-8')) & 0xffffffff
+
+
+def _name(value):
+    """Returns the lower case name of an entity as an interned string, so the names repeated
+        across the entities (e.g.; default, file system, storage policy names) share memory.
+
+        Args:
+            value (str)  --  name of the entity
+
+        Returns:
+            str - interned lower case name
+    """
+    return intern(str(value).lower())
+
+
+class Inventory(object):
+    """Class for the immutable inventory tree of all the entities of the commcell."""
+
+    def __init__(self, clients, failed_clients=None, created_time=None):
+        """Initialize object of the Inventory class.
+
+            Args:
+                clients         (tuple)  --  tuple of ClientRecord for all the clients
+
+                failed_clients  (dict)   --  dict of the client names, and the error received
+                                                 while crawling them
+                    default: None
+
+                created_time    (int)    --  epoch time at which the inventory was built
+                    default: None; current time
+
+            Returns:
+                object - instance of the Inventory class
+        """
+        self._clients = tuple(clients)
+        self._failed_clients = dict(failed_clients or {})
+        self._created_time = int(created_time or time.time())
+
+        self._clients_by_name = {}
+        self._clients_by_id = {}
+        self._subclient_index = None
+
+        for client in self._clients:
+            self._clients_by_name[client.client_name] = client
+            self._clients_by_id[client.client_id] = client
+
+    def __repr__(self):
+        """Representation string for the instance of the Inventory class."""
+        return "Inventory class instance of '{0}' clients, created at: '{1}'".format(
+            len(self._clients), time.ctime(self._created_time)
+        )
+
+    def __len__(self):
+        """Returns the number of clients in the inventory."""
+        return len(self._clients)
+
+    @property
+    def clients(self):
+        """Treats the tuple of all client records as a read-only attribute."""
+        return self._clients
+
+    @property
+    def failed_clients(self):
+        """Treats the clients which could not be crawled as a read-only attribute."""
+        return dict(self._failed_clients)
+
+    @property
+    def created_time(self):
+        """Treats the epoch time at which the inventory was built as a read-only attribute."""
+        return self._created_time
+
+    def has_client(self, client_name):
+        """Checks if a client exists in the inventory with the input client name.
+
+            Args:
+                client_name (str)  --  name of the client
+
+            Returns:
+                bool - boolean output whether the client exists in the inventory or not
+
+            Raises:
+                SDKException:
+                    if type of the client name argument is not string
+        """
+        if not isinstance(client_name, str):
+            raise SDKException('Inventory', '101')
+
+        return str(client_name).lower() in self._clients_by_name
+
+    def get_client(self, client_name):
+        """Returns the record of the client with the specified name.
+
+            Args:
+                client_name (str)  --  name of the client
+
+            Returns:
+                object - ClientRecord for the given client name
+
+            Raises:
+                SDKException:
+                    if type of the client name argument is not string
+
+                    if no client exists with the given name
+        """
+        if not self.has_client(client_name):
+            raise SDKException(
+                'Inventory', '102', 'No client exists with name: {0}'.format(client_name)
+            )
+
+        return self._clients_by_name[str(client_name).lower()]
+
+    def get_client_by_id(self, client_id):
+        """Returns the record of the client with the specified id.
+
+            Args:
+                client_id (str / int)  --  id of the client
+
+            Returns:
+                object - ClientRecord for the given client id
+
+            Raises:
+                SDKException:
+                    if no client exists with the given id
+        """
+        if int(client_id) not in self._clients_by_id:
+            raise SDKException(
+                'Inventory', '102', 'No client exists with id: {0}'.format(client_id)
+            )
+
+        return self._clients_by_id[int(client_id)]
+
+    @property
+    def subclients(self):
+        """Returns the query over all the subclients in the inventory.
+
+            The columns of the subclients are indexed on first access, and the query can be
+            narrowed down with its where() method, e.g.:
+
+                inventory.subclients.where(storage_policy='SP-Gold', agent='file system')
+
+            Iterating the query yields the (ClientRecord, AgentRecord, InstanceRecord,
+            BackupsetRecord, SubclientRecord) tuples of the subclients.
+
+            Returns:
+                object - instance of the SubclientQuery class
+        """
+        if self._subclient_index is None:
+            self._subclient_index = SubclientIndex(
+                (client, agent, instance, backupset, subclient)
+                for client in self._clients
+                for agent in client.agents
+                for instance in agent.instances
+                for backupset in instance.backupsets
+                for subclient in backupset.subclients
+            )
+
+        return SubclientQuery(self._subclient_index)
+
+    def diff(self, old_inventory):
+        """Returns the changes from the old inventory given, to this inventory.
+
+            Args:
+                old_inventory (object)  --  instance of the Inventory class to compare from,
+                                                either crawled, or loaded from an InventoryStore
+
+            Returns:
+                object - instance of the InventoryDiff class
+
+            Raises:
+                SDKException:
+                    if type of the old inventory argument is not Inventory
+        """
+        from .inventorydiff import InventoryDiff
+
+        if not isinstance(old_inventory, Inventory):
+            raise SDKException('Inventory', '101')
+
+        return InventoryDiff(old_inventory, self)
+
+
+class InventoryCrawler(object):
+    """Class for crawling all the entities of the commcell, and building the Inventory."""
+
+    def __init__(self, commcell_object, max_workers=16, include_content=False):
+        """Initialize object of the InventoryCrawler class.
+
+            Args:
+                commcell_object (object)  --  instance of the Commcell class
+
+                max_workers     (int)     --  maximum number of clients to crawl concurrently
+                    default: 16
+
+                include_content (bool)    --  get the properties of each subclient, to store the
+                                                  checksum of its content in the inventory
+
+                        the subclients listed for a client do not include their content,
+                        so this costs an additional request for every subclient
+                    default: False
+
+            Returns:
+                object - instance of the InventoryCrawler class
+        """
+        self._commcell_object = commcell_object
+        self._services = self._commcell_object._services
+        self._pool = WorkerPool(max_workers)
+        self._include_content = include_content
+
+    def __repr__(self):
+        """Representation string for the instance of the InventoryCrawler class."""
+        return "InventoryCrawler class instance for Commcell: '{0}'".format(
+            self._commcell_object._headers['Host']
+        )
+
+    def _get_json(self, url):
+        """Runs the GET request on the URL given, and returns the JSON response.
+
+            Args:
+                url (str)  --  the web url or service to run the GET request on
+
+            Returns:
+                dict - JSON response received from the server, or empty dict if no response
+
+            Raises:
+                SDKException:
+                    if response is not success
+        """
+        flag, response = self._commcell_object._cvpysdk_object.make_request('GET', url)
+
+        if flag:
+            return response.json() or {}
+        else:
+            response_string = self._commcell_object._update_response_(response.text)
+            raise SDKException('Response', '101', response_string)
+
+    def _get_clients(self):
+        """Gets the names and ids of all the clients of the commcell.
+
+            Returns:
+                list - list of (client_name, client_id) tuples
+
+            Raises:
+                SDKException:
+                    if response is empty
+
+                    if response is not success
+        """
+        response = self._get_json(self._services.GET_ALL_CLIENTS)
+
+        if 'clientProperties' not in response:
+            raise SDKException('Response', '102')
+
+        clients = []
+
+        for dictionary in response['clientProperties']:
+            client_entity = dictionary['client']['clientEntity']
+            clients.append((_name(client_entity['clientName']), int(client_entity['clientId'])))
+
+        return clients
+
+    def _get_schedules(self, client_id):
+        """Gets the schedules associated with the client.
+
+            Args:
+                client_id (int)  --  id of the client
+
+            Returns:
+                tuple - tuple of ScheduleRecord for all schedules of the client
+        """
+        response = self._get_json(self._services.CLIENT_SCHEDULES % (client_id))
+        schedules = []
+
+        for schedule in response.get('taskDetail', []):
+            task = schedule['task']
+            schedule_name = task.get('taskName') or task.get('description')
+
+            if schedule_name:
+                schedules.append(ScheduleRecord(int(task['taskId']), _name(schedule_name)))
+
+        return tuple(schedules)
+
+    def _get_subclient_content(self, subclient_id):
+        """Gets the content of the subclient, from the properties of the subclient.
+
+            Args:
+                subclient_id (int)  --  id of the subclient
+
+            Returns:
+                list - content of the subclient
+
+                None - if the properties of the subclient do not have any content
+        """
+        response = self._get_json(self._services.SUBCLIENT % (subclient_id))
+
+        for subclient_properties in response.get('subClientProperties', []):
+            return subclient_properties.get('content')
+
+        return None
+
+    def _crawl_client(self, client):
+        """Builds the record of a single client, along with all its agents, instances,
+            backupsets, subclients, and schedules.
+
+            The subclients, backupsets, and instances of all agents of the client are fetched
+            with a single request each, and shared by all the entities of the client.
+
+            Args:
+                client (tuple)  --  (client_name, client_id) tuple of the client to crawl
+
+            Returns:
+                object - ClientRecord for the client
+        """
+        client_name, client_id = client
+
+        agents = self._get_json(self._services.GET_ALL_AGENTS % (client_id))
+        instances = self._get_json(self._services.GET_ALL_INSTANCES % (client_id))
+        backupsets = self._get_json(
+            self._services.GET_ALL_BACKUPSETS % (client_id) + '&excludeHidden=0'
+        )
+        subclients = self._get_json(self._services.GET_ALL_SUBCLIENTS % (client_id))
+
+        # group the subclients with the (agent, instance, backupset) ids they belong to
+        subclients_dict = {}
+
+        for dictionary in subclients.get('subClientProperties', []):
+            entity = dictionary['subClientEntity']
+            common_properties = dictionary.get('commonProperties', {})
+            storage_device = common_properties.get('storageDevice', {})
+            storage_policy = storage_device.get('dataBackupStoragePolicy', {}).get(
+                'storagePolicyName'
+            )
+
+            key = (int(entity['applicationId']),
+                   int(entity['instanceId']),
+                   int(entity['backupsetId']))
+
+            subclient_id = int(entity['subclientId'])
+            content = dictionary.get('content')
+
+            if content is None and self._include_content:
+                content = self._get_subclient_content(subclient_id)
+
+            subclients_dict.setdefault(key, []).append(SubclientRecord(
+                subclient_id,
+                _name(entity['subclientName']),
+                _name(storage_policy) if storage_policy else None,
+                bool(common_properties.get('enableBackup', False)),
+                common_properties.get('lastBackupTime') or None,
+                common_properties.get('nextBackupTime') or None,
+                _checksum(content)
+            ))
+
+        backupsets_dict = {}
+
+        for dictionary in backupsets.get('backupsetProperties', []):
+            entity = dictionary['backupSetEntity']
+            common_backupset = dictionary.get('commonBackupSet', {})
+
+            backupset_id = int(entity['backupsetId'])
+            key = (int(entity['applicationId']), int(entity['instanceId']))
+
+            backupsets_dict.setdefault(key, []).append(BackupsetRecord(
+                backupset_id,
+                _name(entity['backupsetName']),
+                bool(common_backupset.get('isDefaultBackupSet', False)),
+                tuple(subclients_dict.get(key + (backupset_id, ), []))
+            ))
+
+        instances_dict = {}
+
+        for dictionary in instances.get('instanceProperties', []):
+            entity = dictionary['instance']
+            instance_id = int(entity['instanceId'])
+            agent_id = int(entity['applicationId'])
+
+            instances_dict.setdefault(agent_id, []).append(InstanceRecord(
+                instance_id,
+                _name(entity['instanceName']),
+                tuple(backupsets_dict.get((agent_id, instance_id), []))
+            ))
+
+        agent_records = []
+
+        for dictionary in agents.get('agentProperties', []):
+            entity = dictionary['idaEntity']
+            agent_id = int(entity['applicationId'])
+
+            agent_records.append(AgentRecord(
+                agent_id,
+                _name(entity['appName']),
+                tuple(instances_dict.get(agent_id, []))
+            ))
+
+        return ClientRecord(
+            client_id, client_name, tuple(agent_records), self._get_schedules(client_id)
+        )
+
+    def crawl(self):
+        """Crawls all the clients of the commcell concurrently, and builds the inventory.
+
+            Clients which could not be crawled are not added to the inventory,
+            and are available in the failed_clients attribute of the inventory instead.
+
+            Returns:
+                object - instance of the Inventory class
+
+            Raises:
+                SDKException:
+                    if failed to get the clients of the commcell
+        """
+        created_time = time.time()
+        clients = self._get_clients()
+
+        results = self._pool.map(self._crawl_client, clients, return_exceptions=True)
+
+        client_records = []
+        failed_clients = {}
+
+        for client, result in zip(clients, results):
+            if isinstance(result, Exception):
+                failed_clients[client[0]] = str(result)
+            else:
+                client_records.append(result)
+
+        return Inventory(client_records, failed_clients, created_time)
@@ -0,0 +1,340 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""File for comparing two inventories of a commcell, and getting the changes between them.
+
+InventoryDiff:      Class for the structured diff between an old and a new inventory
+
+SubclientChange:    Record for a subclient changed between the two inventories
+
+The inventories can either be crawled from the commcell, or loaded from an InventoryStore.
+Clients and subclients are matched by their ids, so renamed entities are reported as changed
+in place, and not as removed and added.
+
+The content of the subclients is compared only if both the inventories were crawled with their
+content, e.g.; commcell.snapshot(include_content=True), and is reported as not compared in the
+summary otherwise.
+
+Usage:
+    >>> old_inventory = store.load()
+    >>> new_inventory = commcell.snapshot()
+    >>> diff = new_inventory.diff(old_inventory)
+    >>> for change in diff.storage_policy_changed:
+    ...     print(change.subclient_name, change.old_value, change.new_value)
+
+
+InventoryDiff:
+    __init__(old_inventory,
+             new_inventory)     --  initialise object of the InventoryDiff class, and compares
+                                        the two inventories
+
+    __repr__()                  --  returns the string for the instance of the InventoryDiff class
+
+    __len__()                   --  returns the total number of changes
+
+    __bool__()                  --  returns True if there are any changes
+
+    _subclients()               --  returns the rows of the subclients of the inventory, by id
+
+    _change()                   --  returns the change record for a subclient
+
+    _compare()                  --  compares the two inventories, and collects the changes
+
+    clients_added               --  returns the records of the clients added
+
+    clients_removed             --  returns the records of the clients removed
+
+    subclients_added            --  returns the rows of the subclients added
+
+    subclients_removed          --  returns the rows of the subclients removed
+
+    storage_policy_changed      --  returns the subclients whose storage policy changed
+
+    content_changed             --  returns the subclients whose content changed
+
+    backup_enabled              --  returns the subclients whose backup was enabled
+
+    backup_disabled             --  returns the subclients whose backup was disabled
+
+    content_compared            --  returns whether the content of the subclients was compared
+
+    summary()                   --  returns the number of changes of each type
+
+"""
+
+from __future__ import absolute_import
+
+from .inventory import InventoryRecord
+
+
+class SubclientChange(InventoryRecord):
+    """Record for a subclient whose attribute changed between the two inventories."""
+
+    __slots__ = (
+        'client_name',
+        'agent_name',
+        'instance_name',
+        'backupset_name',
+        'subclient_id',
+        'subclient_name',
+        'old_value',
+        'new_value'
+    )
+
+
+class InventoryDiff(object):
+    """Class for the structured diff between two inventories of the commcell."""
+
+    def __init__(self, old_inventory, new_inventory):
+        """Initialize object of the InventoryDiff class, and compare the inventories.
+
+            Clients which failed to crawl in either of the inventories are skipped,
+            so they are not reported as removed or added.
+
+            Args:
+                old_inventory   (object)    --  instance of the Inventory class to compare from
+
+                new_inventory   (object)    --  instance of the Inventory class to compare to
+
+            Returns:
+                object - instance of the InventoryDiff class
+        """
+        self._old_inventory = old_inventory
+        self._new_inventory = new_inventory
+
+        self._clients_added = ()
+        self._clients_removed = ()
+        self._subclients_added = ()
+        self._subclients_removed = ()
+        self._storage_policy_changed = ()
+        self._content_changed = ()
+        self._content_compared = False
+        self._backup_enabled = ()
+        self._backup_disabled = ()
+
+        self._compare()
+
+    def __repr__(self):
+        """Representation string for the instance of the InventoryDiff class."""
+        return "InventoryDiff class instance of '{0}' changes, between: '{1}' and '{2}'".format(
+            len(self), self._old_inventory.created_time, self._new_inventory.created_time
+        )
+
+    def __len__(self):
+        """Returns the total number of changes between the two inventories."""
+        return sum(value for value in self.summary().values() if value is not None)
+
+    def __bool__(self):
+        """Returns True if there are any changes between the two inventories."""
+        return len(self) > 0
+
+    __nonzero__ = __bool__
+
+    @staticmethod
+    def _subclients(inventory, skipped_clients):
+        """Returns the rows of all the subclients of the inventory, with the subclient id as key.
+
+            Args:
+                inventory       (object)    --  instance of the Inventory class
+
+                skipped_clients (set)       --  names of the clients to skip
+
+            Returns:
+                dict - (ClientRecord, AgentRecord, InstanceRecord, BackupsetRecord,
+                           SubclientRecord) tuples, with the subclient id as key
+        """
+        return dict(
+            (row[4].subclient_id, row)
+            for row in inventory.subclients
+            if row[0].client_name not in skipped_clients
+        )
+
+    @staticmethod
+    def _change(row, old_value, new_value):
+        """Returns the SubclientChange record for the subclient row of the new inventory.
+
+            Args:
+                row         (tuple)     --  (ClientRecord, AgentRecord, InstanceRecord,
+                                                BackupsetRecord, SubclientRecord) of the subclient
+
+                old_value   (object)    --  value of the attribute in the old inventory
+
+                new_value   (object)    --  value of the attribute in the new inventory
+
+            Returns:
+                object - SubclientChange record for the subclient
+        """
+        client, agent, instance, backupset, subclient = row
+
+        return SubclientChange(
+            client.client_name,
+            agent.agent_name,
+            instance.instance_name,
+            backupset.backupset_name,
+            subclient.subclient_id,
+            subclient.subclient_name,
+            old_value,
+            new_value
+        )
+
+    def _compare(self):
+        """Compares the clients and subclients of the two inventories by their ids,
+            and collects the changes.
+        """
+        skipped_clients = set(self._old_inventory.failed_clients)
+        skipped_clients.update(self._new_inventory.failed_clients)
+
+        old_clients = dict(
+            (client.client_id, client) for client in self._old_inventory.clients
+            if client.client_name not in skipped_clients
+        )
+        new_clients = dict(
+            (client.client_id, client) for client in self._new_inventory.clients
+            if client.client_name not in skipped_clients
+        )
+
+        self._clients_added = tuple(
+            new_clients[client_id] for client_id in sorted(set(new_clients) - set(old_clients))
+        )
+        self._clients_removed = tuple(
+            old_clients[client_id] for client_id in sorted(set(old_clients) - set(new_clients))
+        )
+
+        old_subclients = self._subclients(self._old_inventory, skipped_clients)
+        new_subclients = self._subclients(self._new_inventory, skipped_clients)
+
+        self._subclients_added = tuple(
+            new_subclients[subclient_id]
+            for subclient_id in sorted(set(new_subclients) - set(old_subclients))
+        )
+        self._subclients_removed = tuple(
+            old_subclients[subclient_id]
+            for subclient_id in sorted(set(old_subclients) - set(new_subclients))
+        )
+
+        storage_policy_changed = []
+        content_changed = []
+        backup_enabled = []
+        backup_disabled = []
+
+        for subclient_id in sorted(set(old_subclients) & set(new_subclients)):
+            old_subclient = old_subclients[subclient_id][4]
+            row = new_subclients[subclient_id]
+            new_subclient = row[4]
+
+            # content is compared only if it was received in both the inventories
+            if (old_subclient.content_checksum is not None and
+                    new_subclient.content_checksum is not None):
+                self._content_compared = True
+
+            # records are immutable, and an unchanged subclient compares equal as a whole
+            if old_subclient == new_subclient:
+                continue
+
+            if old_subclient.storage_policy != new_subclient.storage_policy:
+                storage_policy_changed.append(
+                    self._change(row, old_subclient.storage_policy, new_subclient.storage_policy)
+                )
+
+            if (old_subclient.content_checksum is not None and
+                    new_subclient.content_checksum is not None and
+                    old_subclient.content_checksum != new_subclient.content_checksum):
+                content_changed.append(
+                    self._change(
+                        row, old_subclient.content_checksum, new_subclient.content_checksum
+                    )
+                )
+
+            if old_subclient.is_backup_enabled != new_subclient.is_backup_enabled:
+                if new_subclient.is_backup_enabled:
+                    backup_enabled.append(self._change(row, False, True))
+                else:
+                    backup_disabled.append(self._change(row, True, False))
+
+        self._storage_policy_changed = tuple(storage_policy_changed)
+        self._content_changed = tuple(content_changed)
+        self._backup_enabled = tuple(backup_enabled)
+        self._backup_disabled = tuple(backup_disabled)
+
+    @property
+    def clients_added(self):
+        """Treats the tuple of the ClientRecord of the clients added as a read-only attribute."""
+        return self._clients_added
+
+    @property
+    def clients_removed(self):
+        """Treats the tuple of the ClientRecord of the clients removed as a read-only attribute."""
+        return self._clients_removed
+
+    @property
+    def subclients_added(self):
+        """Treats the rows of the subclients added as a read-only attribute."""
+        return self._subclients_added
+
+    @property
+    def subclients_removed(self):
+        """Treats the rows of the subclients removed as a read-only attribute."""
+        return self._subclients_removed
+
+    @property
+    def storage_policy_changed(self):
+        """Treats the subclients whose storage policy changed as a read-only attribute."""
+        return self._storage_policy_changed
+
+    @property
+    def content_changed(self):
+        """Treats the subclients whose content checksum changed as a read-only attribute.
+
+            Always empty, if the content was not compared.
+        """
+        return self._content_changed
+
+    @property
+    def content_compared(self):
+        """Treats whether the content of the subclients was compared as a read-only attribute."""
+        return self._content_compared
+
+    @property
+    def backup_enabled(self):
+        """Treats the subclients whose backup was enabled as a read-only attribute."""
+        return self._backup_enabled
+
+    @property
+    def backup_disabled(self):
+        """Treats the subclients whose backup was disabled as a read-only attribute."""
+        return self._backup_disabled
+
+    def summary(self):
+        """Returns the number of changes of each type between the two inventories.
+
+            Returns:
+                dict - number of changes, with the type of the change as key
+                    {
+                        "clients_added": 0,
+                        "clients_removed": 0,
+                        "subclients_added": 0,
+                        "subclients_removed": 0,
+                        "storage_policy_changed": 0,
+                        "content_changed": 0,
+                        "backup_enabled": 0,
+                        "backup_disabled": 0
+                    }
+
+                    content_changed is None, if the content of the subclients was not compared
+        """
+        return {
+            'clients_added': len(self._clients_added),
+            'clients_removed': len(self._clients_removed),
+            'subclients_added': len(self._subclients_added),
+            'subclients_removed': len(self._subclients_removed),
+            'storage_policy_changed': len(self._storage_policy_changed),
+            'content_changed': len(self._content_changed) if self._content_compared else None,
+            'backup_enabled': len(self._backup_enabled),
+            'backup_disabled': len(self._backup_disabled)
+        }
@@ -0,0 +1,322 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""File for querying the subclients of an inventory, using in-memory indexed columns.
+
+SubclientIndex and SubclientQuery are the 2 classes defined in this file.
+
+SubclientIndex: Class for the columns of all the subclients of an inventory, indexed by
+                    value for the names and flags, and sorted for the backup times
+
+SubclientQuery: Class for a chainable query over the subclients of an inventory
+
+Usage:
+    >>> commcell.inventory.subclients.where(
+            storage_policy='SP-Gold', agent='file system', last_backup_before=timestamp
+        )
+
+
+SubclientIndex:
+    __init__(rows)          --  initialise object of the SubclientIndex class, and builds
+                                    the indexes for the subclient rows given
+
+    __len__()               --  returns the number of subclients in the index
+
+    _add_times()            --  builds the sorted index for a backup time column
+
+    _name_positions()       --  returns the positions of the rows matching the name(s)
+
+    _time_positions()       --  returns the positions of the rows before / after a time
+
+    positions()             --  returns the positions of the rows matching a single filter
+
+
+SubclientQuery:
+    __init__(index,
+             positions)     --  initialise object of the SubclientQuery class
+
+    __repr__()              --  returns the string for the instance of the SubclientQuery class
+
+    __len__()               --  returns the number of subclients matching the query
+
+    __iter__()              --  yields the subclients matching the query
+
+    where()                 --  returns a new query, with the input filters applied
+
+    all()                   --  returns the list of the subclients matching the query
+
+"""
+
+from __future__ import absolute_import
+
+from bisect import bisect_left, bisect_right
+
+from .exception import SDKException
+
+
+class SubclientIndex(object):
+    """Class for the indexed columns of all the subclients of an inventory."""
+
+    # column name and its position in the (client, agent, instance, backupset, subclient) row
+    _NAME_COLUMNS = {
+        'client': (0, 'client_name'),
+        'agent': (1, 'agent_name'),
+        'instance': (2, 'instance_name'),
+        'backupset': (3, 'backupset_name'),
+        'subclient': (4, 'subclient_name'),
+        'storage_policy': (4, 'storage_policy'),
+        'is_backup_enabled': (4, 'is_backup_enabled')
+    }
+
+    _TIME_FILTERS = {
+        'last_backup_before': ('last_backup_time', False),
+        'last_backup_after': ('last_backup_time', True),
+        'next_backup_before': ('next_backup_time', False),
+        'next_backup_after': ('next_backup_time', True)
+    }
+
+    def __init__(self, rows):
+        """Initialize the SubclientIndex object, and build the indexes for the rows given.
+
+            Args:
+                rows    (iterable)  --  (ClientRecord, AgentRecord, InstanceRecord,
+                                            BackupsetRecord, SubclientRecord) tuples
+
+            Returns:
+                object - instance of the SubclientIndex class
+        """
+        self.rows = tuple(rows)
+
+        self._names = dict((column, {}) for column in self._NAME_COLUMNS)
+        self._times = {}
+
+        for position, row in enumerate(self.rows):
+            for column, (record_index, attribute) in self._NAME_COLUMNS.items():
+                value = getattr(row[record_index], attribute)
+                self._names[column].setdefault(value, []).append(position)
+
+        # subclients which were never backed up, are treated as last backed up at 0
+        self._add_times('last_backup_time', 0)
+        self._add_times('next_backup_time', None)
+
+    def __len__(self):
+        """Returns the number of subclients in the index."""
+        return len(self.rows)
+
+    def _add_times(self, attribute, default):
+        """Builds the sorted index of the backup time column of the subclients.
+
+            Args:
+                attribute   (str)   --  name of the time attribute of the SubclientRecord
+
+                default     (int)   --  time to use for subclients without a value,
+                                            or None to leave them out of the index
+        """
+        pairs = []
+
+        for position, row in enumerate(self.rows):
+            value = getattr(row[4], attribute)
+
+            if value is None:
+                value = default
+
+            if value is not None:
+                pairs.append((int(value), position))
+
+        pairs.sort()
+
+        self._times[attribute] = ([pair[0] for pair in pairs], [pair[1] for pair in pairs])
+
+    def _name_positions(self, column, value):
+        """Returns the positions of the rows where the column matches the value(s).
+
+            Args:
+                column  (str)                       --  name of the column to filter on
+
+                value   (str / bool / list / None)  --  value, or list of values to match
+
+            Returns:
+                set - positions of the matching rows
+        """
+        if isinstance(value, (list, tuple, set, frozenset)):
+            values = value
+        else:
+            values = [value]
+
+        index = self._names[column]
+        positions = set()
+
+        for value in values:
+            if isinstance(value, str):
+                value = value.lower()
+
+            positions.update(index.get(value, []))
+
+        return positions
+
+    def _time_positions(self, attribute, timestamp, after):
+        """Returns the positions of the rows with the backup time before / after the timestamp.
+
+            Args:
+                attribute   (str)   --  name of the time attribute of the SubclientRecord
+
+                timestamp   (int)   --  epoch time to compare with
+
+                after       (bool)  --  True for times after the timestamp,
+                                            False for times before the timestamp
+
+            Returns:
+                set - positions of the matching rows
+        """
+        times, positions = self._times[attribute]
+
+        if after:
+            return set(positions[bisect_right(times, timestamp):])
+
+        return set(positions[:bisect_left(times, timestamp)])
+
+    def positions(self, name, value):
+        """Returns the positions of the rows matching the filter given.
+
+            Args:
+                name    (str)       --  name of the filter
+
+                value   (object)    --  value of the filter
+
+            Returns:
+                set - positions of the matching rows
+
+            Raises:
+                SDKException:
+                    if the filter is not valid
+
+                    if value of a backup time filter is not a number
+        """
+        if name in self._NAME_COLUMNS:
+            return self._name_positions(name, value)
+
+        if name in self._TIME_FILTERS:
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                raise SDKException('Inventory', '101')
+
+            attribute, after = self._TIME_FILTERS[name]
+            return self._time_positions(attribute, value, after)
+
+        raise SDKException('Inventory', '103', 'Filter: {0}'.format(name))
+
+
+class SubclientQuery(object):
+    """Class for a chainable query over the subclients of an inventory."""
+
+    def __init__(self, index, positions=None):
+        """Initialize object of the SubclientQuery class.
+
+            Args:
+                index       (object)    --  instance of the SubclientIndex class
+
+                positions   (tuple)     --  positions of the rows matched by the query
+                    default: None; all the rows
+
+            Returns:
+                object - instance of the SubclientQuery class
+        """
+        self._index = index
+
+        if positions is None:
+            positions = range(len(index))
+
+        self._positions = tuple(positions)
+
+    def __repr__(self):
+        """Representation string for the instance of the SubclientQuery class."""
+        return "SubclientQuery class instance matching '{0}' subclients".format(
+            len(self._positions)
+        )
+
+    def __len__(self):
+        """Returns the number of subclients matching the query."""
+        return len(self._positions)
+
+    def __iter__(self):
+        """Yields the subclients matching the query, along with their parent records.
+
+            Yields:
+                tuple - (ClientRecord, AgentRecord, InstanceRecord, BackupsetRecord,
+                             SubclientRecord)
+        """
+        rows = self._index.rows
+
+        for position in self._positions:
+            yield rows[position]
+
+    def where(self, **filters):
+        """Returns a new query matching only the subclients which satisfy all the filters.
+
+            Names are matched case insensitively, and a list of values matches any of them.
+
+            Args:
+                client              (str / list)    --  name of the client
+
+                agent               (str / list)    --  name of the agent
+
+                instance            (str / list)    --  name of the instance
+
+                backupset           (str / list)    --  name of the backupset
+
+                subclient           (str / list)    --  name of the subclient
+
+                storage_policy      (str / list)    --  name of the storage policy,
+                                                            None for subclients without one
+
+                is_backup_enabled   (bool)          --  whether backup is enabled or not
+
+                last_backup_before  (int)           --  epoch time, subclients never backed up
+                                                            are treated as backed up at 0
+
+                last_backup_after   (int)           --  epoch time
+
+                next_backup_before  (int)           --  epoch time
+
+                next_backup_after   (int)           --  epoch time
+
+            Returns:
+                object - instance of the SubclientQuery class for the matching subclients
+
+            Raises:
+                SDKException:
+                    if any of the filters is not valid
+
+                    if value of a backup time filter is not a number
+        """
+        matches = [self._index.positions(name, value) for name, value in filters.items()]
+
+        # intersect starting with the smallest set, to keep the intermediate results small
+        matches.sort(key=len)
+
+        if not matches:
+            return SubclientQuery(self._index, self._positions)
+
+        positions = set(matches[0])
+
+        for match in matches[1:]:
+            positions.intersection_update(match)
+
+        if len(self._positions) < len(self._index):
+            positions.intersection_update(self._positions)
+
+        return SubclientQuery(self._index, sorted(positions))
+
+    def all(self):
+        """Returns the list of all the subclients matching the query.
+
+            Returns:
+                list - list of (ClientRecord, AgentRecord, InstanceRecord, BackupsetRecord,
+                           SubclientRecord) tuples
+        """
+        return list(self)
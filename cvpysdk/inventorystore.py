@@ -0,0 +1,835 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""File for persisting the inventory of a commcell to a local SQLite database.
+
+InventoryStore: Class for storing the commcell inventory on disk, answering lookups offline,
+                    and revalidating the stale clients against the commcell
+
+The lookups by name and id are answered from the database. If the store is opened with a
+commcell, the client looked up is crawled again on access, when it was not refreshed in the
+max age, and a client not found in the store is looked up in the clients of the commcell, and
+crawled, if it was added since. Only the client looked up is crawled; call revalidate() to
+re-crawl all the stale clients, and to delete the clients removed from the commcell. The stored
+rows are used as they are, if the commcell can not be reached.
+
+The content checksums of the subclients are stored again, whenever a client is crawled, if the
+store has the content checksums, i.e.; it was saved from a snapshot taken with the content.
+
+The store answers the lookups with its own methods, e.g.; has_client(), get_subclient_id(), and
+is not a backing for the Clients, Backupsets, and Subclients collections of the commcell, as
+the Client, Agent, and Backupset objects those return get their properties from the commcell.
+
+Usage:
+    >>> store = InventoryStore('inventory.db', commcell, max_age=3600)
+    >>> store.get_subclient_id('client1', 'file system', 'defaultbackupset', 'default')
+
+
+InventoryStore:
+    __init__(database_path,
+             commcell_object,
+             max_age)           --  opens the SQLite database at the path, and creates the
+                                        tables, if they do not exist
+
+    __repr__()                  --  returns the string for the instance of the InventoryStore class
+
+    _create_tables()            --  creates the tables to store the inventory, if not present
+
+    _execute()                  --  runs the SQL query, and returns all the rows fetched
+
+    _delete_client()            --  deletes all the rows of the client from all the tables
+
+    _write_client()             --  writes the record of a single client to all the tables
+
+    _is_stale()                 --  checks if the data refreshed at the given time is stale
+
+    _get_crawler()              --  returns the crawler for the commcell, with the options of
+                                        the inventory stored
+
+    _revalidate_client()        --  crawls the client again before a lookup, if it is stale,
+                                        or if it was added to the commcell
+
+    _get_backupset_row()        --  returns the ids of the backupset with the given names
+
+    save()                      --  writes the entire inventory to the database
+
+    load()                      --  reads the entire inventory from the database
+
+    has_client()                --  checks if a client exists with the given name or not
+
+    get_client_id()             --  returns the id of the client with the given name
+
+    get_client_name()           --  returns the name of the client with the given id
+
+    has_backupset()             --  checks if a backupset exists for the agent of the client
+
+    get_backupset_id()          --  returns the id of the backupset of the agent of the client
+
+    has_subclient()             --  checks if a subclient exists in the backupset of the client
+
+    get_subclient_id()          --  returns the id of the subclient in the backupset of the client
+
+    refresh_time()              --  returns the time at which the client was last refreshed
+
+    stale_clients()             --  returns the names of the clients not refreshed in max age
+
+    revalidate()                --  re-crawls the stale, new, and removed clients of the commcell
+
+    close()                     --  closes the connection to the database
+
+"""
+
+from __future__ import absolute_import
+
+import sqlite3
+import threading
+import time
+
+from .inventory import (
+    Inventory,
+    InventoryCrawler,
+    ClientRecord,
+    AgentRecord,
+    InstanceRecord,
+    BackupsetRecord,
+    SubclientRecord,
+    ScheduleRecord,
+    _name
+)
+from .exception import SDKException
+
+
+class InventoryStore(object):
+    """Class for storing the inventory of the commcell in a local SQLite database."""
+
+    def __init__(self, database_path, commcell_object=None, max_age=3600):
+        """Opens the SQLite database at the path given, and creates the inventory tables,
+            if they do not exist already.
+
+            Args:
+                database_path   (str)       --  full path of the SQLite database file
+
+                commcell_object (object)    --  instance of the Commcell class, to revalidate
+                                                    the stale clients against, on access
+                    default: None; lookups are answered from the database only
+
+                max_age         (int)       --  maximum age of the client data, in seconds,
+                                                    before it is revalidated on access
+                    default: 3600
+
+            Returns:
+                object - instance of the InventoryStore class
+
+            Raises:
+                SDKException:
+                    if type of the database path argument is not string
+
+                    if type of the max age argument is not a number
+        """
+        if not isinstance(database_path, str) or not isinstance(max_age, (int, float)):
+            raise SDKException('Inventory', '101')
+
+        self._database_path = database_path
+        self._commcell_object = commcell_object
+        self._max_age = max_age
+        self._lock = threading.Lock()
+
+        # time at which the clients of the commcell were last listed, by this instance
+        self._clients_refresh_time = None
+
+        self._connection = sqlite3.connect(database_path, check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+
+        self._create_tables()
+
+    def __repr__(self):
+        """Representation string for the instance of the InventoryStore class."""
+        return "InventoryStore class instance for database: '{0}'".format(self._database_path)
+
+    def _create_tables(self):
+        """Creates the tables to store the inventory, along with the indexes on the names,
+            if they do not exist already.
+        """
+        with self._lock, self._connection:
+            self._connection.executescript('''
+                CREATE TABLE IF NOT EXISTS clients (
+                    client_id INTEGER PRIMARY KEY,
+                    client_name TEXT NOT NULL,
+                    refresh_time INTEGER NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS agents (
+                    client_id INTEGER NOT NULL,
+                    agent_id INTEGER NOT NULL,
+                    agent_name TEXT NOT NULL,
+                    refresh_time INTEGER NOT NULL,
+                    PRIMARY KEY (client_id, agent_id)
+                );
+                CREATE TABLE IF NOT EXISTS instances (
+                    client_id INTEGER NOT NULL,
+                    agent_id INTEGER NOT NULL,
+                    instance_id INTEGER NOT NULL,
+                    instance_name TEXT NOT NULL,
+                    refresh_time INTEGER NOT NULL,
+                    PRIMARY KEY (client_id, agent_id, instance_id)
+                );
+                CREATE TABLE IF NOT EXISTS backupsets (
+                    client_id INTEGER NOT NULL,
+                    agent_id INTEGER NOT NULL,
+                    instance_id INTEGER NOT NULL,
+                    backupset_id INTEGER PRIMARY KEY,
+                    backupset_name TEXT NOT NULL,
+                    is_default INTEGER NOT NULL,
+                    refresh_time INTEGER NOT NULL
+                );
+                CREATE TABLE IF NOT EXISTS subclients (
+                    client_id INTEGER NOT NULL,
+                    agent_id INTEGER NOT NULL,
+                    instance_id INTEGER NOT NULL,
+                    backupset_id INTEGER NOT NULL,
+                    subclient_id INTEGER PRIMARY KEY,
+                    subclient_name TEXT NOT NULL,
+                    storage_policy TEXT,
+                    is_backup_enabled INTEGER NOT NULL,
+                    last_backup_time INTEGER,
+                    next_backup_time INTEGER,
+                    refresh_time INTEGER NOT NULL,
+                    content_checksum INTEGER
+                );
+                CREATE TABLE IF NOT EXISTS schedules (
+                    client_id INTEGER NOT NULL,
+                    schedule_id INTEGER NOT NULL,
+                    schedule_name TEXT NOT NULL,
+                    refresh_time INTEGER NOT NULL,
+                    PRIMARY KEY (client_id, schedule_id)
+                );
+                CREATE INDEX IF NOT EXISTS clients_name ON clients (client_name);
+                CREATE INDEX IF NOT EXISTS agents_name ON agents (client_id, agent_name);
+                CREATE INDEX IF NOT EXISTS backupsets_client ON backupsets (client_id, agent_id);
+                CREATE INDEX IF NOT EXISTS subclients_backupset ON subclients (backupset_id);
+                CREATE INDEX IF NOT EXISTS subclients_client ON subclients (client_id);
+            ''')
+
+            columns = [
+                row[1] for row in self._connection.execute('PRAGMA table_info(subclients)')
+            ]
+
+            # databases created before the content checksum was stored
+            if 'content_checksum' not in columns:
+                self._connection.execute(
+                    'ALTER TABLE subclients ADD COLUMN content_checksum INTEGER'
+                )
+
+    def _execute(self, query, parameters=()):
+        """Runs the SQL query with the parameters given, and returns all the rows fetched.
+
+            Args:
+                query       (str)    --  SQL query to run
+
+                parameters  (tuple)  --  values for the placeholders in the query
+                    default: ()
+
+            Returns:
+                list - list of all the rows returned by the query
+        """
+        with self._lock:
+            return self._connection.execute(query, parameters).fetchall()
+
+    def _is_stale(self, refresh_time):
+        """Checks if the data refreshed at the given time is older than the max age.
+
+            Args:
+                refresh_time    (float)     --  epoch time of the refresh, or None if never
+
+            Returns:
+                bool - boolean output whether the data is stale or not
+        """
+        return refresh_time is None or time.time() - refresh_time > self._max_age
+
+    def _get_crawler(self, commcell_object, max_workers=16):
+        """Returns the crawler for the commcell, which also gets the content checksums of the
+            subclients, if the store has them, so that they are not lost on crawling again.
+
+            Args:
+                commcell_object (object)  --  instance of the Commcell class
+
+                max_workers     (int)     --  maximum number of clients to crawl concurrently
+                    default: 16
+
+            Returns:
+                object - instance of the InventoryCrawler class
+        """
+        include_content = bool(self._execute(
+            'SELECT 1 FROM subclients WHERE content_checksum IS NOT NULL LIMIT 1'
+        ))
+
+        return InventoryCrawler(commcell_object, max_workers, include_content)
+
+    def _revalidate_client(self, client_name=None, client_id=None):
+        """Crawls the client with the given name or id again, before answering a lookup for it,
+            if the store was opened with a commcell, and the client is stale.
+
+            If the client is not in the store, the clients of the commcell are listed, at most
+            once in the max age, and the client is crawled, if it was added to the commcell.
+            The other clients are not crawled, or deleted, which is done by revalidate().
+
+            Args:
+                client_name (str)   --  name of the client looked up
+                    default: None
+
+                client_id   (int)   --  id of the client looked up
+                    default: None
+        """
+        if self._commcell_object is None:
+            return
+
+        if client_id is None:
+            rows = self._execute(
+                'SELECT client_name, client_id, refresh_time FROM clients WHERE client_name = ?',
+                (client_name.lower(), )
+            )
+        else:
+            rows = self._execute(
+                'SELECT client_name, client_id, refresh_time FROM clients WHERE client_id = ?',
+                (int(client_id), )
+            )
+
+        if rows and not self._is_stale(rows[0][2]):
+            return
+
+        # client not found in the clients listed recently
+        if not rows and not self._is_stale(self._clients_refresh_time):
+            return
+
+        crawler = self._get_crawler(self._commcell_object, 1)
+
+        try:
+            if not rows:
+                clients = crawler._get_clients()
+                self._clients_refresh_time = time.time()
+
+                if client_id is None:
+                    rows = [client for client in clients if client[0] == client_name.lower()]
+                else:
+                    rows = [client for client in clients if client[1] == int(client_id)]
+
+                if not rows:
+                    return
+
+            refresh_time = int(time.time())
+            client = crawler._crawl_client((_name(rows[0][0]), rows[0][1]))
+        except Exception:
+            # answer from the stored rows, if the commcell can not be reached
+            return
+
+        with self._lock, self._connection:
+            self._write_client(client, refresh_time)
+
+    def _delete_client(self, client_id):
+        """Deletes all the rows of the client with the given id, from all the tables.
+
+            Args:
+                client_id (int)  --  id of the client to delete
+        """
+        for table in ['clients', 'agents', 'instances', 'backupsets', 'subclients', 'schedules']:
+            self._connection.execute(
+                'DELETE FROM {0} WHERE client_id = ?'.format(table), (client_id, )
+            )
+
+    def _write_client(self, client, refresh_time):
+        """Writes the record of a single client to all the tables, replacing the existing
+            rows of the client, if any.
+
+            Args:
+                client        (object)  --  ClientRecord of the client to write
+
+                refresh_time  (int)     --  epoch time at which the client was crawled
+        """
+        client_id = client.client_id
+
+        self._delete_client(client_id)
+
+        self._connection.execute(
+            'INSERT INTO clients VALUES (?, ?, ?)',
+            (client_id, client.client_name, refresh_time)
+        )
+
+        for schedule in client.schedules:
+            self._connection.execute(
+                'INSERT OR REPLACE INTO schedules VALUES (?, ?, ?, ?)',
+                (client_id, schedule.schedule_id, schedule.schedule_name, refresh_time)
+            )
+
+        for agent in client.agents:
+            agent_id = agent.agent_id
+
+            self._connection.execute(
+                'INSERT INTO agents VALUES (?, ?, ?, ?)',
+                (client_id, agent_id, agent.agent_name, refresh_time)
+            )
+
+            for instance in agent.instances:
+                instance_id = instance.instance_id
+
+                self._connection.execute(
+                    'INSERT INTO instances VALUES (?, ?, ?, ?, ?)',
+                    (client_id, agent_id, instance_id, instance.instance_name, refresh_time)
+                )
+
+                for backupset in instance.backupsets:
+                    backupset_id = backupset.backupset_id
+
+                    self._connection.execute(
+                        'INSERT OR REPLACE INTO backupsets VALUES (?, ?, ?, ?, ?, ?, ?)',
+                        (client_id, agent_id, instance_id, backupset_id,
+                         backupset.backupset_name, int(backupset.is_default), refresh_time)
+                    )
+
+                    self._connection.executemany(
+                        'INSERT OR REPLACE INTO subclients VALUES '
+                        '(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)',
+                        [(client_id, agent_id, instance_id, backupset_id,
+                          subclient.subclient_id, subclient.subclient_name,
+                          subclient.storage_policy, int(subclient.is_backup_enabled),
+                          subclient.last_backup_time, subclient.next_backup_time, refresh_time,
+                          subclient.content_checksum)
+                         for subclient in backupset.subclients]
+                    )
+
+    def save(self, inventory):
+        """Writes the entire inventory to the database, replacing the existing contents.
+
+            The clients which failed to crawl are not written to the database.
+
+            Args:
+                inventory (object)  --  instance of the Inventory class to save
+
+            Raises:
+                SDKException:
+                    if type of the inventory argument is not Inventory
+        """
+        if not isinstance(inventory, Inventory):
+            raise SDKException('Inventory', '101')
+
+        with self._lock, self._connection:
+            for table in ['clients', 'agents', 'instances', 'backupsets', 'subclients',
+                          'schedules']:
+                self._connection.execute('DELETE FROM {0}'.format(table))
+
+            for client in inventory.clients:
+                self._write_client(client, inventory.created_time)
+
+    def load(self):
+        """Reads the entire inventory stored in the database.
+
+            Returns:
+                object - instance of the Inventory class, with the created time set to the
+                             oldest refresh time of all the clients
+        """
+        subclients = {}
+
+        for row in self._execute('SELECT * FROM subclients ORDER BY subclient_id'):
+            subclients.setdefault(row[3], []).append(SubclientRecord(
+                row[4],
+                _name(row[5]),
+                _name(row[6]) if row[6] else None,
+                bool(row[7]),
+                row[8],
+                row[9],
+                row[11]
+            ))
+
+        backupsets = {}
+
+        for row in self._execute('SELECT * FROM backupsets ORDER BY backupset_id'):
+            backupsets.setdefault(row[:3], []).append(BackupsetRecord(
+                row[3], _name(row[4]), bool(row[5]), tuple(subclients.get(row[3], []))
+            ))
+
+        instances = {}
+
+        for row in self._execute('SELECT * FROM instances ORDER BY instance_id'):
+            instances.setdefault(row[:2], []).append(InstanceRecord(
+                row[2], _name(row[3]), tuple(backupsets.get(row[:3], []))
+            ))
+
+        agents = {}
+
+        for row in self._execute('SELECT * FROM agents ORDER BY agent_id'):
+            agents.setdefault(row[0], []).append(AgentRecord(
+                row[1], _name(row[2]), tuple(instances.get(row[:2], []))
+            ))
+
+        schedules = {}
+
+        for row in self._execute('SELECT * FROM schedules ORDER BY schedule_id'):
+            schedules.setdefault(row[0], []).append(ScheduleRecord(row[1], _name(row[2])))
+
+        clients = []
+        created_time = None
+
+        for row in self._execute('SELECT * FROM clients ORDER BY client_id'):
+            clients.append(ClientRecord(
+                row[0],
+                _name(row[1]),
+                tuple(agents.get(row[0], [])),
+                tuple(schedules.get(row[0], []))
+            ))
+
+            if created_time is None or row[2] < created_time:
+                created_time = row[2]
+
+        return Inventory(clients, created_time=created_time)
+
+    def has_client(self, client_name):
+        """Checks if a client exists in the store with the input client name.
+
+            Args:
+                client_name (str)  --  name of the client
+
+            Returns:
+                bool - boolean output whether the client exists in the store or not
+
+            Raises:
+                SDKException:
+                    if type of the client name argument is not string
+        """
+        if not isinstance(client_name, str):
+            raise SDKException('Inventory', '101')
+
+        self._revalidate_client(client_name)
+
+        return bool(self._execute(
+            'SELECT 1 FROM clients WHERE client_name = ?', (client_name.lower(), )
+        ))
+
+    def get_client_id(self, client_name):
+        """Returns the id of the client with the input client name.
+
+            Args:
+                client_name (str)  --  name of the client
+
+            Returns:
+                int - id of the client
+
+            Raises:
+                SDKException:
+                    if type of the client name argument is not string
+
+                    if no client exists with the given name
+        """
+        if not isinstance(client_name, str):
+            raise SDKException('Inventory', '101')
+
+        self._revalidate_client(client_name)
+
+        rows = self._execute(
+            'SELECT client_id FROM clients WHERE client_name = ?', (client_name.lower(), )
+        )
+
+        if not rows:
+            raise SDKException(
+                'Inventory', '102', 'No client exists with name: {0}'.format(client_name)
+            )
+
+        return rows[0][0]
+
+    def get_client_name(self, client_id):
+        """Returns the name of the client with the input client id.
+
+            Args:
+                client_id (str / int)  --  id of the client
+
+            Returns:
+                str - name of the client
+
+            Raises:
+                SDKException:
+                    if no client exists with the given id
+        """
+        self._revalidate_client(client_id=client_id)
+
+        rows = self._execute(
+            'SELECT client_name FROM clients WHERE client_id = ?', (int(client_id), )
+        )
+
+        if not rows:
+            raise SDKException(
+                'Inventory', '102', 'No client exists with id: {0}'.format(client_id)
+            )
+
+        return str(rows[0][0])
+
+    def _get_backupset_row(self, client_name, agent_name, backupset_name):
+        """Returns the (client_id, backupset_id) row of the backupset with the given names.
+
+            Args:
+                client_name     (str)  --  name of the client
+
+                agent_name      (str)  --  name of the agent
+
+                backupset_name  (str)  --  name of the backupset
+
+            Returns:
+                tuple - (client_id, backupset_id) of the backupset, or None if not found
+
+            Raises:
+                SDKException:
+                    if type of any of the name arguments is not string
+        """
+        if not (isinstance(client_name, str) and
+                isinstance(agent_name, str) and
+                isinstance(backupset_name, str)):
+            raise SDKException('Inventory', '101')
+
+        self._revalidate_client(client_name)
+
+        rows = self._execute(
+            'SELECT backupsets.client_id, backupsets.backupset_id FROM backupsets '
+            'JOIN clients ON clients.client_id = backupsets.client_id '
+            'JOIN agents ON agents.client_id = backupsets.client_id '
+            'AND agents.agent_id = backupsets.agent_id '
+            'WHERE clients.client_name = ? AND agents.agent_name = ? '
+            'AND backupsets.backupset_name = ?',
+            (client_name.lower(), agent_name.lower(), backupset_name.lower())
+        )
+
+        return rows[0] if rows else None
+
+    def has_backupset(self, client_name, agent_name, backupset_name):
+        """Checks if a backupset exists for the agent of the client with the input names.
+
+            Args:
+                client_name     (str)  --  name of the client
+
+                agent_name      (str)  --  name of the agent
+
+                backupset_name  (str)  --  name of the backupset
+
+            Returns:
+                bool - boolean output whether the backupset exists in the store or not
+
+            Raises:
+                SDKException:
+                    if type of any of the name arguments is not string
+        """
+        return self._get_backupset_row(client_name, agent_name, backupset_name) is not None
+
+    def get_backupset_id(self, client_name, agent_name, backupset_name):
+        """Returns the id of the backupset of the agent of the client with the input names.
+
+            Args:
+                client_name     (str)  --  name of the client
+
+                agent_name      (str)  --  name of the agent
+
+                backupset_name  (str)  --  name of the backupset
+
+            Returns:
+                int - id of the backupset
+
+            Raises:
+                SDKException:
+                    if type of any of the name arguments is not string
+
+                    if no backupset exists with the given names
+        """
+        row = self._get_backupset_row(client_name, agent_name, backupset_name)
+
+        if row is None:
+            raise SDKException(
+                'Inventory', '102', 'No backupset exists with name: {0}'.format(backupset_name)
+            )
+
+        return row[1]
+
+    def has_subclient(self, client_name, agent_name, backupset_name, subclient_name):
+        """Checks if a subclient exists in the backupset of the client with the input names.
+
+            Args:
+                client_name     (str)  --  name of the client
+
+                agent_name      (str)  --  name of the agent
+
+                backupset_name  (str)  --  name of the backupset
+
+                subclient_name  (str)  --  name of the subclient
+
+            Returns:
+                bool - boolean output whether the subclient exists in the store or not
+
+            Raises:
+                SDKException:
+                    if type of any of the name arguments is not string
+        """
+        try:
+            self.get_subclient_id(client_name, agent_name, backupset_name, subclient_name)
+            return True
+        except SDKException as excp:
+            if excp.exception_id == '102':
+                return False
+
+            raise excp
+
+    def get_subclient_id(self, client_name, agent_name, backupset_name, subclient_name):
+        """Returns the id of the subclient in the backupset of the client with the input names.
+
+            Args:
+                client_name     (str)  --  name of the client
+
+                agent_name      (str)  --  name of the agent
+
+                backupset_name  (str)  --  name of the backupset
+
+                subclient_name  (str)  --  name of the subclient
+
+            Returns:
+                int - id of the subclient
+
+            Raises:
+                SDKException:
+                    if type of any of the name arguments is not string
+
+                    if no subclient exists with the given names
+        """
+        if not isinstance(subclient_name, str):
+            raise SDKException('Inventory', '101')
+
+        row = self._get_backupset_row(client_name, agent_name, backupset_name)
+        rows = []
+
+        if row is not None:
+            rows = self._execute(
+                'SELECT subclient_id FROM subclients '
+                'WHERE backupset_id = ? AND subclient_name = ?',
+                (row[1], subclient_name.lower())
+            )
+
+        if not rows:
+            raise SDKException(
+                'Inventory', '102', 'No subclient exists with name: {0}'.format(subclient_name)
+            )
+
+        return rows[0][0]
+
+    def refresh_time(self, client_name):
+        """Returns the epoch time at which the client was last refreshed in the store.
+
+            Args:
+                client_name (str)  --  name of the client
+
+            Returns:
+                int - epoch time of the last refresh of the client
+
+            Raises:
+                SDKException:
+                    if type of the client name argument is not string
+
+                    if no client exists with the given name
+        """
+        if not isinstance(client_name, str):
+            raise SDKException('Inventory', '101')
+
+        rows = self._execute(
+            'SELECT refresh_time FROM clients WHERE client_name = ?', (client_name.lower(), )
+        )
+
+        if not rows:
+            raise SDKException(
+                'Inventory', '102', 'No client exists with name: {0}'.format(client_name)
+            )
+
+        return rows[0][0]
+
+    def stale_clients(self, max_age):
+        """Returns the names of the clients which were not refreshed in the last max age seconds.
+
+            Args:
+                max_age (int)  --  maximum age of the client data, in seconds
+
+            Returns:
+                list - names of the stale clients
+        """
+        rows = self._execute(
+            'SELECT client_name FROM clients WHERE refresh_time < ?',
+            (int(time.time() - max_age), )
+        )
+
+        return [str(row[0]) for row in rows]
+
+    def revalidate(self, commcell_object=None, max_age=None, max_workers=16):
+        """Revalidates the store against the commcell.
+
+            The clients added to the commcell, and the clients not refreshed in the last
+            max age seconds are crawled again, and the clients removed from the commcell
+            are deleted from the store. Clients refreshed recently are not requested again.
+
+            The lookups only crawl the client looked up, so call this method explicitly, or
+            from a background thread, to revalidate all the clients of the store.
+
+            Args:
+                commcell_object (object)  --  instance of the Commcell class
+                    default: None; the commcell the store was opened with
+
+                max_age         (int)     --  maximum age of the client data, in seconds
+                    default: None; the max age the store was opened with
+
+                max_workers     (int)     --  maximum number of clients to crawl concurrently
+                    default: 16
+
+            Returns:
+                list - names of the clients refreshed in the store
+
+            Raises:
+                SDKException:
+                    if no commcell is given, and the store was not opened with a commcell
+
+                    if failed to get the clients of the commcell
+        """
+        commcell_object = commcell_object or self._commcell_object
+
+        if commcell_object is None:
+            raise SDKException('Inventory', '101')
+
+        if max_age is None:
+            max_age = self._max_age
+
+        crawler = self._get_crawler(commcell_object, max_workers)
+        clients = crawler._get_clients()
+
+        refresh_times = dict(self._execute('SELECT client_id, refresh_time FROM clients'))
+        threshold = time.time() - max_age
+
+        to_crawl = [
+            client for client in clients
+            if refresh_times.get(client[1], 0) < threshold
+        ]
+
+        refresh_time = int(time.time())
+        results = crawler._pool.map(crawler._crawl_client, to_crawl, return_exceptions=True)
+
+        refreshed = []
+        current_ids = set(client[1] for client in clients)
+
+        with self._lock, self._connection:
+            for client_id in set(refresh_times) - current_ids:
+                self._delete_client(client_id)
+
+            for client, result in zip(to_crawl, results):
+                if not isinstance(result, Exception):
+                    self._write_client(result, refresh_time)
+                    refreshed.append(client[0])
+
+        self._clients_refresh_time = refresh_time
+
+        return refreshed
+
+    def close(self):
+        """Closes the connection to the database."""
+        with self._lock:
+            self._connection.close()
@@ -13,24 +13,28 @@ Job: Class for keeping track of a job and perform various operations on it.
 
 Job:
     __init__(commcell_object,
-             job_id)            --  initialises the instance of Job class associated with the
+             job_id,
+             job_type)          --  initialises the instance of Job class associated with the
                                         specified commcell of job with id: 'job_id'
 
     __repr__()                  --  returns the string representation of the object of this class,
                                         with the job id it is associated with
 
+    __await__()                 --  makes the job awaitable in asyncio, resolving to the job
+                                        itself, when it finishes
+
     _is_valid_job()             --  checks if the job with the given id is a valid job or not.
 
-    _check_finished()           --  checks if the job has finished or not yet
+    _load_job_properties()      --  gets the summary of the job on first access, and
+                                        initializes the properties of the job
 
-    _is_finished()              --  checks for the status of the job.
-                                        Returns True if finished, else False
+    _update_job_status()        --  updates the status of the job from the job summary
 
     _get_job_summary()          --  gets the summary of the job with the given job id
 
     _get_job_details()          --  gets the details of the job with the given job id
 
-    _initialize_job_properties()--  initializes the properties of the job
+    _initialize_job_properties()--  initializes the properties of the job from its summary
 
     pause()                     --  suspend the job
 
@@ -38,16 +42,32 @@ Job:
 
     kill()                      --  kills the job
 
+    wait_for_completion()       --  waits for the job to finish, polling its status adaptively
+
+    subscribe()                 --  subscribes the callback to the events of the job
+
+    events()                    --  yields the events of the job, until it finishes
+
+    record_progress()           --  starts recording the progress of the job as a time series
+
+
+The Job instance is a lightweight handle, holding only the job id when created. The summary of the
+job is fetched once, on first access of any of its properties, and is shared by all of them.
 
 job.status                      --  Gives the current status of the job.
                                         (Completed / Suspended / Waiting / ... / etc.)
 
 job.finished                    --  Tells whether the job is finished or not. (True / False)
+                                        Updated by the JobMonitor of the commcell, until the job
+                                        finishes
 
 job.pending_reason              --  reason if job went into pending state
 
 job.delay_reason                --  reason why the job was delayed
 
+A job which is not found by the JobMonitor is marked as invalid, and accessing its properties, or
+waiting for it raises the SDKException.
+
 """
 
 from __future__ import absolute_import
@@ -61,7 +81,7 @@ from .exception import SDKException
 class Job(object):
     """Class for performing client operations for a specific client."""
 
-    def __init__(self, commcell_object, job_id):
+    def __init__(self, commcell_object, job_id, job_type=None):
         """Initialise the Job class instance.
 
             Args:
@@ -69,14 +89,20 @@ class Job(object):
 
                 job_id          (str / int)  --  id of the job
 
+                job_type        (str)        --  type of the job, e.g.; Backup, if known when the
+                                                     job is submitted, so the JobMonitor can read
+                                                     its status in a batch, right from the start
+                    default: None; read from the summary of the job
+
+            No request is made to the server here, and the job is validated on first access
+            of any of its properties.
+
             Returns:
                 object - instance of the Job class
 
             Raises:
                 SDKException:
                     if job id is not an integer
-
-                    if job is not a valid job, i.e., does not exist in the Commcell
         """
         try:
             int(job_id)
@@ -87,25 +113,26 @@ class Job(object):
         self._job_id = str(job_id)
 
         self._JOB = self._commcell_object._services.JOB % (self.job_id)
-
-        if not self._is_valid_job():
-            raise SDKException('Job', '103')
-
         self._JOB_DETAILS = self._commcell_object._services.JOB_DETAILS
         self._SUSPEND = self._commcell_object._services.SUSPEND_JOB % (self.job_id)
         self._RESUME = self._commcell_object._services.RESUME_JOB % (self.job_id)
         self._KILL = self._commcell_object._services.KILL_JOB % (self.job_id)
 
-        self.finished = self._is_finished()
-        self.status = str(self._get_job_summary()['status'])
+        self._lock = threading.Lock()
+        self._properties_loaded = False
+
+        self._job_summary = None
+        self._job_details = None
 
+        self._status = None
+        self._finished = False
+        self._invalid = False
+        self._job_type = job_type
+        self._end_time = None
         self._delay_reason = None
         self._pending_reason = None
 
-        self._initialize_job_properties()
-
-        thread = threading.Thread(target=self._check_finished)
-        thread.start()
+        self._commcell_object.job_monitor.track(self)
 
     def __repr__(self):
         """String representation of the instance of this class.
@@ -116,42 +143,122 @@ class Job(object):
         representation_string = 'Job class instance for job id: "{0}"'
         return representation_string.format(self.job_id)
 
+    def __await__(self):
+        """Makes the job awaitable, e.g.; `await job`, or `asyncio.gather(*jobs)`.
+
+            The job is tracked by the JobMonitor of the commcell, and the future awaited is
+            resolved from the poller thread, when the job finishes, so the event loop is never
+            blocked by the status checks.
+
+            Returns:
+                iterator - iterator of the asyncio future, resolving to this job instance
+
+            Raises:
+                SDKException:
+                    if no job exists with the job id
+
+                asyncio.CancelledError:
+                    if the job is untracked, or the JobMonitor is stopped, before the job finishes
+        """
+        import asyncio
+
+        loop = getattr(asyncio, 'get_running_loop', asyncio.get_event_loop)()
+        future = loop.create_future()
+        job_monitor = self._commcell_object.job_monitor
+
+        def set_result():
+            """Resolves the future with the job, or with the error if the job is invalid,
+                unless it was cancelled already.
+            """
+            if future.done():
+                return
+
+            if self._invalid:
+                future.set_exception(SDKException('Job', '103', 'Job id: {0}'.format(self.job_id)))
+            else:
+                future.set_result(self)
+
+        def cancel():
+            """Cancels the future, as the job is no longer tracked."""
+            if not future.done():
+                future.cancel()
+
+        def on_event(event):
+            """Resolves the future from the poller thread, once the job finishes, or is
+                no longer tracked.
+            """
+            loop.call_soon_threadsafe(cancel if event.event_type == 'stopped' else set_result)
+
+        subscription_id = job_monitor.subscribe(
+            on_event, [self], ['completed', 'failed', 'killed', 'invalid', 'stopped']
+        )
+        future.add_done_callback(lambda future: job_monitor.unsubscribe(subscription_id))
+
+        # the job might have finished, or been rejected as invalid, before the subscription
+        if self._finished or self._invalid:
+            set_result()
+
+        return future.__await__()
+
     def _is_valid_job(self):
-        """Checks if the job submitted with the job id is a valid job or not.
+        """Checks if the job submitted with the job id is a valid job or not, with a single
+            request for the summary of the job.
+
+            The request is not retried, if no record is found for the job yet. The job is
+            tracked by the JobMonitor, which waits for the records of a job just submitted
+            for its validation period, before rejecting the job as invalid.
 
             Returns:
                 bool - boolean that represents whether the job is valid or not
         """
-        for i in range(10):
-            try:
-                self._get_job_summary()
-                return True
-            except SDKException as excp:
-                if excp.exception_module == 'Job' and excp.exception_id == '104':
-                    time.sleep(1.5)
-                    continue
-                else:
-                    raise excp
+        try:
+            self._update_job_status(self._get_job_summary())
+            return True
+        except SDKException as excp:
+            if excp.exception_module == 'Job' and excp.exception_id == '104':
+                return False
+
+            raise excp
 
-        return False
+    def _load_job_properties(self):
+        """Gets the summary of the job on first access, and initializes the properties of the job.
 
-    def _check_finished(self):
-        """Checks whether the job has finished or not."""
-        while not self._is_finished():
-            time.sleep(5)
+            The summary is not fetched again, if it was already received by the JobMonitor.
+
+            Raises:
+                SDKException:
+                    if job is not a valid job, i.e., does not exist in the Commcell
+        """
+        if self._invalid:
+            raise SDKException('Job', '103', 'Job id: {0}'.format(self.job_id))
 
-        self.finished = self._is_finished()
+        if self._properties_loaded:
+            return
 
-    def _is_finished(self):
-        """Checks whether the job has finished or not.
+        with self._lock:
+            if self._properties_loaded:
+                return
+
+            if self._job_summary is None and not self._is_valid_job():
+                raise SDKException('Job', '103', 'Job id: {0}'.format(self.job_id))
+
+            self._initialize_job_properties()
+            self._properties_loaded = True
+
+    def _update_job_status(self, job_summary):
+        """Updates the status, end time, and pending reason of the job from the job summary.
+
+            Args:
+                job_summary (dict)  --  summary of the job, received from the server
 
             Returns:
                 bool - boolean that represents whether the job has finished or not
         """
-        job_summary = self._get_job_summary()
-        job_details = self._get_job_details()
+        self._job_summary = job_summary
+        self._status = str(job_summary['status'])
 
-        self.status = str(job_summary['status'])
+        if 'jobType' in job_summary:
+            self._job_type = str(job_summary['jobType'])
 
         if job_summary['lastUpdateTime'] != 0:
             self._end_time = time.ctime(job_summary['lastUpdateTime'])
@@ -162,13 +269,11 @@ class Job(object):
             if job_summary['pendingReason']:
                 self._pending_reason = job_summary['pendingReason']
 
-        if 'reasonForJobDelay' in job_details['jobDetail']['progressInfo']:
-            if job_details['jobDetail']['progressInfo']['reasonForJobDelay']:
-                self._delay_reason = job_details['jobDetail']['progressInfo']['reasonForJobDelay']
+        self._finished = ('completed' in self._status.lower() or
+                          'killed' in self._status.lower() or
+                          'failed' in self._status.lower())
 
-        return ('completed' in self.status.lower() or
-                'killed' in self.status.lower() or
-                'failed' in self.status.lower())
+        return self._finished
 
     def _get_job_summary(self):
         """Gets the properties of this job.
@@ -229,12 +334,23 @@ class Job(object):
             response_string = self._commcell_object._update_response_(response.text)
             raise SDKException('Response', '101', response_string)
 
+    def _update_job_details(self, job_details):
+        """Updates the delay reason of the job from the job details.
+
+            Args:
+                job_details (dict)  --  detailed properties of the job, received from the server
+        """
+        self._job_details = job_details
+
+        if 'reasonForJobDelay' in job_details['jobDetail']['progressInfo']:
+            if job_details['jobDetail']['progressInfo']['reasonForJobDelay']:
+                self._delay_reason = job_details['jobDetail']['progressInfo']['reasonForJobDelay']
+
     def _initialize_job_properties(self):
-        """Initializes the common properties for the job.
+        """Initializes the common properties for the job, from the summary of the job.
             Adds the client, agent, backupset, subclient name to the job object.
         """
-        job_summary = self._get_job_summary()
-        job_details = self._get_job_details()
+        job_summary = self._job_summary
 
         subclient_properties = job_summary['subclient']
 
@@ -265,37 +381,34 @@ class Job(object):
         else:
             self._subclient_name = None
 
-        if 'pendingReason' in job_summary:
-            if job_summary['pendingReason']:
-                self._pending_reason = job_summary['pendingReason']
-
-        if 'reasonForJobDelay' in job_details['jobDetail']['progressInfo']:
-            if job_details['jobDetail']['progressInfo']['reasonForJobDelay']:
-                self._delay_reason = job_details['jobDetail']['progressInfo']['reasonForJobDelay']
-
     @property
     def client_name(self):
         """Treats the client name as a read-only attribute."""
+        self._load_job_properties()
         return self._client_name
 
     @property
     def agent_name(self):
         """Treats the agent name as a read-only attribute."""
+        self._load_job_properties()
         return self._agent_name
 
     @property
     def backupset_name(self):
         """Treats the backupset name as a read-only attribute."""
+        self._load_job_properties()
         return self._backupset_name
 
     @property
     def instance_name(self):
         """Treats the instance name as a read-only attribute."""
+        self._load_job_properties()
         return self._instance_name
 
     @property
     def subclient_name(self):
         """Treats the subclient name as a read-only attribute."""
+        self._load_job_properties()
         return self._subclient_name
 
     @property
@@ -306,33 +419,136 @@ class Job(object):
     @property
     def job_type(self):
         """Treats the job type as a read-only attribute."""
+        self._load_job_properties()
         return self._job_type
 
     @property
     def backup_level(self):
         """Treats the backup level as a read-only attribute."""
+        self._load_job_properties()
         return self._backup_level
 
     @property
     def start_time(self):
         """Treats the start time as a read-only attribute."""
+        self._load_job_properties()
         return self._start_time
 
     @property
     def end_time(self):
         """Treats the end time as a read-only attribute."""
+        self._load_job_properties()
         return self._end_time
 
     @property
     def delay_reason(self):
-        """Treats the job delay reason as a read-only attribute."""
+        """Treats the job delay reason as a read-only attribute.
+
+            The details of the job are fetched again on each access, until the job finishes.
+        """
+        self._load_job_properties()
+
+        if self._job_details is None or not self._finished:
+            self._update_job_details(self._get_job_details())
+
         return self._delay_reason
 
+    @property
+    def status(self):
+        """Treats the current status of the job as a read-only attribute."""
+        self._load_job_properties()
+        return self._status
+
+    @property
+    def finished(self):
+        """Treats whether the job has finished or not as a read-only attribute."""
+        self._load_job_properties()
+        return self._finished
+
     @property
     def pending_reason(self):
         """Treats the job pending reason as a read-only attribute."""
+        self._load_job_properties()
         return self._pending_reason
 
+    def wait_for_completion(self, timeout=None, poll=None):
+        """Waits for the job to finish.
+
+            The status of the job is checked by the JobMonitor of the commcell, often right after
+            the job is submitted, and less often as the job keeps running, unless a fixed poll
+            interval is given.
+
+            Args:
+                timeout (int)  --  maximum number of seconds to wait
+                    default: None; wait until the job finishes
+
+                poll    (int)  --  fixed number of seconds between two checks of the job status
+                    default: None; adaptive interval
+
+            Returns:
+                bool - boolean output whether the job finished or not, within the timeout
+
+            Raises:
+                SDKException:
+                    if type of the timeout or poll argument is not a number
+
+                    if no job exists with the job id
+        """
+        if poll is not None and not isinstance(poll, (int, float)):
+            raise SDKException('JobMonitor', '101')
+
+        self._commcell_object.job_monitor.track(self, poll)
+        return self._commcell_object.job_monitor.wait(self, timeout)
+
+    def subscribe(self, callback, event_types=None):
+        """Subscribes the callback to the events of the job, seen by the JobMonitor.
+
+            Args:
+                callback    (callable)  --  function to call with the instance of the JobEvent
+
+                event_types (list)      --  types of the events to get, e.g.; ['pending']
+                    default: None; all the events
+
+            Returns:
+                int - id of the subscription, to remove it using
+                          commcell.job_monitor.unsubscribe()
+
+            Raises:
+                SDKException:
+                    if callback is not callable
+
+                    if type of the event types argument is not list
+        """
+        return self._commcell_object.job_monitor.subscribe(callback, [self], event_types)
+
+    def events(self, event_types=None, timeout=None):
+        """Yields the events of the job, seen by the JobMonitor, until the job finishes.
+
+            Args:
+                event_types (list)  --  types of the events to yield, e.g.; ['progress']
+                    default: None; all the events
+
+                timeout     (int)   --  maximum number of seconds to wait for the next event
+                    default: None; wait until the job finishes
+
+            Yields:
+                object - instance of the JobEvent class
+        """
+        return self._commcell_object.job_monitor.events([self], event_types, timeout)
+
+    def record_progress(self, capacity=720):
+        """Starts recording the progress of the job, every time the JobMonitor checks the job.
+
+            Args:
+                capacity    (int)   --  maximum number of samples to keep
+                    default: 720
+
+            Returns:
+                object - instance of the ProgressBuffer class, with the throughput and ETA
+                             of the job, and export to CSV / Parquet
+        """
+        return self._commcell_object.job_monitor.record_progress(self, capacity)
+
     def pause(self):
         """Suspend the job.
 
@@ -354,7 +570,7 @@ class Job(object):
                     )
                 )
             else:
-                self.status = str(self._get_job_summary()['status'])
+                self._update_job_status(self._get_job_summary())
         else:
             response_string = self._commcell_object._update_response_(response.text)
             raise SDKException('Response', '101', response_string)
@@ -380,7 +596,7 @@ class Job(object):
                     )
                 )
             else:
-                self.status = str(self._get_job_summary()['status'])
+                self._update_job_status(self._get_job_summary())
         else:
             response_string = self._commcell_object._update_response_(response.text)
             raise SDKException('Response', '101', response_string)
@@ -406,7 +622,7 @@ class Job(object):
                     )
                 )
             else:
-                self.status = str(self._get_job_summary()['status'])
+                self._update_job_status(self._get_job_summary())
         else:
             response_string = self._commcell_object._update_response_(response.text)
             raise SDKException('Response', '101', response_string)
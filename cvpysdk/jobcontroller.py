@@ -0,0 +1,846 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""File for listing the jobs of a commcell, client group, or client.
+
+JobController, JobRecord, and ActiveBackups are the 3 classes defined in this file.
+
+JobController:  Class for listing the active and finished jobs of the commcell page by page,
+                    using the job filter query
+
+JobRecord:      Record for the summary of a single job, with interned strings
+
+ActiveBackups:  Class for the cached view of the backup jobs running for each subclient,
+                    refreshed when older than the max age, and updated by the JobMonitor as
+                    the jobs finish
+
+The jobs are yielded as compact JobRecord instances, one page at a time, so listing the jobs
+of a large commcell keeps only a single page of the response in memory.
+
+Usage:
+    >>> for job in commcell.jobs.iter_jobs(job_types=['Backup'], category='active'):
+    ...     print(job.job_id, job.client_name, job.status)
+
+
+JobController:
+    __init__(commcell_object)   --  initialise object of the JobController class
+
+    __repr__()                  --  returns the string for the instance of the JobController class
+
+    __iter__()                  --  yields all the jobs of the commcell
+
+    _get_client_ids()           --  returns the ids of the clients to list the jobs of
+
+    _get_jobs_page()            --  gets a single page of the jobs of the client
+
+    iter_jobs()                 --  yields the jobs matching the filters, page by page
+
+    _iter_jobs()                --  yields the jobs of the clients, page by page
+
+    active_jobs()               --  yields the active jobs matching the filters
+
+    finished_jobs()             --  yields the finished jobs matching the filters
+
+    get()                       --  returns the Job instance for the given job id
+
+    _run_job_action()           --  runs the pause / resume / kill action for a single job
+
+    _run_bulk_action()          --  runs the action for all the jobs, using a pool of threads
+
+    pause()                     --  suspends all the jobs given
+
+    resume()                    --  resumes all the jobs given
+
+    kill()                      --  kills all the jobs given
+
+
+ActiveBackups:
+    __init__(job_controller,
+             max_age)           --  initialise object of the ActiveBackups class
+
+    __repr__()                  --  returns the string for the instance of the ActiveBackups class
+
+    _is_stale()                 --  checks if the view is older than the max age
+
+    _add_job()                  --  adds the job of the subclient to the maps of the view
+
+    _refresh()                  --  gets the backup jobs running for all the subclients,
+                                        if the view is stale
+
+    max_age                     --  returns the number of seconds the view is reused for
+
+    get()                       --  returns the id of the backup job running for the subclient
+
+    get_job()                   --  returns the backup job running for the subclient, after
+                                        confirming it is still running
+
+    add()                       --  records the backup job started for the subclient
+
+    discard()                   --  removes the backup job which finished from the view
+
+    invalidate()                --  discards the cached view, to get it again on next access
+
+"""
+
+from __future__ import absolute_import
+
+import threading
+import time
+
+try:
+    # Python 3 import
+    from sys import intern
+except ImportError:
+    # Python 2 has intern as a builtin
+    pass
+
+from .job import Job
+from .pool import WorkerPool
+from .inventory import InventoryRecord
+from .exception import SDKException
+
+
+def _intern(value):
+    """Returns the value as an interned string, or None if the value is empty."""
+    if not value:
+        return None
+
+    return intern(str(value))
+
+
+class JobRecord(InventoryRecord):
+    """Record for the summary of a single job of the commcell."""
+
+    __slots__ = (
+        'job_id',
+        'job_type',
+        'status',
+        'client_name',
+        'agent_name',
+        'instance_name',
+        'backupset_name',
+        'subclient_name',
+        'subclient_id',
+        'storage_policy',
+        'backup_level',
+        'start_time',
+        'end_time',
+        'duration',
+        'size',
+        'percent_complete',
+        'pending_reason',
+        'delay_reason'
+    )
+
+    @classmethod
+    def from_summary(cls, job_summary):
+        """Returns the record for the job summary received from the server.
+
+            Args:
+                job_summary (dict)  --  summary of the job
+
+            Returns:
+                object - instance of the JobRecord class
+        """
+        subclient = job_summary.get('subclient', {})
+        storage_policy = job_summary.get('storagePolicy', {})
+
+        return cls(
+            int(job_summary['jobId']),
+            _intern(job_summary.get('jobType')),
+            _intern(job_summary.get('status')),
+            _intern(subclient.get('clientName')),
+            _intern(subclient.get('appName')),
+            _intern(subclient.get('instanceName')),
+            _intern(subclient.get('backupsetName')),
+            _intern(subclient.get('subclientName')),
+            int(subclient['subclientId']) if subclient.get('subclientId') else None,
+            _intern(storage_policy.get('storagePolicyName')),
+            _intern(job_summary.get('backupLevelName')),
+            job_summary.get('jobStartTime') or None,
+            job_summary.get('jobEndTime') or job_summary.get('lastUpdateTime') or None,
+            job_summary.get('jobElapsedTime'),
+            job_summary.get('sizeOfApplication'),
+            job_summary.get('percentComplete'),
+            _intern(job_summary.get('pendingReason')),
+            _intern(job_summary.get('delayReason'))
+        )
+
+
+class JobController(object):
+    """Class for listing the jobs of the commcell, client group, or client."""
+
+    _CATEGORIES = {
+        'active': 'Active',
+        'finished': 'Finished',
+        'all': 'All'
+    }
+
+    def __init__(self, commcell_object):
+        """Initialize object of the JobController class.
+
+            Args:
+                commcell_object (object)  --  instance of the Commcell class
+
+            Returns:
+                object - instance of the JobController class
+        """
+        self._commcell_object = commcell_object
+        self._JOBS = self._commcell_object._services.GET_JOBS
+
+        self._actions = {
+            'suspend': self._commcell_object._services.SUSPEND_JOB,
+            'resume': self._commcell_object._services.RESUME_JOB,
+            'kill': self._commcell_object._services.KILL_JOB
+        }
+
+        self.active_backups = ActiveBackups(self)
+
+    def __repr__(self):
+        """Representation string for the instance of the JobController class."""
+        return "JobController class instance for Commcell: '{0}'".format(
+            self._commcell_object._headers['Host']
+        )
+
+    def __iter__(self):
+        """Yields all the jobs of the commcell, as instances of the JobRecord class."""
+        return self.iter_jobs()
+
+    def _get_client_ids(self, client, client_group):
+        """Returns the ids of the clients to list the jobs of.
+
+            Args:
+                client          (str)   --  name of the client, or None
+
+                client_group    (str)   --  name of the client group, or None
+
+            Returns:
+                list - ids of the clients, or [0] for all the clients of the commcell
+
+            Raises:
+                SDKException:
+                    if type of the client or client group argument is not string
+
+                    if no client / client group exists with the given name
+        """
+        if client is None and client_group is None:
+            return [0]
+
+        clients = self._commcell_object.clients
+
+        if client is not None:
+            if not isinstance(client, str):
+                raise SDKException('JobController', '101')
+
+            if not clients.has_client(client):
+                raise SDKException(
+                    'JobController', '102', 'No client exists with name: {0}'.format(client)
+                )
+
+            return [clients._clients[client.lower()]]
+
+        if not isinstance(client_group, str):
+            raise SDKException('JobController', '101')
+
+        client_group = self._commcell_object.client_groups.get(client_group)
+
+        return [
+            clients._clients[client_name.lower()]
+            for client_name in client_group._associated_clients
+            if clients.has_client(client_name)
+        ]
+
+    def _get_jobs_page(self, client_id, job_filter, category, lookup_time, offset, page_size):
+        """Gets a single page of the summaries of the jobs of the client.
+
+            Args:
+                client_id   (int)   --  id of the client, 0 for all the clients
+
+                job_filter  (str)   --  comma separated types of the jobs
+
+                category    (str)   --  category of the jobs: Active / Finished / All
+
+                lookup_time (int)   --  number of seconds to look back for finished jobs, or None
+
+                offset      (int)   --  number of jobs to skip
+
+                page_size   (int)   --  maximum number of jobs to get
+
+            Returns:
+                tuple - (list of job summaries, total number of jobs matching the query,
+                             or None if the response does not have the total)
+
+            Raises:
+                SDKException:
+                    if response is not success
+        """
+        url = self._JOBS % (client_id, job_filter)
+        url += '&jobCategory={0}&offset={1}&limit={2}'.format(category, offset, page_size)
+
+        if lookup_time is not None:
+            url += '&completedJobLookupTime={0}'.format(int(lookup_time))
+
+        flag, response = self._commcell_object._cvpysdk_object.make_request('GET', url)
+
+        if flag:
+            if response.json() and 'jobs' in response.json():
+                jobs = [job['jobSummary'] for job in response.json()['jobs']]
+                total = response.json().get('totalRecordsWithoutPaging')
+
+                return jobs, total
+
+            return [], None
+        else:
+            response_string = self._commcell_object._update_response_(response.text)
+            raise SDKException('Response', '101', response_string)
+
+    def iter_jobs(self,
+                  client=None,
+                  client_group=None,
+                  job_types=None,
+                  category='all',
+                  statuses=None,
+                  lookup_time=None,
+                  page_size=100):
+        """Yields the jobs matching the filters, fetching them from the server page by page.
+
+            Args:
+                client          (str)   --  name of the client to list the jobs of
+                    default: None
+
+                client_group    (str)   --  name of the client group to list the jobs of
+                    default: None; all the clients of the commcell, if client is also None
+
+                job_types       (list)  --  types of the jobs to list, e.g.; ['Backup', 'Restore']
+                    default: None; all the job types
+
+                category        (str)   --  category of the jobs to list
+
+                    Valid values are:
+
+                        active
+
+                        finished
+
+                        all
+
+                    default: all
+
+                statuses        (list)  --  statuses of the jobs to yield, e.g.; ['Pending'],
+                                                matched against the jobs of each page
+                    default: None; all the statuses
+
+                lookup_time     (int)   --  number of seconds to look back for finished jobs
+                    default: None; server default
+
+                page_size       (int)   --  number of jobs to get with each request
+                    default: 100
+
+            Yields:
+                object - instance of the JobRecord class, for each job
+
+            Raises:
+                SDKException:
+                    if type of any of the arguments is not valid
+
+                    if category is not valid
+
+                    if no client / client group exists with the given name
+
+                    if response is not success
+        """
+        if job_types is not None and not isinstance(job_types, (list, tuple, set)):
+            raise SDKException('JobController', '101')
+
+        if statuses is not None and not isinstance(statuses, (list, tuple, set)):
+            raise SDKException('JobController', '101')
+
+        if not isinstance(page_size, int) or page_size <= 0:
+            raise SDKException('JobController', '101')
+
+        if category not in self._CATEGORIES:
+            raise SDKException('JobController', '103')
+
+        client_ids = self._get_client_ids(client, client_group)
+        job_filter = ','.join(job_types or [])
+
+        if statuses is not None:
+            statuses = set(status.lower() for status in statuses)
+
+        return self._iter_jobs(
+            client_ids,
+            job_filter,
+            self._CATEGORIES[category],
+            statuses,
+            lookup_time,
+            page_size
+        )
+
+    def _iter_jobs(self, client_ids, job_filter, category, statuses, lookup_time, page_size):
+        """Yields the jobs of the clients, page by page, after the arguments were validated
+            by iter_jobs().
+        """
+        for client_id in client_ids:
+            offset = 0
+
+            while True:
+                jobs, total = self._get_jobs_page(
+                    client_id, job_filter, category, lookup_time, offset, page_size
+                )
+
+                for job_summary in jobs:
+                    if statuses is None or str(job_summary.get('status')).lower() in statuses:
+                        yield JobRecord.from_summary(job_summary)
+
+                offset += len(jobs)
+
+                # stop at a short page, as the total is not sent by all the servers, or if the
+                # server returned all the jobs at once, ignoring the limit
+                if len(jobs) != page_size or (total is not None and offset >= total):
+                    break
+
+    def active_jobs(self, client=None, client_group=None, job_types=None, page_size=100):
+        """Yields the jobs running, pending, waiting, or suspended, matching the filters.
+
+            Args:
+                client          (str)   --  name of the client to list the jobs of
+                    default: None
+
+                client_group    (str)   --  name of the client group to list the jobs of
+                    default: None
+
+                job_types       (list)  --  types of the jobs to list, e.g.; ['Backup']
+                    default: None; all the job types
+
+                page_size       (int)   --  number of jobs to get with each request
+                    default: 100
+
+            Yields:
+                object - instance of the JobRecord class, for each job
+        """
+        return self.iter_jobs(
+            client, client_group, job_types, category='active', page_size=page_size
+        )
+
+    def finished_jobs(self,
+                      client=None,
+                      client_group=None,
+                      job_types=None,
+                      lookup_time=None,
+                      page_size=100):
+        """Yields the jobs finished, in the given lookup time, matching the filters.
+
+            Args:
+                client          (str)   --  name of the client to list the jobs of
+                    default: None
+
+                client_group    (str)   --  name of the client group to list the jobs of
+                    default: None
+
+                job_types       (list)  --  types of the jobs to list, e.g.; ['Backup']
+                    default: None; all the job types
+
+                lookup_time     (int)   --  number of seconds to look back for finished jobs
+                    default: None; server default
+
+                page_size       (int)   --  number of jobs to get with each request
+                    default: 100
+
+            Yields:
+                object - instance of the JobRecord class, for each job
+        """
+        return self.iter_jobs(
+            client,
+            client_group,
+            job_types,
+            category='finished',
+            lookup_time=lookup_time,
+            page_size=page_size
+        )
+
+    def get(self, job_id):
+        """Returns the Job instance for the given job id.
+
+            Args:
+                job_id  (str / int)  --  id of the job
+
+            Returns:
+                object - instance of the Job class, fetching the job summary on first access
+        """
+        return Job(self._commcell_object, job_id)
+
+    def _run_job_action(self, action, job_id):
+        """Runs the suspend / resume / kill action for the job with the given id.
+
+            Args:
+                action  (str)   --  action to run: suspend / resume / kill
+
+                job_id  (str)   --  id of the job
+
+            Returns:
+                bool - True, if the action was run successfully
+
+            Raises:
+                SDKException:
+                    if failed to run the action for the job
+
+                    if response is not success
+        """
+        flag, response = self._commcell_object._cvpysdk_object.make_request(
+            'POST', self._actions[action] % (job_id)
+        )
+
+        if flag:
+            if response.json() and 'errors' in response.json():
+                error_list = response.json()['errors'][0]['errList'][0]
+                error_message = str(error_list['errLogMessage']).strip()
+
+                raise SDKException('Job', '102', 'Job {0} failed\nError: "{1}"'.format(
+                    action, error_message
+                ))
+
+            return True
+        else:
+            response_string = self._commcell_object._update_response_(response.text)
+            raise SDKException('Response', '101', response_string)
+
+    def _run_bulk_action(self, action, job_ids, max_workers):
+        """Runs the action for all the jobs concurrently, without creating a Job instance
+            for any of them.
+
+            Args:
+                action      (str)   --  action to run: suspend / resume / kill
+
+                job_ids     (list)  --  ids of the jobs
+
+                max_workers (int)   --  maximum number of requests to run concurrently
+
+            Returns:
+                dict - outcome of the action for each job, with the job id as key,
+                           True if the action succeeded, else the exception raised for the job
+
+            Raises:
+                SDKException:
+                    if type of the job ids argument is not list
+
+                    if any of the job ids is not an integer
+
+                    if type of the max workers argument is not int
+
+                    if max workers is not a positive value
+        """
+        if not isinstance(job_ids, (list, tuple, set)):
+            raise SDKException('JobController', '101')
+
+        try:
+            job_ids = [str(int(job_id)) for job_id in job_ids]
+        except (TypeError, ValueError):
+            raise SDKException('Job', '101')
+
+        pool = WorkerPool(max_workers)
+
+        results = pool.map(
+            lambda job_id: self._run_job_action(action, job_id), job_ids, return_exceptions=True
+        )
+
+        return dict(zip(job_ids, results))
+
+    def pause(self, job_ids, max_workers=16):
+        """Suspends all the jobs given, concurrently.
+
+            Args:
+                job_ids     (list)  --  ids of the jobs to suspend
+
+                max_workers (int)   --  maximum number of requests to run concurrently
+                    default: 16
+
+            Returns:
+                dict - outcome for each job, with the job id as key,
+                           True if the job was suspended, else the exception raised for the job
+
+            Raises:
+                SDKException:
+                    if type of the job ids argument is not list
+
+                    if any of the job ids is not an integer
+        """
+        return self._run_bulk_action('suspend', job_ids, max_workers)
+
+    def resume(self, job_ids, max_workers=16):
+        """Resumes all the jobs given, concurrently.
+
+            Args:
+                job_ids     (list)  --  ids of the jobs to resume
+
+                max_workers (int)   --  maximum number of requests to run concurrently
+                    default: 16
+
+            Returns:
+                dict - outcome for each job, with the job id as key,
+                           True if the job was resumed, else the exception raised for the job
+
+            Raises:
+                SDKException:
+                    if type of the job ids argument is not list
+
+                    if any of the job ids is not an integer
+        """
+        return self._run_bulk_action('resume', job_ids, max_workers)
+
+    def kill(self, job_ids, max_workers=16):
+        """Kills all the jobs given, concurrently.
+
+            Args:
+                job_ids     (list)  --  ids of the jobs to kill
+
+                max_workers (int)   --  maximum number of requests to run concurrently
+                    default: 16
+
+            Returns:
+                dict - outcome for each job, with the job id as key,
+                           True if the job was killed, else the exception raised for the job
+
+            Raises:
+                SDKException:
+                    if type of the job ids argument is not list
+
+                    if any of the job ids is not an integer
+        """
+        return self._run_bulk_action('kill', job_ids, max_workers)
+
+
+class ActiveBackups(object):
+    """Class for the cached view of the backup jobs running for each subclient."""
+
+    def __init__(self, job_controller, max_age=60):
+        """Initialize object of the ActiveBackups class.
+
+            Args:
+                job_controller  (object)    --  instance of the JobController class
+
+                max_age         (int)       --  number of seconds to reuse the view for,
+                                                    before getting the active jobs again
+                    default: 60
+
+            Returns:
+                object - instance of the ActiveBackups class
+        """
+        self._job_controller = job_controller
+        self._max_age = max_age
+        self._lock = threading.Lock()
+
+        # held while the active jobs are got, so that only one thread gets them at a time
+        self._refresh_lock = threading.Lock()
+
+        # job id running for each subclient, and the subclient id of each job
+        self._job_ids = {}
+        self._subclient_ids = {}
+        self._refresh_time = None
+
+        # jobs added, or discarded while the active jobs are got, to apply to the new view
+        self._changes = None
+
+    def __repr__(self):
+        """Representation string for the instance of the ActiveBackups class."""
+        return "ActiveBackups class instance of '{0}' subclients".format(len(self._job_ids))
+
+    def _is_stale(self):
+        """Checks if the view was never got, or is older than the max age.
+
+            Returns:
+                bool - boolean output whether the view is stale or not
+        """
+        return self._refresh_time is None or time.time() - self._refresh_time > self._max_age
+
+    @staticmethod
+    def _add_job(job_ids, subclient_ids, subclient_id, job_id):
+        """Adds the job running for the subclient to the maps of the view, replacing the
+            job recorded earlier for the subclient, if any.
+
+            Args:
+                job_ids         (dict)  --  job id running for each subclient
+
+                subclient_ids   (dict)  --  subclient id of each job
+
+                subclient_id    (int)   --  id of the subclient
+
+                job_id          (int)   --  id of the job running for the subclient
+        """
+        previous_job_id = job_ids.get(subclient_id)
+
+        if previous_job_id is not None:
+            subclient_ids.pop(previous_job_id, None)
+
+        job_ids[subclient_id] = job_id
+        subclient_ids[job_id] = subclient_id
+
+    def _refresh(self):
+        """Gets the backup jobs running for all the subclients of the commcell, using the
+            active jobs of the job controller, if the view is stale.
+
+            The active jobs are got without holding the lock of the view, so the lookups, and
+            the jobs added or discarded are not blocked by the requests, and the new view is
+            swapped in under the lock, along with the jobs added or discarded meanwhile.
+        """
+        with self._refresh_lock:
+            with self._lock:
+                # refreshed by another thread, while waiting for the refresh lock
+                if not self._is_stale():
+                    return
+
+                self._changes = []
+
+            try:
+                job_ids = {}
+
+                for record in self._job_controller.active_jobs(job_types=['Backup']):
+                    if record.subclient_id is not None:
+                        job_ids.setdefault(record.subclient_id, record.job_id)
+
+                subclient_ids = dict(
+                    (job_id, subclient_id) for subclient_id, job_id in job_ids.items()
+                )
+
+                with self._lock:
+                    for subclient_id, job_id in self._changes:
+                        if subclient_id is not None:
+                            self._add_job(job_ids, subclient_ids, subclient_id, job_id)
+                        elif job_ids.get(subclient_ids.get(job_id)) == job_id:
+                            del job_ids[subclient_ids.pop(job_id)]
+
+                    self._job_ids = job_ids
+                    self._subclient_ids = subclient_ids
+                    self._refresh_time = time.time()
+            finally:
+                with self._lock:
+                    self._changes = None
+
+    @property
+    def max_age(self):
+        """Treats the number of seconds the view is reused for as a property of this class."""
+        return self._max_age
+
+    @max_age.setter
+    def max_age(self, value):
+        """Sets the number of seconds to reuse the view for, before getting it again.
+
+            Raises:
+                SDKException:
+                    if type of the value is not a number
+
+                    if value is a negative number
+        """
+        if not isinstance(value, (int, float)):
+            raise SDKException('JobController', '101')
+
+        if value < 0:
+            raise SDKException('JobController', '104')
+
+        self._max_age = value
+
+    def get(self, subclient_id):
+        """Returns the id of the backup job running for the subclient, as per the view.
+
+            The view is got again, if it is older than the max age.
+            The job may have finished since the view was got, within the max age.
+
+            Args:
+                subclient_id    (str / int)     --  id of the subclient
+
+            Returns:
+                int - id of the backup job running for the subclient
+
+                None - if no backup job is running for the subclient
+        """
+        with self._lock:
+            if not self._is_stale():
+                return self._job_ids.get(int(subclient_id))
+
+        self._refresh()
+
+        with self._lock:
+            return self._job_ids.get(int(subclient_id))
+
+    def get_job(self, subclient_id):
+        """Returns the backup job running for the subclient, after confirming it is still running.
+
+            The instance of the Job class tracked by the JobMonitor is returned, if any, and the
+            status of the job is read once, unless the JobMonitor already saw it finish.
+            The job is removed from the view, if it is no longer running.
+
+            Args:
+                subclient_id    (str / int)     --  id of the subclient
+
+            Returns:
+                object - instance of the Job class, for the backup job running for the subclient
+
+                None - if no backup job is running for the subclient
+        """
+        job_id = self.get(subclient_id)
+
+        if job_id is None:
+            return None
+
+        commcell_object = self._job_controller._commcell_object
+
+        job = commcell_object.job_monitor.get_job(job_id)
+
+        if job is None:
+            job = Job(commcell_object, job_id, 'Backup')
+
+        if not job._finished and not job._invalid:
+            try:
+                job._update_job_status(job._get_job_summary())
+            except SDKException as excp:
+                if excp.exception_module != 'Job' or excp.exception_id != '104':
+                    raise excp
+
+                job._invalid = True
+
+        if job._finished or job._invalid:
+            self.discard(job_id)
+            return None
+
+        return job
+
+    def add(self, subclient_id, job_id):
+        """Records the backup job started for the subclient, until the view is got again.
+
+            Args:
+                subclient_id    (str / int)     --  id of the subclient
+
+                job_id          (str / int)     --  id of the backup job started
+        """
+        with self._lock:
+            self._add_job(self._job_ids, self._subclient_ids, int(subclient_id), int(job_id))
+
+            if self._changes is not None:
+                self._changes.append((int(subclient_id), int(job_id)))
+
+    def discard(self, job_id):
+        """Removes the backup job from the view, once it has finished.
+
+            Args:
+                job_id  (str / int)     --  id of the backup job which finished
+        """
+        job_id = int(job_id)
+
+        with self._lock:
+            subclient_id = self._subclient_ids.pop(job_id, None)
+
+            if subclient_id is not None and self._job_ids.get(subclient_id) == job_id:
+                del self._job_ids[subclient_id]
+
+            if self._changes is not None:
+                self._changes.append((None, job_id))
+
+    def invalidate(self):
+        """Discards the cached view, to get the active jobs again on next access."""
+        with self._lock:
+            self._refresh_time = None
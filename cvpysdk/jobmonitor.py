@@ -0,0 +1,986 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""File for tracking the status of all the running jobs of a commcell, using a single poller.
+
+JobMonitor: Class for polling the status of all the tracked jobs of the commcell together,
+                and waiting for the jobs to finish
+
+A single daemon thread polls the status of all the jobs being tracked. The summaries of the jobs
+are read in a batch using the job filter query, and only the jobs missing from the batch, e.g.;
+jobs which just finished, are read one at a time. The thread exits when no jobs are left to
+track, and is started again when a new job is tracked.
+
+All the instances of the Job class for the same job id are tracked together, and the status
+polled for the job is applied to each of them. The final summaries of the jobs which finished
+recently are kept, so an instance created, or waited for after its job finished, is updated
+without polling the job again.
+
+A job which is still not found on the server, some time after it started being tracked, is
+rejected as invalid, and is no longer polled. Waiting for it, or accessing its properties raises
+the SDKException.
+
+Callbacks can be subscribed to the events of the jobs, e.g.; status changed, pending, delayed,
+progress, completed, failed, or killed, and are called from the poller thread, as the changes
+are seen by the poller. The events can also be iterated using the events() generator.
+
+Every tracked job gets one final event: completed, failed, or killed when the job finishes,
+invalid when the job is rejected as invalid, or stopped when the job is untracked, or the
+monitor is stopped, before the job finished.
+
+The progress of the jobs can also be recorded, in which case the progress fields of the job
+details are sampled into a ProgressBuffer, every time the job is checked.
+
+Each job is checked at its own adaptive interval: often right after it is submitted, backing
+off as the job keeps running, and sooner again when its progress predicts that the job is
+about to finish.
+
+JobEvent:   Class for an event of a job, seen by the JobMonitor
+
+JobMonitor:
+    __init__(commcell_object,
+             min_interval,
+             max_interval)      --  initialise object of the JobMonitor class
+
+    __repr__()                  --  returns the string for the instance of the JobMonitor class
+
+    __len__()                   --  returns the number of jobs being tracked
+
+    _get_job_summaries()        --  gets the summaries of the jobs of the given types in a batch
+
+    _update_instances()         --  applies the status polled for the job to all its instances
+
+    _set_finished()             --  keeps the final summary of the job which finished,
+                                        or marks the job id as invalid
+
+    _apply_finished()           --  updates the job from the final summary of its job id
+
+    _discard_active_backups()   --  removes the jobs which finished from the active backups view
+
+    _next_interval()            --  returns the number of seconds to wait before the next
+                                        check of the job
+
+    _get_events()               --  returns the events of the job, since it was last polled
+
+    _dispatch()                 --  calls the subscribed callbacks for the events
+
+    _sample_progress()          --  adds a sample of the job details to the progress of the job
+
+    _poll()                     --  updates the status of the tracked jobs which are due
+
+    _run()                      --  polls the status of the tracked jobs, until all are finished
+
+    track()                     --  starts tracking the status of the job
+
+    untrack()                   --  stops tracking the status of the job
+
+    get_job()                   --  returns the instance of the Job class tracked for the job id
+
+    _wait()                     --  waits for any, or all of the jobs to finish
+
+    wait()                      --  waits for the job to finish
+
+    wait_any()                  --  waits for any of the jobs to finish
+
+    wait_all()                  --  waits for all the jobs to finish
+
+    subscribe()                 --  subscribes the callback to the events of the jobs
+
+    unsubscribe()               --  removes the subscription of the callback
+
+    events()                    --  yields the events of the jobs, until all of them finish
+
+    record_progress()           --  starts recording the progress of the job
+
+    get_progress()              --  returns the recorded progress of the job
+
+    stop_recording()            --  stops recording the progress of the job
+
+    stop()                      --  stops the poller, and all the jobs being tracked
+
+"""
+
+from __future__ import absolute_import
+
+import time
+
+from collections import OrderedDict
+from itertools import count
+from threading import Thread, Condition, Event, current_thread
+
+try:
+    # Python 2 import
+    from Queue import Queue, Empty
+except ImportError:
+    # Python 3 import
+    from queue import Queue, Empty
+
+from .jobprogress import ProgressBuffer
+from .exception import SDKException
+
+
+class JobEvent(object):
+    """Class for an event of a job, seen by the JobMonitor."""
+
+    STATUS_CHANGED = 'status_changed'
+    PENDING = 'pending'
+    DELAYED = 'delayed'
+    PROGRESS = 'progress'
+    COMPLETED = 'completed'
+    FAILED = 'failed'
+    KILLED = 'killed'
+    INVALID = 'invalid'
+    STOPPED = 'stopped'
+
+    # events after which no more events are sent for the job
+    FINAL_EVENTS = (COMPLETED, FAILED, KILLED, INVALID, STOPPED)
+
+    __slots__ = ('job', 'event_type', 'value', 'event_time')
+
+    def __init__(self, job, event_type, value, event_time):
+        """Initialize object of the JobEvent class.
+
+            Args:
+                job         (object)    --  instance of the Job class the event is for
+
+                event_type  (str)       --  type of the event, e.g.; JobEvent.PENDING
+
+                value       (object)    --  new status, pending reason, delay reason,
+                                                or progress percentage of the job,
+                                                or None for the invalid and stopped events
+
+                event_time  (float)     --  epoch time at which the event was seen
+
+            Returns:
+                object - instance of the JobEvent class
+        """
+        self.job = job
+        self.event_type = event_type
+        self.value = value
+        self.event_time = event_time
+
+    def __repr__(self):
+        """Representation string for the instance of the JobEvent class."""
+        return "JobEvent '{0}' for job id: '{1}', value: '{2}'".format(
+            self.event_type, self.job.job_id, self.value
+        )
+
+
+class _TrackedJob(object):
+    """Class for the polling state of a single job tracked by the JobMonitor."""
+
+    __slots__ = (
+        'job', 'instances', 'poll', 'tracked_time', 'next_check', 'status', 'pending_reason',
+        'progress'
+    )
+
+    def __init__(self, job, poll, tracked_time):
+        """Initialize the polling state of the job, to be checked right away."""
+        self.job = job
+        self.instances = [job]
+        self.poll = poll
+        self.tracked_time = tracked_time
+        self.next_check = tracked_time
+
+        # values last seen by the poller, to find the events of the job
+        self.status = None
+        self.pending_reason = None
+        self.progress = None
+
+
+class JobMonitor(object):
+    """Class for tracking the status of all the jobs of the commcell, using a single poller."""
+
+    # number of final summaries of the finished jobs to keep
+    _FINISHED_JOBS_LIMIT = 1024
+
+    # number of seconds a tracked job may be missing on the server, before it is rejected
+    _VALIDATION_PERIOD = 15
+
+    def __init__(self, commcell_object, min_interval=2, max_interval=60):
+        """Initialize object of the JobMonitor class.
+
+            Args:
+                commcell_object (object)  --  instance of the Commcell class
+
+                min_interval    (int)     --  minimum number of seconds between two checks
+                                                  of a job, used right after it is submitted
+                    default: 2
+
+                max_interval    (int)     --  maximum number of seconds between two checks
+                                                  of a long running job
+                    default: 60
+
+            Returns:
+                object - instance of the JobMonitor class
+        """
+        self._commcell_object = commcell_object
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+
+        self._jobs = {}
+        self._finished_jobs = OrderedDict()
+        self._condition = Condition()
+        self._wake_event = Event()
+        self._stop_event = None
+        self._thread = None
+
+        self._subscriptions = {}
+        self._subscription_ids = count(1)
+
+        self._progress = {}
+
+    def __repr__(self):
+        """Representation string for the instance of the JobMonitor class."""
+        return "JobMonitor class instance tracking '{0}' jobs, for Commcell: '{1}'".format(
+            len(self), self._commcell_object._headers['Host']
+        )
+
+    def __len__(self):
+        """Returns the number of jobs being tracked."""
+        with self._condition:
+            return len(self._jobs)
+
+    def _get_job_summaries(self, job_types):
+        """Gets the summaries of all the jobs of the given types, for all the clients,
+            with a single request.
+
+            Args:
+                job_types   (set)   --  types of the jobs to get, e.g.; Backup, Restore
+
+            Returns:
+                dict - summaries of the jobs, with the job id as key
+
+            Raises:
+                SDKException:
+                    if response is not success
+        """
+        flag, response = self._commcell_object._cvpysdk_object.make_request(
+            'GET', self._commcell_object._services.GET_JOBS % (0, ','.join(sorted(job_types)))
+        )
+
+        if flag:
+            job_summaries = {}
+
+            if response.json() and 'jobs' in response.json():
+                for job in response.json()['jobs']:
+                    job_summary = job['jobSummary']
+                    job_summaries[str(job_summary['jobId'])] = job_summary
+
+            return job_summaries
+        else:
+            response_string = self._commcell_object._update_response_(response.text)
+            raise SDKException('Response', '101', response_string)
+
+    @staticmethod
+    def _update_instances(tracked_job):
+        """Applies the status and details polled for the job, to all the other instances of
+            the Job class for the same job id.
+
+            Args:
+                tracked_job (object)    --  polling state of the job
+        """
+        job = tracked_job.job
+
+        for instance in tracked_job.instances:
+            if instance is job:
+                continue
+
+            instance._update_job_status(job._job_summary)
+
+            if job._job_details is not None:
+                instance._update_job_details(job._job_details)
+
+    def _set_finished(self, job_id, job_summary):
+        """Keeps the final summary of the job which finished, to update the instances of the job
+            created later, and drops the oldest summaries over the limit.
+
+            Args:
+                job_id      (str)   --  id of the job which finished
+
+                job_summary (dict)  --  final summary of the job,
+                                            or None if no job exists with the job id
+        """
+        self._finished_jobs[job_id] = job_summary
+
+        while len(self._finished_jobs) > self._FINISHED_JOBS_LIMIT:
+            self._finished_jobs.popitem(last=False)
+
+    def _apply_finished(self, job):
+        """Updates the job from the final summary kept for its job id, or marks the job as invalid,
+            if no job exists with the job id.
+
+            Args:
+                job (object)    --  instance of the Job class, with a finished job id
+        """
+        job_summary = self._finished_jobs[job.job_id]
+
+        if job_summary is None:
+            job._invalid = True
+        else:
+            job._update_job_status(job_summary)
+
+    def _discard_active_backups(self, job_ids):
+        """Removes the jobs which finished from the view of the active backups of the commcell,
+            so they are not reused for the next backup of their subclients.
+
+            Args:
+                job_ids (list)  --  ids of the jobs which finished
+        """
+        job_controller = getattr(self._commcell_object, 'jobs', None)
+
+        if job_controller is None:
+            return
+
+        for job_id in job_ids:
+            job_controller.active_backups.discard(job_id)
+
+    def _next_interval(self, tracked_job, now):
+        """Returns the number of seconds to wait before checking the status of the job again.
+
+            The interval grows with the time the job has been tracked, from the minimum interval
+            right after submission, up to the maximum interval. If the job reports its progress,
+            the remaining time is estimated from it, and the job is checked sooner, when it is
+            expected to finish before the next check.
+
+            Args:
+                tracked_job (object)    --  polling state of the job
+
+                now         (float)     --  current epoch time
+
+            Returns:
+                float - number of seconds to wait before the next check of the job
+        """
+        if tracked_job.poll:
+            return tracked_job.poll
+
+        interval = min(self._max_interval, max(
+            self._min_interval, (now - tracked_job.tracked_time) / 10.0
+        ))
+
+        job_summary = tracked_job.job._job_summary or {}
+        percent_complete = job_summary.get('percentComplete')
+        start_time = job_summary.get('jobStartTime')
+
+        if percent_complete and start_time and 0 < percent_complete < 100:
+            elapsed_time = max(0, now - start_time)
+            remaining_time = elapsed_time * (100 - percent_complete) / float(percent_complete)
+
+            # check again halfway through the predicted remaining time
+            interval = min(interval, max(self._min_interval, remaining_time / 2.0))
+
+        return interval
+
+    def _get_events(self, tracked_job, now):
+        """Returns the events of the job, by comparing its current status with the values last
+            seen by the poller, and stores the current values as the last seen.
+
+            The details of the job are read to get the delay reason, only when there are
+            subscriptions, and the job just went into a waiting or pending state.
+
+            Args:
+                tracked_job (object)    --  polling state of the job
+
+                now         (float)     --  current epoch time
+
+            Returns:
+                list - list of instances of the JobEvent class
+        """
+        job = tracked_job.job
+        job_summary = job._job_summary or {}
+        events = []
+
+        status = job._status
+        progress = job_summary.get('percentComplete')
+
+        if status != tracked_job.status:
+            events.append(JobEvent(job, JobEvent.STATUS_CHANGED, status, now))
+
+            if self._subscriptions and status and (
+                    'waiting' in status.lower() or 'pending' in status.lower()):
+                delay_reason = job._delay_reason
+
+                try:
+                    job._update_job_details(job._get_job_details())
+                except SDKException:
+                    pass
+
+                if job._delay_reason and job._delay_reason != delay_reason:
+                    events.append(JobEvent(job, JobEvent.DELAYED, job._delay_reason, now))
+
+        if (job._pending_reason and job._pending_reason != tracked_job.pending_reason and
+                status and 'pending' in status.lower()):
+            events.append(JobEvent(job, JobEvent.PENDING, job._pending_reason, now))
+
+        if progress is not None and progress != tracked_job.progress:
+            events.append(JobEvent(job, JobEvent.PROGRESS, progress, now))
+
+        if job._finished:
+            if 'killed' in status.lower():
+                events.append(JobEvent(job, JobEvent.KILLED, status, now))
+            elif 'failed' in status.lower():
+                events.append(JobEvent(job, JobEvent.FAILED, status, now))
+            else:
+                events.append(JobEvent(job, JobEvent.COMPLETED, status, now))
+
+        tracked_job.status = status
+        tracked_job.pending_reason = job._pending_reason
+        tracked_job.progress = progress
+
+        return events
+
+    @staticmethod
+    def _dispatch(events, subscriptions):
+        """Calls the subscribed callbacks for the events they are subscribed to.
+
+            Errors raised by the callbacks are ignored, so they do not stop the poller.
+
+            Args:
+                events          (list)  --  list of instances of the JobEvent class
+
+                subscriptions   (list)  --  list of (callback, job ids, event types) tuples
+        """
+        for event in events:
+            for callback, job_ids, event_types in subscriptions:
+                if job_ids is not None and event.job.job_id not in job_ids:
+                    continue
+
+                if event_types is not None and event.event_type not in event_types:
+                    continue
+
+                try:
+                    callback(event)
+                except Exception:
+                    continue
+
+    def _sample_progress(self, job, now):
+        """Gets the details of the job, and adds a sample of its progress to the buffer of the job.
+
+            Args:
+                job (object)    --  instance of the Job class
+
+                now (float)     --  current epoch time
+        """
+        try:
+            job_details = job._get_job_details()
+        except SDKException:
+            return
+
+        job._update_job_details(job_details)
+
+        progress = self._progress.get(job.job_id)
+
+        if progress is not None:
+            progress.append_details(job_details, now)
+
+    def _poll(self):
+        """Updates the status of all the tracked jobs which are due for a check, calls the
+            subscribed callbacks for their events, and stops tracking the jobs which have finished.
+
+            The summaries of the jobs are read in a single batch for the job types of the jobs
+            due, and the jobs due which are missing from the batch are read one at a time.
+            Jobs not yet due are updated as well, if they are present in the batch.
+        """
+        now = time.time()
+
+        with self._condition:
+            tracked_jobs = list(self._jobs.values())
+
+        due_jobs = [tracked_job for tracked_job in tracked_jobs if tracked_job.next_check <= now]
+
+        if not due_jobs:
+            return
+
+        job_types = set(
+            tracked_job.job._job_type for tracked_job in due_jobs if tracked_job.job._job_type
+        )
+
+        try:
+            job_summaries = self._get_job_summaries(job_types) if job_types else {}
+        except SDKException:
+            job_summaries = {}
+
+        polled_jobs = []
+        invalid_jobs = []
+
+        for tracked_job in tracked_jobs:
+            job = tracked_job.job
+            is_due = tracked_job.next_check <= now
+
+            if is_due:
+                tracked_job.next_check = now + self._next_interval(tracked_job, now)
+
+            try:
+                if job.job_id in job_summaries:
+                    job._update_job_status(job_summaries[job.job_id])
+                elif is_due:
+                    job._update_job_status(job._get_job_summary())
+                else:
+                    continue
+            except SDKException as excp:
+                if (excp.exception_module == 'Job' and excp.exception_id == '104' and
+                        now - tracked_job.tracked_time >= self._VALIDATION_PERIOD):
+                    invalid_jobs.append(tracked_job)
+
+                # keep the last known status, and try again on the next check
+                continue
+
+            if is_due and job.job_id in self._progress:
+                self._sample_progress(job, now)
+
+            polled_jobs.append(tracked_job)
+
+        events = []
+
+        for tracked_job in polled_jobs:
+            events.extend(self._get_events(tracked_job, now))
+
+        finished_job_ids = []
+
+        with self._condition:
+            for tracked_job in polled_jobs:
+                self._update_instances(tracked_job)
+
+                if tracked_job.job._finished:
+                    self._set_finished(tracked_job.job.job_id, tracked_job.job._job_summary)
+                    self._jobs.pop(tracked_job.job.job_id, None)
+                    finished_job_ids.append(tracked_job.job.job_id)
+
+            for tracked_job in invalid_jobs:
+                for instance in tracked_job.instances:
+                    instance._invalid = True
+
+                events.append(JobEvent(tracked_job.job, JobEvent.INVALID, None, now))
+
+                self._set_finished(tracked_job.job.job_id, None)
+                self._jobs.pop(tracked_job.job.job_id, None)
+                finished_job_ids.append(tracked_job.job.job_id)
+
+            subscriptions = list(self._subscriptions.values())
+            self._condition.notify_all()
+
+        self._discard_active_backups(finished_job_ids)
+        self._dispatch(events, subscriptions)
+
+    def _run(self, stop_event):
+        """Polls the status of the tracked jobs as they are due,
+            until all the jobs have finished, or the monitor is stopped.
+
+            Args:
+                stop_event  (object)    --  event set to stop this poller
+        """
+        while not stop_event.is_set():
+            self._poll()
+
+            with self._condition:
+                if not self._jobs:
+                    if self._thread is current_thread():
+                        self._thread = None
+                    return
+
+                self._wake_event.clear()
+
+                next_check = min(tracked_job.next_check for tracked_job in self._jobs.values())
+
+            self._wake_event.wait(max(0, next_check - time.time()))
+
+    def track(self, job, poll=None):
+        """Starts tracking the status of the job, and starts the poller if not running.
+
+            The job is updated from the final summary of the job, without starting the poller,
+            if another instance of the Job class for the same job id has already finished.
+
+            Args:
+                job     (object)  --  instance of the Job class to track
+
+                poll    (int)     --  fixed number of seconds between two checks of the job
+                    default: None; adaptive interval
+        """
+        if job._finished or job._invalid:
+            return
+
+        with self._condition:
+            if job.job_id in self._finished_jobs:
+                self._apply_finished(job)
+                return
+
+            tracked_job = self._jobs.get(job.job_id)
+
+            if tracked_job is None:
+                self._jobs[job.job_id] = _TrackedJob(job, poll, time.time())
+            else:
+                if not any(instance is job for instance in tracked_job.instances):
+                    tracked_job.instances.append(job)
+
+                if poll:
+                    tracked_job.poll = poll
+                    tracked_job.next_check = min(tracked_job.next_check, time.time() + poll)
+
+            self._wake_event.set()
+
+            if self._thread is None:
+                self._stop_event = Event()
+                self._thread = Thread(target=self._run, args=(self._stop_event,))
+                self._thread.daemon = True
+                self._thread.start()
+
+    def untrack(self, job):
+        """Stops tracking the status of the job, and sends the stopped event for the job,
+            if it was being tracked.
+
+            Args:
+                job (object)  --  instance of the Job class to stop tracking
+        """
+        with self._condition:
+            tracked_job = self._jobs.pop(job.job_id, None)
+            subscriptions = list(self._subscriptions.values())
+            self._condition.notify_all()
+
+        if tracked_job is not None:
+            self._dispatch(
+                [JobEvent(tracked_job.job, JobEvent.STOPPED, None, time.time())], subscriptions
+            )
+
+    def get_job(self, job_id):
+        """Returns the instance of the Job class tracked for the job id.
+
+            Args:
+                job_id  (str / int)     --  id of the job
+
+            Returns:
+                object - instance of the Job class, first tracked for the job id
+
+                None - if no job is being tracked with the job id
+        """
+        with self._condition:
+            tracked_job = self._jobs.get(str(job_id))
+
+            if tracked_job is None:
+                return None
+
+            return tracked_job.job
+
+    def _wait(self, jobs, timeout, wait_for_all):
+        """Waits for any, or all of the jobs to finish.
+
+            Args:
+                jobs            (list)  --  list of instances of the Job class to wait for
+
+                timeout         (int)   --  maximum number of seconds to wait, or None
+
+                wait_for_all    (bool)  --  whether to wait for all the jobs, or any job
+
+            Returns:
+                list - list of the jobs finished, when the wait ended
+
+            Raises:
+                SDKException:
+                    if type of the jobs argument is not list
+
+                    if type of the timeout argument is not a number
+
+                    if no job exists with the id of any of the jobs
+        """
+        if not isinstance(jobs, (list, tuple)):
+            raise SDKException('JobMonitor', '101')
+
+        if timeout is not None and not isinstance(timeout, (int, float)):
+            raise SDKException('JobMonitor', '101')
+
+        end_time = None if timeout is None else time.time() + timeout
+
+        for job in jobs:
+            self.track(job)
+
+        with self._condition:
+            while True:
+                for job in jobs:
+                    # finished with the status polled for another instance of the same job
+                    if not job._finished and job.job_id in self._finished_jobs:
+                        self._apply_finished(job)
+
+                    if job._invalid:
+                        raise SDKException('Job', '103', 'Job id: {0}'.format(job.job_id))
+
+                finished_jobs = [job for job in jobs if job._finished]
+
+                if len(finished_jobs) == len(jobs) or (finished_jobs and not wait_for_all):
+                    return finished_jobs
+
+                for job in jobs:
+                    if not job._finished and job.job_id not in self._jobs:
+                        # the job was untracked, or the monitor was stopped
+                        return finished_jobs
+
+                if end_time is None:
+                    self._condition.wait(self._max_interval)
+                else:
+                    remaining = end_time - time.time()
+
+                    if remaining <= 0:
+                        return finished_jobs
+
+                    self._condition.wait(min(remaining, self._max_interval))
+
+    def wait(self, job, timeout=None):
+        """Waits for the job to finish.
+
+            Args:
+                job     (object)  --  instance of the Job class to wait for
+
+                timeout (int)     --  maximum number of seconds to wait
+                    default: None; wait until the job finishes
+
+            Returns:
+                bool - boolean output whether the job finished or not, within the timeout
+
+            Raises:
+                SDKException:
+                    if no job exists with the job id
+        """
+        return self.wait_all([job], timeout)
+
+    def wait_any(self, jobs, timeout=None):
+        """Waits for any of the jobs to finish.
+
+            Args:
+                jobs    (list)    --  list of instances of the Job class to wait for
+
+                timeout (int)     --  maximum number of seconds to wait
+                    default: None; wait until any of the jobs finishes
+
+            Returns:
+                object - instance of the Job class, which finished first in the list
+
+                None   - if none of the jobs finished within the timeout
+
+            Raises:
+                SDKException:
+                    if type of the jobs argument is not list
+
+                    if type of the timeout argument is not a number
+
+                    if no job exists with the id of any of the jobs
+        """
+        finished_jobs = self._wait(jobs, timeout, False)
+
+        if finished_jobs:
+            return finished_jobs[0]
+
+        return None
+
+    def wait_all(self, jobs, timeout=None):
+        """Waits for all the jobs to finish.
+
+            Args:
+                jobs    (list)    --  list of instances of the Job class to wait for
+
+                timeout (int)     --  maximum number of seconds to wait
+                    default: None; wait until all the jobs finish
+
+            Returns:
+                bool - boolean output whether all the jobs finished or not, within the timeout
+
+            Raises:
+                SDKException:
+                    if type of the jobs argument is not list
+
+                    if type of the timeout argument is not a number
+
+                    if no job exists with the id of any of the jobs
+        """
+        return len(self._wait(jobs, timeout, True)) == len(jobs)
+
+    def subscribe(self, callback, jobs=None, event_types=None):
+        """Subscribes the callback to the events of the jobs, and starts tracking the jobs.
+
+            The callback is called from the poller thread with the JobEvent, and should return
+            quickly, as the other jobs are not polled while it runs.
+
+            Args:
+                callback    (callable)  --  function to call with the instance of the JobEvent
+
+                jobs        (list)      --  list of instances of the Job class to get events for
+                    default: None; all the jobs tracked by the monitor
+
+                event_types (list)      --  types of the events to get, e.g.; [JobEvent.PENDING]
+                    default: None; all the events
+
+            Returns:
+                int - id of the subscription, to remove it using unsubscribe()
+
+            Raises:
+                SDKException:
+                    if callback is not callable
+
+                    if type of the jobs or event types argument is not list
+        """
+        if not callable(callback):
+            raise SDKException('JobMonitor', '101')
+
+        if jobs is not None and not isinstance(jobs, (list, tuple)):
+            raise SDKException('JobMonitor', '101')
+
+        if event_types is not None and not isinstance(event_types, (list, tuple, set)):
+            raise SDKException('JobMonitor', '101')
+
+        job_ids = None if jobs is None else frozenset(job.job_id for job in jobs)
+        event_types = None if event_types is None else frozenset(event_types)
+
+        with self._condition:
+            subscription_id = next(self._subscription_ids)
+            self._subscriptions[subscription_id] = (callback, job_ids, event_types)
+
+        for job in jobs or []:
+            self.track(job)
+
+        return subscription_id
+
+    def unsubscribe(self, subscription_id):
+        """Removes the subscription with the given id.
+
+            Args:
+                subscription_id (int)  --  id of the subscription, returned by subscribe()
+        """
+        with self._condition:
+            self._subscriptions.pop(subscription_id, None)
+
+    def events(self, jobs=None, event_types=None, timeout=None):
+        """Yields the events of the jobs, as they are seen by the poller.
+
+            Args:
+                jobs        (list)  --  list of instances of the Job class to get events for
+                    default: None; all the jobs tracked by the monitor, without ever stopping
+
+                event_types (list)  --  types of the events to yield
+                    default: None; all the events
+
+                timeout     (int)   --  maximum number of seconds to wait for the next event
+                    default: None; wait until all the jobs finish
+
+            Yields:
+                object - instance of the JobEvent class
+
+            Raises:
+                SDKException:
+                    if type of the jobs or event types argument is not list
+        """
+        if event_types is not None and not isinstance(event_types, (list, tuple, set)):
+            raise SDKException('JobMonitor', '101')
+
+        queue = Queue()
+        subscription_id = self.subscribe(queue.put, jobs)
+
+        try:
+            running_jobs = None
+
+            if jobs is not None:
+                # jobs no longer tracked have finished, and will not have any more events
+                with self._condition:
+                    running_jobs = set(job.job_id for job in jobs if job.job_id in self._jobs)
+
+            while running_jobs is None or running_jobs:
+                try:
+                    event = queue.get(timeout=self._max_interval if timeout is None else timeout)
+                except Empty:
+                    if timeout is not None:
+                        return
+
+                    if running_jobs is not None:
+                        # jobs untracked, or stopped without finishing
+                        with self._condition:
+                            running_jobs.intersection_update(self._jobs)
+
+                    continue
+
+                if event.event_type in JobEvent.FINAL_EVENTS:
+                    if running_jobs is not None:
+                        running_jobs.discard(event.job.job_id)
+
+                if event_types is None or event.event_type in event_types:
+                    yield event
+        finally:
+            self.unsubscribe(subscription_id)
+
+    def record_progress(self, job, capacity=720):
+        """Starts recording the progress of the job, every time the job is checked.
+
+            Recording the progress costs a job details request for every check of the job.
+
+            Args:
+                job         (object)    --  instance of the Job class
+
+                capacity    (int)       --  maximum number of samples to keep for the job
+                    default: 720
+
+            Returns:
+                object - instance of the ProgressBuffer class, with the samples of the job
+
+            Raises:
+                SDKException:
+                    if type of the capacity argument is not int
+
+                    if capacity is not a positive value
+        """
+        with self._condition:
+            if job.job_id not in self._progress:
+                self._progress[job.job_id] = ProgressBuffer(capacity)
+
+            progress = self._progress[job.job_id]
+
+        self.track(job)
+
+        return progress
+
+    def get_progress(self, job):
+        """Returns the recorded progress of the job.
+
+            Args:
+                job (object)    --  instance of the Job class
+
+            Returns:
+                object - instance of the ProgressBuffer class, or None if not recorded
+        """
+        with self._condition:
+            return self._progress.get(job.job_id)
+
+    def stop_recording(self, job):
+        """Stops recording the progress of the job, and releases the recorded samples.
+
+            Args:
+                job (object)    --  instance of the Job class
+
+            Returns:
+                object - instance of the ProgressBuffer class, or None if not recorded
+        """
+        with self._condition:
+            return self._progress.pop(job.job_id, None)
+
+    def stop(self):
+        """Stops the poller, and all the jobs being tracked, and sends the stopped event for
+            each of the jobs.
+        """
+        with self._condition:
+            if self._stop_event is not None:
+                self._stop_event.set()
+
+            now = time.time()
+            events = [
+                JobEvent(tracked_job.job, JobEvent.STOPPED, None, now)
+                for tracked_job in self._jobs.values()
+            ]
+            subscriptions = list(self._subscriptions.values())
+
+            self._jobs.clear()
+            self._finished_jobs.clear()
+            self._thread = None
+            self._wake_event.set()
+            self._condition.notify_all()
+
+        self._dispatch(events, subscriptions)
@@ -0,0 +1,347 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""File for recording the progress of a job as a time series.
+
+ProgressBuffer: Class for a fixed size ring buffer of the progress samples of a job,
+                    stored in compact arrays, with the rolling throughput and the ETA
+
+The JobMonitor samples the progress fields of the job details into the buffer, every time it
+checks a job whose progress is being recorded, e.g.:
+
+    >>> progress = commcell.job_monitor.record_progress(job)
+    >>> job.wait_for_completion()
+    >>> progress.throughput(), progress.eta()
+    >>> progress.to_csv('/tmp/job_progress.csv')
+
+
+ProgressBuffer:
+    __init__(capacity)          --  initialise object of the ProgressBuffer class
+
+    __repr__()                  --  returns the string for the instance of the ProgressBuffer class
+
+    __len__()                   --  returns the number of samples in the buffer
+
+    __iter__()                  --  yields the samples in the buffer, oldest first
+
+    _phase_code()               --  returns the code of the phase name, stored in the buffer
+
+    _window()                   --  returns the first and last samples in the time window
+
+    append()                    --  adds a sample to the buffer, replacing the oldest if full
+
+    append_details()            --  adds a sample from the job details received from the server
+
+    throughput()                --  returns the rolling throughput over the time window
+
+    eta()                       --  returns the estimated number of seconds to completion
+
+    to_csv()                    --  writes the samples to a CSV file
+
+    to_parquet()                --  writes the samples to a Parquet file, using pyarrow
+
+"""
+
+from __future__ import absolute_import
+
+import csv
+import math
+
+from array import array
+from threading import Lock
+
+from .exception import SDKException
+
+
+class ProgressBuffer(object):
+    """Class for a fixed size ring buffer of the progress samples of a job."""
+
+    COLUMNS = ('sample_time', 'percent_complete', 'data_transferred', 'throughput', 'phase')
+
+    def __init__(self, capacity=720):
+        """Initialize object of the ProgressBuffer class.
+
+            Args:
+                capacity    (int)   --  maximum number of samples to keep, the oldest samples
+                                            are replaced once the buffer is full
+                    default: 720
+
+            Returns:
+                object - instance of the ProgressBuffer class
+
+            Raises:
+                SDKException:
+                    if type of the capacity argument is not int
+
+                    if capacity is not a positive value
+        """
+        if not isinstance(capacity, int):
+            raise SDKException('JobProgress', '101')
+
+        if capacity <= 0:
+            raise SDKException('JobProgress', '102')
+
+        self._capacity = capacity
+        self._start = 0
+        self._count = 0
+        self._lock = Lock()
+
+        nan = float('nan')
+
+        self._sample_time = array('d', [nan]) * capacity
+        self._percent_complete = array('d', [nan]) * capacity
+        self._data_transferred = array('d', [nan]) * capacity
+        self._throughput = array('d', [nan]) * capacity
+        self._phase = array('i', [-1]) * capacity
+
+        self._phases = []
+        self._phase_codes = {}
+
+    def __repr__(self):
+        """Representation string for the instance of the ProgressBuffer class."""
+        return "ProgressBuffer class instance with '{0}' of '{1}' samples".format(
+            self._count, self._capacity
+        )
+
+    def __len__(self):
+        """Returns the number of samples in the buffer."""
+        return self._count
+
+    def __iter__(self):
+        """Yields the samples in the buffer, oldest first.
+
+            Yields:
+                tuple - (sample_time, percent_complete, data_transferred, throughput, phase),
+                            with None for the values not reported by the server
+        """
+        with self._lock:
+            indexes = [
+                (self._start + offset) % self._capacity for offset in range(self._count)
+            ]
+            samples = []
+
+            for index in indexes:
+                phase = self._phase[index]
+
+                samples.append(tuple(
+                    None if math.isnan(value) else value for value in (
+                        self._sample_time[index],
+                        self._percent_complete[index],
+                        self._data_transferred[index],
+                        self._throughput[index]
+                    )
+                ) + (self._phases[phase] if phase >= 0 else None, ))
+
+        return iter(samples)
+
+    def _phase_code(self, phase):
+        """Returns the code of the phase name, adding it to the names of the phases if new.
+
+            Args:
+                phase   (str)   --  name of the phase of the job, or None
+
+            Returns:
+                int - code of the phase, -1 for None
+        """
+        if phase is None:
+            return -1
+
+        phase = str(phase)
+
+        if phase not in self._phase_codes:
+            self._phase_codes[phase] = len(self._phases)
+            self._phases.append(phase)
+
+        return self._phase_codes[phase]
+
+    def append(self,
+               sample_time,
+               percent_complete=None,
+               data_transferred=None,
+               throughput=None,
+               phase=None):
+        """Adds a sample to the buffer, replacing the oldest sample, if the buffer is full.
+
+            Args:
+                sample_time         (float) --  epoch time of the sample
+
+                percent_complete    (float) --  percentage of the job completed
+
+                data_transferred    (float) --  number of bytes transferred by the job
+
+                throughput          (float) --  throughput reported by the server
+
+                phase               (str)   --  name of the current phase of the job
+        """
+        def value(number):
+            """Returns the number as a float, NaN if it is missing."""
+            return float('nan') if number is None else float(number)
+
+        with self._lock:
+            if self._count < self._capacity:
+                index = (self._start + self._count) % self._capacity
+                self._count += 1
+            else:
+                index = self._start
+                self._start = (self._start + 1) % self._capacity
+
+            self._sample_time[index] = float(sample_time)
+            self._percent_complete[index] = value(percent_complete)
+            self._data_transferred[index] = value(data_transferred)
+            self._throughput[index] = value(throughput)
+            self._phase[index] = self._phase_code(phase)
+
+    def append_details(self, job_details, sample_time):
+        """Adds a sample from the progress fields of the job details received from the server.
+
+            Args:
+                job_details (dict)  --  detailed properties of the job
+
+                sample_time (float) --  epoch time at which the details were received
+        """
+        job_detail = job_details.get('jobDetail', {})
+        progress_info = job_detail.get('progressInfo', {})
+        detail_info = job_detail.get('detailInfo', {})
+
+        def first(dictionary, *keys):
+            """Returns the value of the first key present in the dictionary."""
+            for key in keys:
+                if dictionary.get(key) is not None:
+                    return dictionary[key]
+
+            return None
+
+        self.append(
+            sample_time,
+            first(progress_info, 'percentComplete'),
+            first(detail_info, 'sizeOfApplication', 'compressedBytes', 'sizeOfMediaOnDisk'),
+            first(detail_info, 'throughPut', 'throughput'),
+            first(progress_info, 'currentPhaseName', 'currentPhase')
+        )
+
+    def _window(self, column, window):
+        """Returns the first and the last samples of the column, which have a value,
+            within the last window seconds.
+
+            Args:
+                column  (array) --  column of the buffer to get the values of
+
+                window  (float) --  number of seconds to look back from the last sample
+
+            Returns:
+                tuple - ((first time, first value), (last time, last value)),
+                            or None if less than 2 samples have a value
+        """
+        with self._lock:
+            samples = []
+
+            for offset in range(self._count - 1, -1, -1):
+                index = (self._start + offset) % self._capacity
+
+                if math.isnan(column[index]):
+                    continue
+
+                if samples and samples[0][0] - self._sample_time[index] > window:
+                    break
+
+                samples.append((self._sample_time[index], column[index]))
+
+        if len(samples) < 2 or samples[0][0] == samples[-1][0]:
+            return None
+
+        return samples[-1], samples[0]
+
+    def throughput(self, window=300):
+        """Returns the rolling throughput of the job, over the last window seconds.
+
+            The throughput is computed from the data transferred only. The throughput reported
+            by the server is in the unit shown by the CommCell console, and not bytes per
+            second, so it is kept in the samples, but is not used here.
+
+            Args:
+                window  (float) --  number of seconds to compute the throughput over
+                    default: 300
+
+            Returns:
+                float - bytes transferred per second
+
+                None  - if there are not enough samples of the data transferred
+        """
+        samples = self._window(self._data_transferred, window)
+
+        if samples is not None:
+            (first_time, first_value), (last_time, last_value) = samples
+            return (last_value - first_value) / (last_time - first_time)
+
+        return None
+
+    def eta(self, window=300):
+        """Returns the estimated number of seconds until the job completes, based on the rate
+            at which the percent complete grew over the last window seconds.
+
+            Args:
+                window  (float) --  number of seconds to compute the rate over
+                    default: 300
+
+            Returns:
+                float - estimated number of seconds to completion
+
+                None  - if there are not enough samples, or the job made no progress
+        """
+        samples = self._window(self._percent_complete, window)
+
+        if samples is None:
+            return None
+
+        (first_time, first_value), (last_time, last_value) = samples
+        rate = (last_value - first_value) / (last_time - first_time)
+
+        if rate <= 0:
+            return None
+
+        return max(0.0, (100 - last_value) / rate)
+
+    def to_csv(self, file_path):
+        """Writes all the samples in the buffer to a CSV file, with a header row.
+
+            Args:
+                file_path   (str)   --  path of the CSV file to write
+        """
+        with open(file_path, 'w') as csv_file:
+            writer = csv.writer(csv_file, lineterminator='\n')
+            writer.writerow(self.COLUMNS)
+
+            for sample in self:
+                writer.writerow(['' if value is None else value for value in sample])
+
+    def to_parquet(self, file_path):
+        """Writes all the samples in the buffer to a Parquet file.
+
+            Args:
+                file_path   (str)   --  path of the Parquet file to write
+
+            Raises:
+                SDKException:
+                    if pyarrow is not installed
+        """
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise SDKException('JobProgress', '103')
+
+        samples = list(self)
+
+        table = pyarrow.Table.from_arrays(
+            [pyarrow.array([sample[index] for sample in samples])
+             for index in range(len(self.COLUMNS))],
+            names=list(self.COLUMNS)
+        )
+
+        pyarrow.parquet.write_table(table, file_path)
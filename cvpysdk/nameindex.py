@@ -0,0 +1,245 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""File for searching the names of the entities of a collection, using a sorted index.
+
+NameIndex: Class for searching a set of names by prefix, glob pattern, or regular expression
+
+The names are kept in a sorted list, and every search first narrows the list down to the range
+of names starting with the literal prefix of the pattern using binary search, so a search costs
+O(log n + k) for patterns starting with a literal prefix.
+
+NameIndex:
+    __init__(names)             --  initialise object of the NameIndex class for the given names
+
+    __repr__()                  --  returns the string for the instance of the NameIndex class
+
+    __len__()                   --  returns the number of names in the index
+
+    __contains__()              --  checks if the given name exists in the index
+
+    _range()                    --  returns the names starting with the given prefix
+
+    _glob_prefix()              --  returns the literal prefix of the glob pattern
+
+    _regex_prefix()             --  returns the literal prefix of the regular expression
+
+    prefix()                    --  returns the names starting with the given prefix
+
+    glob()                      --  returns the names matching the given glob pattern
+
+    regex()                     --  returns the names matching the given regular expression
+
+    search()                    --  returns the names matching the pattern for the search type
+
+"""
+
+from __future__ import absolute_import
+
+import re
+
+from bisect import bisect_left
+from fnmatch import fnmatchcase
+
+from .exception import SDKException
+
+
+class NameIndex(object):
+    """Class for searching a set of names by prefix, glob pattern, or regular expression."""
+
+    _GLOB_CHARACTERS = '*?['
+
+    _REGEX_CHARACTERS = '.^$*+?{}[]\\|()'
+
+    def __init__(self, names):
+        """Initialize the NameIndex object for the given names.
+
+            Names are stored in lower case, same as the collections of the SDK.
+
+            Args:
+                names   (iterable)  --  names to add to the index
+
+            Returns:
+                object - instance of the NameIndex class
+        """
+        self._names = sorted(set(str(name).lower() for name in names))
+
+    def __repr__(self):
+        """Representation string for the instance of the NameIndex class."""
+        return "NameIndex class instance with {0} names".format(len(self._names))
+
+    def __len__(self):
+        """Returns the number of names in the index."""
+        return len(self._names)
+
+    def __contains__(self, name):
+        """Checks if the given name exists in the index."""
+        name = str(name).lower()
+        index = bisect_left(self._names, name)
+        return index < len(self._names) and self._names[index] == name
+
+    def _range(self, prefix):
+        """Returns the names starting with the given prefix, using binary search.
+
+            Args:
+                prefix  (str)   --  prefix of the names
+
+            Returns:
+                list - names starting with the prefix, in sorted order
+        """
+        start = bisect_left(self._names, prefix)
+
+        if not prefix:
+            return self._names[start:]
+
+        end = start
+        while end < len(self._names) and self._names[end].startswith(prefix):
+            end += 1
+
+        return self._names[start:end]
+
+    def _glob_prefix(self, pattern):
+        """Returns the literal characters of the glob pattern before the first wildcard."""
+        for index, character in enumerate(pattern):
+            if character in self._GLOB_CHARACTERS:
+                return pattern[:index]
+
+        return pattern
+
+    def _regex_prefix(self, pattern):
+        """Returns the literal prefix of the regular expression, if it is anchored to the start.
+
+            An empty prefix is returned, if the expression is not anchored, or has an alternation,
+            in which case all the names are checked against the expression.
+        """
+        if not pattern.startswith('^') or '|' in pattern:
+            return ''
+
+        prefix = ''
+
+        for index, character in enumerate(pattern[1:], 1):
+            if character in self._REGEX_CHARACTERS:
+                # the last literal is optional, if followed by a quantifier
+                if character in '*?{':
+                    prefix = prefix[:-1]
+                break
+
+            prefix += character
+
+        return prefix
+
+    def prefix(self, prefix):
+        """Returns the names starting with the given prefix.
+
+            Args:
+                prefix  (str)   --  prefix of the names to search
+
+            Returns:
+                list - names starting with the prefix, in sorted order
+
+            Raises:
+                SDKException:
+                    if type of the prefix argument is not string
+        """
+        if not isinstance(prefix, str):
+            raise SDKException('NameIndex', '101')
+
+        return self._range(prefix.lower())
+
+    def glob(self, pattern):
+        """Returns the names matching the given glob pattern, e.g. `sql-prod-*`.
+
+            Args:
+                pattern (str)   --  shell style wildcard pattern to match the names with
+
+            Returns:
+                list - names matching the pattern, in sorted order
+
+            Raises:
+                SDKException:
+                    if type of the pattern argument is not string
+        """
+        if not isinstance(pattern, str):
+            raise SDKException('NameIndex', '101')
+
+        pattern = pattern.lower()
+        names = self._range(self._glob_prefix(pattern))
+
+        return [name for name in names if fnmatchcase(name, pattern)]
+
+    def regex(self, pattern):
+        """Returns the names matching the given regular expression.
+
+            The expression is searched anywhere in the name, and is matched case insensitively.
+
+            Args:
+                pattern (str)   --  regular expression to match the names with
+
+            Returns:
+                list - names matching the expression, in sorted order
+
+            Raises:
+                SDKException:
+                    if type of the pattern argument is not string
+
+                    if the regular expression is not valid
+        """
+        if not isinstance(pattern, str):
+            raise SDKException('NameIndex', '101')
+
+        try:
+            expression = re.compile(pattern, re.IGNORECASE)
+        except re.error as excp:
+            raise SDKException(
+                'NameIndex', '103', 'Invalid regular expression: {0}'.format(excp)
+            )
+
+        names = self._range(self._regex_prefix(pattern.lower()))
+
+        return [name for name in names if expression.search(name)]
+
+    def search(self, pattern, search_type='glob'):
+        """Returns the names matching the pattern, for the given search type.
+
+            Args:
+                pattern     (str)   --  prefix, glob pattern, or regular expression to search
+
+                search_type (str)   --  type of the search to run
+
+                    Valid values are:
+
+                        prefix
+
+                        glob
+
+                        regex
+
+                    default: glob
+
+            Returns:
+                list - names matching the pattern, in sorted order
+
+            Raises:
+                SDKException:
+                    if type of the pattern argument is not string
+
+                    if search type is not valid
+
+                    if the regular expression is not valid
+        """
+        search_types = {
+            'prefix': self.prefix,
+            'glob': self.glob,
+            'regex': self.regex
+        }
+
+        if search_type not in search_types:
+            raise SDKException('NameIndex', '102')
+
+        return search_types[search_type](pattern)
@@ -0,0 +1,171 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""File for running operations concurrently with a bounded number of threads.
+
+WorkerPool: Class for running a function over a list of items, using a bounded pool of threads
+
+WorkerPool:
+    __init__(max_workers,
+             stagger)       --  initialise object of the WorkerPool class
+
+    __repr__()              --  returns the string for the instance of the WorkerPool class
+
+    _pace()                 --  waits until the next item is allowed to start, as per the stagger
+
+    _worker()               --  runs the function for the items in the queue, until it is empty
+
+    map()                   --  runs the function for all the items, and returns the results
+                                    in the same order as the items
+
+"""
+
+from __future__ import absolute_import
+
+import time
+
+from threading import Thread, Lock
+
+try:
+    # Python 2 import
+    from Queue import Queue, Empty
+except ImportError:
+    # Python 3 import
+    from queue import Queue, Empty
+
+from .exception import SDKException
+
+
+class WorkerPool(object):
+    """Class for running a function over a list of items, using a bounded pool of threads."""
+
+    def __init__(self, max_workers=8, stagger=0):
+        """Initialize the WorkerPool class instance.
+
+            Args:
+                max_workers (int)   --  maximum number of items to process concurrently
+                    default: 8
+
+                stagger     (float) --  minimum number of seconds between the start of
+                                            two consecutive items, to pace the requests
+                    default: 0
+
+            Returns:
+                object - instance of the WorkerPool class
+
+            Raises:
+                SDKException:
+                    if type of the max workers argument is not int
+
+                    if max workers is not a positive value
+
+                    if stagger is a negative value
+        """
+        if not (isinstance(max_workers, int) and isinstance(stagger, (int, float))):
+            raise SDKException('WorkerPool', '101')
+
+        if max_workers <= 0:
+            raise SDKException('WorkerPool', '102')
+
+        if stagger < 0:
+            raise SDKException('WorkerPool', '103')
+
+        self._max_workers = max_workers
+        self._stagger = stagger
+        self._next_start = 0
+        self._lock = Lock()
+
+    def __repr__(self):
+        """Representation string for the instance of the WorkerPool class."""
+        return "WorkerPool class instance with max workers: '{0}'".format(self._max_workers)
+
+    def _pace(self):
+        """Waits until the next item is allowed to start, so that consecutive items start
+            at least stagger seconds apart, across all the workers.
+        """
+        if not self._stagger:
+            return
+
+        with self._lock:
+            now = time.time()
+            start = max(now, self._next_start)
+            self._next_start = start + self._stagger
+
+        if start > now:
+            time.sleep(start - now)
+
+    def _worker(self, function, queue, results):
+        """Runs the function for the items in the queue, until the queue is empty.
+
+            The exception raised for an item, if any, is stored as the result of that item.
+
+            Args:
+                function  (function)  --  function to run for each item
+
+                queue     (Queue)     --  queue of (index, item) tuples to process
+
+                results   (list)      --  list to store the result of each item at its index
+        """
+        while True:
+            try:
+                index, item = queue.get_nowait()
+            except Empty:
+                return
+
+            self._pace()
+
+            try:
+                results[index] = function(item)
+            except Exception as excp:
+                results[index] = excp
+
+    def map(self, function, items, return_exceptions=False):
+        """Runs the function for all the items given, with at most max workers threads running
+            concurrently.
+
+            Args:
+                function          (function)  --  function to run for each item
+
+                items             (iterable)  --  items to pass to the function, one at a time
+
+                return_exceptions (bool)      --  return the exception raised for an item as its
+                                                      result, instead of raising it
+                    default: False
+
+            Returns:
+                list - results of the function, in the same order as the items
+
+            Raises:
+                Exception:
+                    the first exception raised by the function, if return exceptions is False
+        """
+        items = list(items)
+        results = [None] * len(items)
+        queue = Queue()
+
+        for index, item in enumerate(items):
+            queue.put((index, item))
+
+        threads = []
+
+        for _ in range(min(self._max_workers, len(items))):
+            thread = Thread(target=self._worker, args=(function, queue, results))
+            thread.daemon = True
+            thread.start()
+            threads.append(thread)
+
+        for thread in threads:
+            thread.join()
+
+        if not return_exceptions:
+            for result in results:
+                if isinstance(result, Exception):
+                    raise result
+
+        return results
@@ -93,6 +93,8 @@ StoragePolicies:
 
     delete(storage_policy_name)  --  removes the specified storage policy from the commcell
 
+    refresh()                    --  refresh the storage policies associated with the commcell
+
 
 SchedulePolicies:
     __init__(commcell_object)    --  initialize the SchedulePolicies instance for the commcell
@@ -105,6 +107,8 @@ SchedulePolicies:
 
     has_policy(policy_name)      --  checks if a schedule policy exists with the given name
 
+    refresh()                    --  refresh the schedule policies associated with the commcell
+
 
 """
 
@@ -825,6 +829,13 @@ class StoragePolicies(object):
                 'Storage', '102', 'No policy exists with name: {0}'.format(storage_policy_name)
             )
 
+    def refresh(self):
+        """Refresh the storage policies associated with the Commcell.
+
+            The existing storage policies are kept, if the refresh fails.
+        """
+        self._policies = self._get_policies()
+
 
 class SchedulePolicies(object):
     """Class for getting all the schedule policies associated with the commcell."""
@@ -914,3 +925,10 @@ class SchedulePolicies(object):
             raise SDKException('Storage', '101')
 
         return self._policies and str(policy_name).lower() in self._policies
+
+    def refresh(self):
+        """Refresh the schedule policies associated with the Commcell.
+
+            The existing schedule policies are kept, if the refresh fails.
+        """
+        self._policies = self._get_policies()
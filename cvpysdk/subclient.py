@@ -28,12 +28,24 @@ Subclients:
 
     has_subclient()             --  checks if a subclient exists with the given name or not
 
+    _name_index()               --  returns the index of the subclient names, for searching
+
+    search(pattern)             --  returns the names of the subclients matching the given pattern
+
     add()                       --  adds a new subclient to the backupset
 
     get(subclient_name)         --  returns the subclient object of the input subclient name
 
     delete(subclient_name)      --  deletes the subclient (subclient name) from the backupset
 
+    _get_subclient_classes()    --  returns the Subclient class of each agent
+
+    _backup_subclient()         --  runs the backup for the subclient with the given id,
+                                        without initializing the Subclient object
+
+    backup()                    --  runs the backup for the subclients given, with a bounded
+                                        number of concurrent requests
+
 
 Subclient:
     __init__(backupset_object,
@@ -53,6 +65,9 @@ Subclient:
 
     _filter_paths()             --  filters the path as per the OS, and the Agent
 
+    _get_backup_request()       --  returns the backup request for the level of backup given,
+                                        as supported by the subclients of the agent
+
     _process_backup_request()   --  runs the backup request provided, and processes the response
 
     _browse_and_find_json()     --  returns the appropriate JSON request to pass for either
@@ -60,6 +75,15 @@ Subclient:
 
     _process_browse_response()  --  processes response received for both Browse and Find request
 
+    _get_browse_result()        --  returns the browse / find result from the browse cache of
+                                        the commcell, or runs the request for it
+
+    _get_browse_time_range()    --  returns the epoch times for the from and to dates given
+
+    _get_browse_page()          --  runs the DoBrowse API for a single page of the content
+
+    _iter_browse_pages()        --  yields the entries of the content, page by page
+
     _restore_json()             --  returns the apppropriate JSON request to pass for either
                                         Restore In-Place or Out-of-Place operation
 
@@ -85,6 +109,15 @@ Subclient:
 
     find()                      --  searches a given file/folder name in the subclient content
 
+    iter_browse()               --  yields the content of the backup for this subclient at the
+                                        path specified, page by page
+
+    iter_find()                 --  yields the files/folders matching the name given in the
+                                        subclient content, page by page
+
+    walk()                      --  yields the content of the backup recursively, browsing the
+                                        folders concurrently
+
     restore_in_place()          --  Restores the files/folders specified in the
                                         input paths list to the same location
 
@@ -102,7 +135,10 @@ import time
 from future.standard_library import install_aliases
 
 from .job import Job
+from .pool import WorkerPool
+from .browse import BrowseEntry, BrowseWalker, BrowseCache, BrowseResult
 from .schedules import Schedules
+from .nameindex import NameIndex
 from .exception import SDKException
 
 install_aliases()
@@ -111,6 +147,8 @@ install_aliases()
 class Subclients(object):
     """Class for getting all the subclients associated with a client."""
 
+    _BACKUP_LEVELS = ['full', 'incremental', 'differential', 'synthetic_full', 'transaction_log']
+
     def __init__(self, class_object):
         """Initialize the Sublcients object for the given backupset.
 
@@ -157,25 +195,10 @@ class Subclients(object):
         self._ADD_SUBCLIENT = self._commcell_object._services.ADD_SUBCLIENT
 
         self._subclients = self._get_subclients()
+        self._index = None
 
-        from .subclients.fssubclient import FileSystemSubclient
-        from .subclients.vssubclient import VirtualServerSubclient
-        from .subclients.casubclient import CloudAppsSubclient
-        from .subclients.sqlsubclient import SQLServerSubclient
-
-        globals()['FileSystemSubclient'] = FileSystemSubclient
-        globals()['VirtualServerSubclient'] = VirtualServerSubclient
-        globals()['CloudAppsSubclient'] = CloudAppsSubclient
-        globals()['SQLServerSubclient'] = SQLServerSubclient
-
-        # add the agent name to this dict, and its class as the value
         # the appropriate class object will be initialized based on the agent
-        self._subclients_dict = {
-            'file system': FileSystemSubclient,
-            'virtual server': VirtualServerSubclient,
-            'cloud apps': CloudAppsSubclient,
-            'sql server': SQLServerSubclient
-        }
+        self._subclients_dict = self._get_subclient_classes()
 
     def __str__(self):
         """Representation string consisting of all subclients of the backupset.
@@ -296,6 +319,52 @@ class Subclients(object):
 
         return self._subclients and str(subclient_name).lower() in self._subclients
 
+    def _name_index(self):
+        """Returns the index of the subclient names, built again only if the subclients changed.
+
+            Returns:
+                object - instance of the NameIndex class for the names of the subclients
+        """
+        subclients = self._subclients
+
+        if self._index is None or self._index[0] is not subclients:
+            self._index = (subclients, NameIndex(subclients))
+
+        return self._index[1]
+
+    def search(self, pattern, search_type='glob'):
+        """Returns the names of the subclients matching the given pattern.
+
+            Args:
+                pattern     (str)   --  prefix, glob pattern, or regular expression to search
+
+                    e.g.: 'db_*'
+
+                search_type (str)   --  type of the search to run
+
+                    Valid values are:
+
+                        prefix
+
+                        glob
+
+                        regex
+
+                    default: glob
+
+            Returns:
+                list - names of the subclients matching the pattern, in sorted order
+
+            Raises:
+                SDKException:
+                    if type of the pattern argument is not string
+
+                    if search type is not valid
+
+                    if the regular expression is not valid
+        """
+        return self._name_index().search(pattern, search_type)
+
     def add(self, subclient_name, storage_policy, description='', log_backup_storage_policy=None):
         """Adds a new subclient to the backupset.
 
@@ -525,10 +594,204 @@ class Subclients(object):
                 'Subclient', '102', 'No subclient exists with name: {0}'.format(subclient_name)
             )
 
+    @staticmethod
+    def _get_subclient_classes():
+        """Returns the Subclient class of each agent, to initialize the subclients of the agent,
+            or to build the backup requests for them, without initializing the subclients.
+
+            Returns:
+                dict - Subclient class, with the agent name in lower case as key;
+                           the agents not present use the Subclient class
+        """
+        from .subclients.fssubclient import FileSystemSubclient
+        from .subclients.vssubclient import VirtualServerSubclient
+        from .subclients.casubclient import CloudAppsSubclient
+        from .subclients.sqlsubclient import SQLServerSubclient
+
+        globals()['FileSystemSubclient'] = FileSystemSubclient
+        globals()['VirtualServerSubclient'] = VirtualServerSubclient
+        globals()['CloudAppsSubclient'] = CloudAppsSubclient
+        globals()['SQLServerSubclient'] = SQLServerSubclient
+
+        # add the agent name to this dict, and its class as the value
+        return {
+            'file system': FileSystemSubclient,
+            'virtual server': VirtualServerSubclient,
+            'cloud apps': CloudAppsSubclient,
+            'sql server': SQLServerSubclient
+        }
+
+    @staticmethod
+    def _backup_subclient(commcell_object, subclient_id, backup_level, reuse_running_job=False):
+        """Runs the backup for the subclient with the given id, and returns the Job object.
+
+            The request is sent directly for the subclient id, without initializing the
+            Subclient object, which would get the properties and schedules of the subclient.
+
+            The results of the subclient in the browse cache of the commcell, if enabled, are
+            removed once the backup is started.
+
+            Args:
+                commcell_object     (object)    --  instance of the Commcell class
+
+                subclient_id        (str)       --  id of the subclient to run the backup for
+
+                backup_level        (str)       --  level of backup to run, with the options
+                                                        of the level, if any
+
+                reuse_running_job   (bool)      --  return the backup job already running for
+                                                        the subclient, as per the active backups
+                                                        view of the commcell, instead of
+                                                        starting another one, once its status
+                                                        confirms it is still running
+                    default: False
+
+            Returns:
+                object - instance of the Job class for this backup job,
+                             or the backup job already running for the subclient
+
+            Raises:
+                SDKException:
+                    if job initialization failed
+
+                    if response is empty
+
+                    if response is not success
+        """
+        if reuse_running_job:
+            job = commcell_object.jobs.active_backups.get_job(subclient_id)
+
+            if job is not None:
+                return job
+
+        flag, response = commcell_object._cvpysdk_object.make_request(
+            'POST', commcell_object._services.SUBCLIENT_BACKUP % (subclient_id, backup_level)
+        )
+
+        if flag:
+            if response.json():
+                if "jobIds" in response.json():
+                    job_id = response.json()['jobIds'][0]
+
+                    # the browse results cached for the subclient are outdated by the backup
+                    if commcell_object.browse_cache is not None:
+                        commcell_object.browse_cache.invalidate(subclient_id)
+
+                    if reuse_running_job:
+                        commcell_object.jobs.active_backups.add(subclient_id, job_id)
+
+                    return Job(commcell_object, job_id, 'Backup')
+                elif "errorCode" in response.json():
+                    o_str = 'Initializing backup failed\nError: "{0}"'.format(
+                        response.json()['errorMessage']
+                    )
+                    raise SDKException('Subclient', '102', o_str)
+
+            raise SDKException('Response', '102')
+        else:
+            response_string = commcell_object._update_response_(response.text)
+            raise SDKException('Response', '101', response_string)
+
+    def backup(
+            self,
+            subclient_names=None,
+            backup_level=None,
+            max_workers=8,
+            stagger=0,
+            reuse_running_job=False,
+            incremental_backup=False,
+            incremental_level='BEFORE_SYNTH'):
+        """Runs the backup for the subclients given, with at most max workers requests
+            running concurrently, and the requests started at least stagger seconds apart.
+
+            The backup level is checked, and the backup request is built, as per the Subclient
+            class of the agent, the same as by the backup() method of the subclient.
+
+            Args:
+                subclient_names (list)  --  names of the subclients to run the backup for
+                    default: None; all the subclients
+
+                backup_level    (str)   --  level of backup to run, supported by the agent
+                        Full / Incremental / Differential / Synthetic_full / Transaction_Log
+                    default: None; default level of the agent, e.g.; Incremental for
+                        File System, and Differential for SQL Server
+
+                max_workers     (int)   --  maximum number of backup requests to run concurrently
+                    default: 8
+
+                stagger         (float) --  minimum number of seconds between the start of
+                                                two consecutive backup requests
+                    default: 0
+
+                reuse_running_job   (bool)  --  return the backup job already running for a
+                                                    subclient, instead of starting another one
+                    default: False
+
+                incremental_backup  (bool)  --  run incremental backup
+                        only applicable in case of Synthetic_full backup
+                    default: False
+
+                incremental_level   (str)   --  run incremental backup before/after synthetic full
+                        BEFORE_SYNTH / AFTER_SYNTH
+                    default: BEFORE_SYNTH
+
+            Returns:
+                list - result for each subclient, in the same order as the subclient names;
+                           instance of the Job class for the backup job started, or the
+                           exception raised while starting the backup for the subclient
+
+                    the subclients are sorted by name, if no names are given
+
+            Raises:
+                SDKException:
+                    if type of the backup level argument is not string
+
+                    if backup level specified is not correct
+
+                    if no subclient exists with any of the names given
+        """
+        if backup_level is not None and not isinstance(backup_level, str):
+            raise SDKException('Subclient', '101')
+
+        subclient_class = self._subclients_dict.get(
+            self._instance_object._agent_object.agent_name, Subclient
+        )
+
+        backup_request = subclient_class._get_backup_request(
+            backup_level or subclient_class._DEFAULT_BACKUP_LEVEL,
+            incremental_backup,
+            incremental_level
+        )
+
+        if subclient_names is None:
+            subclient_names = sorted(self._subclients)
+
+        subclient_ids = []
+
+        for subclient_name in subclient_names:
+            if not self.has_subclient(subclient_name):
+                raise SDKException(
+                    'Subclient', '102', 'No subclient exists with name: {0}'.format(subclient_name)
+                )
+
+            subclient_ids.append(self._subclients[subclient_name.lower()]['id'])
+
+        return WorkerPool(max_workers, stagger).map(
+            lambda subclient_id: self._backup_subclient(
+                self._commcell_object, subclient_id, backup_request, reuse_running_job
+            ),
+            subclient_ids,
+            return_exceptions=True
+        )
+
 
 class Subclient(object):
     """Base class consisting of all the common properties and operations for a Subclient"""
 
+    # levels of backup supported by the subclients of the agent, and the level run by default
+    _BACKUP_LEVELS = ['full', 'incremental', 'differential', 'synthetic_full']
+    _DEFAULT_BACKUP_LEVEL = 'Incremental'
+
     def __init__(self, backupset_object, subclient_name, subclient_id=None):
         """Initialise the Subclient object.
 
@@ -906,12 +1169,62 @@ class Subclient(object):
         else:
             return paths
 
-    def _process_backup_request(self, backup_request):
+    @classmethod
+    def _get_backup_request(
+            cls,
+            backup_level,
+            incremental_backup=False,
+            incremental_level='BEFORE_SYNTH'):
+        """Returns the backup request for the level of backup given, after checking the level
+            is supported by the subclients of the agent.
+
+            No request is sent to the server, so the backup request can be built for a subclient,
+            without initializing the Subclient object.
+
+            Args:
+                backup_level        (str)   --  level of backup to run
+
+                incremental_backup  (bool)  --  run incremental backup
+                        only applicable in case of Synthetic_full backup
+                    default: False
+
+                incremental_level   (str)   --  run incremental backup before/after synthetic full
+                        BEFORE_SYNTH / AFTER_SYNTH
+                    default: BEFORE_SYNTH
+
+            Returns:
+                str - backup request specifying the backup level, and its options
+
+            Raises:
+                SDKException:
+                    if backup level specified is not correct
+        """
+        backup_level = backup_level.lower()
+
+        if backup_level not in cls._BACKUP_LEVELS:
+            raise SDKException('Subclient', '103')
+
+        backup_request = backup_level
+
+        if backup_level == 'synthetic_full':
+            if incremental_backup:
+                backup_request += '&runIncrementalBackup=True'
+                backup_request += '&incLevel=%s' % (incremental_level.lower())
+            else:
+                backup_request += '&runIncrementalBackup=False'
+
+        return backup_request
+
+    def _process_backup_request(self, backup_request, reuse_running_job=False):
         """Runs the Backup for a subclient with the request provided and returns the Job object.
 
             Args:
-                backup_request  (str)  --  backup request specifying the backup level,
-                                               to run for the subclient
+                backup_request      (str)   --  backup request specifying the backup level,
+                                                    to run for the subclient
+
+                reuse_running_job   (bool)  --  return the backup job already running for the
+                                                    subclient, instead of starting another one
+                    default: False
 
             Returns:
                 object - instance of the Job class for this restore job
@@ -928,22 +1241,9 @@ class Subclient(object):
             self.subclient_id, backup_request
         )
 
-        flag, response = self._commcell_object._cvpysdk_object.make_request('POST', self._BACKUP)
-
-        if flag:
-            if response.json():
-                if "jobIds" in response.json():
-                    return Job(self._commcell_object, response.json()['jobIds'][0])
-                elif "errorCode" in response.json():
-                    o_str = 'Initializing backup failed\nError: "{0}"'.format(
-                        response.json()['errorMessage']
-                    )
-                    raise SDKException('Subclient', '102', o_str)
-            else:
-                raise SDKException('Response', '102')
-        else:
-            response_string = self._commcell_object._update_response_(response.text)
-            raise SDKException('Response', '101', response_string)
+        return Subclients._backup_subclient(
+            self._commcell_object, self.subclient_id, backup_request, reuse_running_job
+        )
 
     def _browse_and_find_json(
             self,
@@ -954,14 +1254,22 @@ class Subclient(object):
             restore_index=True,
             vm_disk_browse=False,
             from_date=0,
-            to_date=time.time()):
+            to_date=time.time(),
+            page_size=None,
+            first_node=0):
         """Returns the JSON request to pass to the DoBrowse API,
             as per the options selected by the user.
 
             Args:
-                option (str)  --  string option for which to run the API for
+                option      (str)   --  string option for which to run the API for
                     e.g.; Browse / Find
 
+                page_size   (int)   --  number of results to get in a single page
+                    default: None; get all the results at once
+
+                first_node  (int)   --  position of the first result of the page
+                    default: 0
+
             Returns:
                 dict - JSON request to pass to the API
         """
@@ -1012,6 +1320,13 @@ class Subclient(object):
             }]
         }
 
+        if page_size is not None:
+            request_json['queries'][0]['dataParam']['paging'] = {
+                "firstNode": int(first_node),
+                "pageSize": int(page_size),
+                "skipNode": 0
+            }
+
         if option == 'Find':
             request_json['queries'][0]['whereClause'] = [{
                 "connector": 0,
@@ -1023,7 +1338,7 @@ class Subclient(object):
 
         return request_json
 
-    def _process_browse_response(self, option, flag, response, is_vs_browse=False):
+    def _process_browse_response(self, option, flag, response, is_vs_browse=False, columnar=False):
         """Runs the DoBrowse API with the request JSON provided for the operation specified,
             and returns the contents after parsing the response.
 
@@ -1038,11 +1353,17 @@ class Subclient(object):
                 is_vs_browse    (bool)  --  boolean, specifying a Virtual Server subclient browse
                     default: False
 
+                columnar        (bool)  --  return the result as an instance of the
+                                                BrowseResult class, without formatting the values
+                    default: False
+
             Returns:
                 list - list of all folders or files with their full paths inside the input path
 
                 dict - path along with the details like name, file/folder, size, modification time
 
+                object - instance of the BrowseResult class, if columnar is True
+
             Raises:
                 SDKException:
                     if failed to browse/search for content
@@ -1066,6 +1387,10 @@ class Subclient(object):
 
                     if 'dataResultSet' in browse_result:
                         result_set = browse_result['dataResultSet']
+
+                        if columnar:
+                            return BrowseResult.from_result_set(result_set, is_vs_browse)
+
                         paths_dict = {}
                         paths = []
 
@@ -1135,36 +1460,261 @@ class Subclient(object):
             response_string = self._commcell_object._update_response_(response.text)
             raise SDKException('Response', '101', response_string)
 
-    def _restore_json(
+    def _get_browse_result(
             self,
-            paths,
-            in_place=True,
-            client=None,
-            destination_path=None,
-            overwrite=True,
-            restore_data_and_acl=True):
-        """Returns the JSON request to pass to the API as per the options selected by the user.
+            cache_key,
+            option,
+            method,
+            web_service,
+            request_json=None,
+            is_vs_browse=False,
+            columnar=False):
+        """Returns the browse / find result from the browse cache of the commcell, if enabled,
+            or runs the request for it, and stores it in the cache.
 
             Args:
-                paths   (list)  --  list of full paths of files/folders to restore
+                cache_key       (tuple) --  key of the result in the browse cache
+
+                option          (str)   --  string option for which to run the API for
+                    e.g.; Browse / Find
+
+                method          (str)   --  HTTP method of the request
+
+                web_service     (str)   --  URL of the request
+
+                request_json    (dict)  --  JSON request to pass to the API
+                    default: None
+
+                is_vs_browse    (bool)  --  boolean, specifying a Virtual Server subclient browse
+                    default: False
+
+                columnar        (bool)  --  return the result as an instance of the
+                                                BrowseResult class
+                    default: False
 
             Returns:
-                dict - JSON request to pass to the API
-        """
-        if client is None and destination_path is None:
-            client_id = int(self._backupset_object._agent_object._client_object.client_id)
-            client_name = self._backupset_object._agent_object._client_object.client_name
-        else:
-            client_id = int(client.client_id)
-            client_name = client.client_name
+                list - list of all folders or files with their full paths inside the input path
 
-        request_json = {
-            "taskInfo": {
-                "associations": [{
-                    "clientName": self._backupset_object._agent_object._client_object.client_name,
-                    "clientId": int(self._backupset_object._agent_object._client_object.client_id),
-                    "appName": self._backupset_object._agent_object.agent_name,
-                    "appTypeId": int(self._backupset_object._agent_object.agent_id),
+                dict - path along with the details like name, file/folder, size, modification time
+
+                object - instance of the BrowseResult class, if columnar is True
+
+            Raises:
+                SDKException:
+                    if failed to browse/search for content
+
+                    if response is empty
+
+                    if response is not success
+        """
+        browse_cache = self._commcell_object.browse_cache
+
+        if browse_cache is not None:
+            cache_key += (columnar,)
+            result = browse_cache.get(cache_key)
+
+            if result is not None:
+                return result.copy() if columnar else (list(result[0]), dict(result[1]))
+
+        flag, response = self._commcell_object._cvpysdk_object.make_request(
+            method, web_service, request_json
+        )
+
+        result = self._process_browse_response(option, flag, response, is_vs_browse, columnar)
+
+        if browse_cache is None:
+            return result
+
+        browse_cache.put(cache_key, result, len(response.content))
+
+        # the callers are free to modify the result returned, so the cached one is copied
+        if columnar:
+            return result.copy()
+
+        return list(result[0]), dict(result[1])
+
+    def _get_browse_time_range(self, from_date, to_date):
+        """Returns the epoch times for the from and to dates given, to browse the content in.
+
+            Args:
+                from_date   (str)   --  date to get the contents after
+                        format: dd/MM/YYYY
+
+                        gets contents from 01/01/1970 if not specified
+
+                to_date     (str)   --  date to get the contents before
+                        format: dd/MM/YYYY
+
+                        gets contents till current day if not specified
+
+            Returns:
+                tuple - (from time, to time) in epoch seconds
+
+            Raises:
+                SDKException:
+                    if from date value is incorrect
+
+                    if to date value is incorrect
+
+                    if to date is less than from date
+        """
+        if from_date and (from_date != '01/01/1970' and from_date != '1/1/1970'):
+            temp = from_date.split('/')
+            if (len(temp) == 3 and
+                    0 < int(temp[0]) < 32 and
+                    0 < int(temp[1]) < 13 and
+                    int(temp[2]) > 1969 and
+                    (re.search(r'\d\d/\d\d/\d\d\d\d', from_date) or
+                     re.search(r'\d/\d/\d\d\d\d', from_date))):
+                from_date = int(time.mktime(time.strptime(from_date, '%d/%m/%Y')))
+            else:
+                raise SDKException('Subclient', '106')
+        else:
+            from_date = 0
+
+        if to_date and (to_date != '01/01/1970' and to_date != '1/1/1970'):
+            temp = to_date.split('/')
+            if (len(temp) == 3 and
+                    0 < int(temp[0]) < 32 and
+                    0 < int(temp[1]) < 13 and
+                    int(temp[2]) > 1969 and
+                    (re.search(r'\d\d/\d\d/\d\d\d\d', to_date) or
+                     re.search(r'\d/\d/\d\d\d\d', to_date))):
+                today = time.strftime('%d/%m/%Y')
+                if today == to_date:
+                    to_date = int(time.time())
+                else:
+                    to_date = int(time.mktime(time.strptime(to_date, '%d/%m/%Y')))
+            else:
+                raise SDKException('Subclient', '106')
+        else:
+            to_date = int(time.time())
+
+        if to_date < from_date:
+            raise SDKException('Subclient', '107')
+
+        return from_date, to_date
+
+    def _get_browse_page(self, option, request_json):
+        """Runs the DoBrowse API with the request JSON provided, for a single page of the
+            content, and returns the results of the page.
+
+            Args:
+                option          (str)   --  string option for which to run the API for
+                    e.g.; Browse / Find
+
+                request_json    (dict)  --  JSON request to pass to the API
+
+            Returns:
+                list - results of the page, as received from the server
+
+                int  - total number of results, for all the pages,
+                           or None if the response does not have the total
+
+            Raises:
+                SDKException:
+                    if failed to browse/search for content
+
+                    if response is empty
+
+                    if response is not success
+        """
+        flag, response = self._commcell_object._cvpysdk_object.make_request(
+            'POST', self._BROWSE, request_json
+        )
+
+        if flag:
+            response_json = response.json()
+
+            if response_json and 'browseResponses' in response_json:
+                browse_response = response_json['browseResponses'][0]
+
+                if 'browseResult' in browse_response:
+                    browse_result = browse_response['browseResult']
+                    result_set = browse_result.get('dataResultSet', [])
+                    total = browse_result.get('totalItemsFound')
+
+                    return result_set, None if total is None else int(total)
+                elif 'messages' in browse_response:
+                    error_message = browse_response['messages'][0]['errorMessage']
+
+                    if option == 'Find':
+                        o_str = 'Failed to Search\nError: "{0}"'
+                    else:
+                        o_str = 'Failed to browse for subclient backup content\nError: "{0}"'
+
+                    raise SDKException('Subclient', '102', o_str.format(error_message))
+                else:
+                    raise SDKException('Subclient', '111' if option == 'Find' else '110')
+            else:
+                raise SDKException('Response', '102')
+        else:
+            response_string = self._commcell_object._update_response_(response.text)
+            raise SDKException('Response', '101', response_string)
+
+    def _iter_browse_pages(self, option, request_json, page_size):
+        """Yields the entries of the content, getting a single page of the results at a time.
+
+            The pages are got until a page has less results than the page size, or all the
+            results are received, as per the total of the response, if any.
+
+            Args:
+                option          (str)   --  string option for which to run the API for
+                    e.g.; Browse / Find
+
+                request_json    (dict)  --  JSON request to pass to the API, with the paging
+
+                page_size       (int)   --  number of results to get in a single page
+
+            Yields:
+                object - instance of the BrowseEntry class, for each file / folder
+        """
+        paging = request_json['queries'][0]['dataParam']['paging']
+        first_node = 0
+
+        while True:
+            paging['firstNode'] = first_node
+
+            result_set, total = self._get_browse_page(option, request_json)
+
+            for result in result_set:
+                yield BrowseEntry.from_result(result)
+
+            first_node += len(result_set)
+
+            if len(result_set) < page_size or (total is not None and first_node >= total):
+                return
+
+    def _restore_json(
+            self,
+            paths,
+            in_place=True,
+            client=None,
+            destination_path=None,
+            overwrite=True,
+            restore_data_and_acl=True):
+        """Returns the JSON request to pass to the API as per the options selected by the user.
+
+            Args:
+                paths   (list)  --  list of full paths of files/folders to restore
+
+            Returns:
+                dict - JSON request to pass to the API
+        """
+        if client is None and destination_path is None:
+            client_id = int(self._backupset_object._agent_object._client_object.client_id)
+            client_name = self._backupset_object._agent_object._client_object.client_name
+        else:
+            client_id = int(client.client_id)
+            client_name = client.client_name
+
+        request_json = {
+            "taskInfo": {
+                "associations": [{
+                    "clientName": self._backupset_object._agent_object._client_object.client_name,
+                    "clientId": int(self._backupset_object._agent_object._client_object.client_id),
+                    "appName": self._backupset_object._agent_object.agent_name,
+                    "appTypeId": int(self._backupset_object._agent_object.agent_id),
                     "instanceName": self._backupset_object._instance_object.instance_name,
                     "instanceId": int(self._backupset_object._instance_object.instance_id),
                     "backupsetName": self._backupset_object.backupset_name,
@@ -1242,7 +1792,7 @@ class Subclient(object):
         if flag:
             if response.json():
                 if "jobIds" in response.json():
-                    return Job(self._commcell_object, response.json()['jobIds'][0])
+                    return Job(self._commcell_object, response.json()['jobIds'][0], 'Restore')
                 elif "errorCode" in response.json():
                     error_message = response.json()['errorMessage']
 
@@ -1442,7 +1992,8 @@ class Subclient(object):
             self,
             backup_level="Incremental",
             incremental_backup=False,
-            incremental_level='BEFORE_SYNTH'):
+            incremental_level='BEFORE_SYNTH',
+            reuse_running_job=False):
         """Runs a backup job for the subclient of the level specified.
 
             Args:
@@ -1460,8 +2011,16 @@ class Subclient(object):
                         only applicable in case of Synthetic_full backup
                     default: BEFORE_SYNTH
 
+                reuse_running_job   (bool)  --  return the backup job already running for the
+                                                    subclient, instead of starting another one
+
+                        the running jobs are looked up in the active backups view of the
+                        commcell, refreshed every commcell.jobs.active_backups.max_age seconds
+                    default: False
+
             Returns:
-                object - instance of the Job class for this backup job
+                object - instance of the Job class for this backup job,
+                             or the backup job already running for the subclient
 
             Raises:
                 SDKException:
@@ -1471,23 +2030,19 @@ class Subclient(object):
 
                     if response is not success
         """
-        backup_level = backup_level.lower()
-
-        if backup_level not in ['full', 'incremental', 'differential', 'synthetic_full']:
-            raise SDKException('Subclient', '103')
-
-        backup_request = backup_level
-
-        if backup_level == 'synthetic_full':
-            if incremental_backup:
-                backup_request += '&runIncrementalBackup=True'
-                backup_request += '&incLevel=%s' % (incremental_level.lower())
-            else:
-                backup_request += '&runIncrementalBackup=False'
+        backup_request = self._get_backup_request(
+            backup_level, incremental_backup, incremental_level
+        )
 
-        return self._process_backup_request(backup_request)
+        return self._process_backup_request(backup_request, reuse_running_job)
 
-    def browse(self, path='\\', show_deleted_files=True, vm_disk_browse=False, is_vs_browse=False):
+    def browse(
+            self,
+            path='\\',
+            show_deleted_files=True,
+            vm_disk_browse=False,
+            is_vs_browse=False,
+            columnar=False):
         """Gets the content of the backup for this subclient at the path specified.
 
             Args:
@@ -1505,11 +2060,19 @@ class Subclient(object):
                 is_vs_browse    (bool)  --  boolean, specifying a Virtual Server subclient browse
                     default: False
 
+                columnar            (bool)  --  return the result as an instance of the
+                                                    BrowseResult class, with the raw sizes and
+                                                    times in arrays, instead of formatting each
+                                                    file / folder
+                    default: False
+
             Returns:
                 list - list of all folders or files with their full paths inside the input path
 
                 dict - path along with the details like name, file/folder, size, modification time
 
+                object - instance of the BrowseResult class, if columnar is True
+
             Raises:
                 SDKException:
                     if failed to browse content
@@ -1536,9 +2099,13 @@ class Subclient(object):
 
         web_service += urlencode(encode_dict)
 
-        flag, response = self._commcell_object._cvpysdk_object.make_request('GET', web_service)
+        cache_key = BrowseCache.key(
+            self.subclient_id, 'Browse', path, show_deleted_files, vm_disk_browse, is_vs_browse
+        )
 
-        return self._process_browse_response('Browse', flag, response, is_vs_browse)
+        return self._get_browse_result(
+            cache_key, 'Browse', 'GET', web_service, is_vs_browse=is_vs_browse, columnar=columnar
+        )
 
     def browse_in_time(
             self,
@@ -1548,7 +2115,8 @@ class Subclient(object):
             vm_disk_browse=False,
             from_date=None,
             to_date=None,
-            is_vs_browse=False):
+            is_vs_browse=False,
+            columnar=False):
         """Gets the content of the backup for this subclient
             at the path specified in the time range specified.
 
@@ -1582,11 +2150,19 @@ class Subclient(object):
                 is_vs_browse    (bool)  --  boolean, specifying a Virtual Server subclient browse
                     default: False
 
+                columnar            (bool)  --  return the result as an instance of the
+                                                    BrowseResult class, with the raw sizes and
+                                                    times in arrays, instead of formatting each
+                                                    file / folder
+                    default: False
+
             Returns:
                 list - list of all folders or files with their full paths inside the input path
 
                 dict - path along with the details like name, file/folder, size, modification time
 
+                object - instance of the BrowseResult class, if columnar is True
+
             Raises:
                 SDKException:
                     if from date value is incorrect
@@ -1601,40 +2177,20 @@ class Subclient(object):
 
                     if response is not success
         """
-        if from_date and (from_date != '01/01/1970' and from_date != '1/1/1970'):
-            temp = from_date.split('/')
-            if (len(temp) == 3 and
-                    0 < int(temp[0]) < 32 and
-                    0 < int(temp[1]) < 13 and
-                    int(temp[2]) > 1969 and
-                    (re.search(r'\d\d/\d\d/\d\d\d\d', from_date) or
-                     re.search(r'\d/\d/\d\d\d\d', from_date))):
-                from_date = int(time.mktime(time.strptime(from_date, '%d/%m/%Y')))
-            else:
-                raise SDKException('Subclient', '106')
-        else:
-            from_date = 0
-
-        if to_date and (to_date != '01/01/1970' and to_date != '1/1/1970'):
-            temp = to_date.split('/')
-            if (len(temp) == 3 and
-                    0 < int(temp[0]) < 32 and
-                    0 < int(temp[1]) < 13 and
-                    int(temp[2]) > 1969 and
-                    (re.search(r'\d\d/\d\d/\d\d\d\d', to_date) or
-                     re.search(r'\d/\d/\d\d\d\d', to_date))):
-                today = time.strftime('%d/%m/%Y')
-                if today == to_date:
-                    to_date = int(time.time())
-                else:
-                    to_date = int(time.mktime(time.strptime(to_date, '%d/%m/%Y')))
-            else:
-                raise SDKException('Subclient', '106')
-        else:
-            to_date = int(time.time())
+        # the dates as given, so that the results till the current time are cached within the TTL
+        cache_key = BrowseCache.key(
+            self.subclient_id,
+            'BrowseInTime',
+            path,
+            show_deleted_files,
+            restore_index,
+            vm_disk_browse,
+            from_date,
+            to_date,
+            is_vs_browse
+        )
 
-        if to_date < from_date:
-            raise SDKException('Subclient', '107')
+        from_date, to_date = self._get_browse_time_range(from_date, to_date)
 
         path = self._filter_paths([path], True)
 
@@ -1648,13 +2204,16 @@ class Subclient(object):
             to_date=to_date
         )
 
-        flag, response = self._commcell_object._cvpysdk_object.make_request(
-            'POST', self._BROWSE, request_json
+        return self._get_browse_result(
+            cache_key, 'Browse', 'POST', self._BROWSE, request_json, is_vs_browse, columnar
         )
 
-        return self._process_browse_response('Browse', flag, response, is_vs_browse)
-
-    def find(self, file_or_folder_name, show_deleted_files=True, restore_index=True):
+    def find(
+            self,
+            file_or_folder_name,
+            show_deleted_files=True,
+            restore_index=True,
+            columnar=False):
         """Searches a file/folder in the subclient backup content,
             and returns all the files matching the file name given.
 
@@ -1667,11 +2226,19 @@ class Subclient(object):
                 restore_index       (bool)  --  restore index if it is not cached
                     default: True
 
+                columnar            (bool)  --  return the result as an instance of the
+                                                    BrowseResult class, with the raw sizes and
+                                                    times in arrays, instead of formatting each
+                                                    file / folder
+                    default: False
+
             Returns:
                 list - list of all files or folders with their full paths matching the name
 
                 dict - path along with the details like name, file/folder, size, modification time
 
+                object - instance of the BrowseResult class, if columnar is True
+
             Raises:
                 SDKException:
                     if failed to search file/folder
@@ -1687,11 +2254,203 @@ class Subclient(object):
             restore_index=restore_index
         )
 
-        flag, response = self._commcell_object._cvpysdk_object.make_request(
-            'POST', self._BROWSE, request_json
+        cache_key = BrowseCache.key(
+            self.subclient_id, 'Find', file_or_folder_name, show_deleted_files, restore_index
+        )
+
+        return self._get_browse_result(
+            cache_key, 'Find', 'POST', self._BROWSE, request_json, columnar=columnar
         )
 
-        return self._process_browse_response('Find', flag, response)
+    def iter_browse(
+            self,
+            path='\\',
+            show_deleted_files=True,
+            restore_index=True,
+            vm_disk_browse=False,
+            from_date=None,
+            to_date=None,
+            page_size=1000):
+        """Yields the content of the backup for this subclient at the path specified,
+            getting a single page of the content from the server at a time.
+
+            Only a single page of the content is held in memory, irrespective of the number of
+            files / folders at the path.
+
+            Args:
+                path                (str)   --  folder path to get the contents of
+                    default: '\\'; returns the root of the Backup content
+
+                show_deleted_files  (bool)  --  include deleted files in the content or not
+                    default: True
+
+                restore_index       (bool)  --  restore index if it is not cached
+                    default: True
+
+                vm_disk_browse      (bool)  --  browse virtual machine files
+                                                    e.g.; .vmdk files, etc.
+                    only applicable when browsing content inside a guest virtual machine
+                    default: False
+
+                from_date           (str)   --  date to get the contents after
+                        format: dd/MM/YYYY
+                    default: None; gets contents from 01/01/1970
+
+                to_date             (str)   --  date to get the contents before
+                        format: dd/MM/YYYY
+                    default: None; gets contents till current day
+
+                page_size           (int)   --  number of files / folders to get in a single page
+                    default: 1000
+
+            Yields:
+                object - instance of the BrowseEntry class, for each file / folder at the path
+
+            Raises:
+                SDKException:
+                    if type of the page size argument is not int
+
+                    if from date value is incorrect
+
+                    if to date value is incorrect
+
+                    if to date is less than from date
+
+                    if failed to browse content
+
+                    if response is empty
+
+                    if response is not success
+        """
+        if not isinstance(page_size, int) or page_size <= 0:
+            raise SDKException('Subclient', '101')
+
+        from_date, to_date = self._get_browse_time_range(from_date, to_date)
+
+        request_json = self._browse_and_find_json(
+            option='Browse',
+            path=self._filter_paths([path], True),
+            show_deleted_files=show_deleted_files,
+            restore_index=restore_index,
+            vm_disk_browse=vm_disk_browse,
+            from_date=from_date,
+            to_date=to_date,
+            page_size=page_size
+        )
+
+        return self._iter_browse_pages('Browse', request_json, page_size)
+
+    def iter_find(
+            self,
+            file_or_folder_name,
+            show_deleted_files=True,
+            restore_index=True,
+            page_size=1000):
+        """Yields the files / folders in the subclient backup content, matching the name given,
+            getting a single page of the results from the server at a time.
+
+            Args:
+                file_or_folder_name (str)   --  name of the file or folder to search
+
+                show_deleted_files  (bool)  --  include deleted files in the search or not
+                    default: True
+
+                restore_index       (bool)  --  restore index if it is not cached
+                    default: True
+
+                page_size           (int)   --  number of results to get in a single page
+                    default: 1000
+
+            Yields:
+                object - instance of the BrowseEntry class, for each file / folder matching
+                             the name
+
+            Raises:
+                SDKException:
+                    if type of the page size argument is not int
+
+                    if failed to search file/folder
+
+                    if response is empty
+
+                    if response is not success
+        """
+        if not isinstance(page_size, int) or page_size <= 0:
+            raise SDKException('Subclient', '101')
+
+        request_json = self._browse_and_find_json(
+            option='Find',
+            file_or_folder_name=file_or_folder_name,
+            show_deleted_files=show_deleted_files,
+            restore_index=restore_index,
+            to_date=time.time(),
+            page_size=page_size
+        )
+
+        return self._iter_browse_pages('Find', request_json, page_size)
+
+    def walk(
+            self,
+            path='\\',
+            max_depth=None,
+            workers=8,
+            filters=None,
+            show_deleted_files=True,
+            page_size=1000):
+        """Yields the content of the backup for this subclient recursively, starting at the
+            path specified, browsing at most workers folders concurrently.
+
+            The entries are yielded as the folders are browsed, so the order of the entries
+            of different folders is not fixed.
+
+            Args:
+                path                (str)   --  folder path to start the walk at
+                    default: '\\'; starts at the root of the Backup content
+
+                max_depth           (int)   --  number of levels of folders to browse,
+                                                    starting with the folder at the path
+                    default: None; browse all the levels
+
+                workers             (int)   --  maximum number of folders to browse concurrently
+                    default: 8
+
+                filters             (dict)  --  conditions the files should match, to be yielded
+
+                        name            -   name pattern, e.g.; '*.log'
+
+                        min_size        -   minimum size of the file, in bytes
+
+                        max_size        -   maximum size of the file, in bytes
+
+                        modified_after  -   epoch time the file should be modified after
+
+                        modified_before -   epoch time the file should be modified before
+
+                        the folders are always yielded, and expanded
+                    default: None; yield all the files
+
+                show_deleted_files  (bool)  --  include deleted files in the content or not
+                    default: True
+
+                page_size           (int)   --  number of files / folders to get in a single
+                                                    page of a folder
+                    default: 1000
+
+            Returns:
+                object - instance of the BrowseWalker class, which yields the
+                             (path of the parent folder, BrowseEntry) tuples
+
+            Raises:
+                SDKException:
+                    if type of the max depth, or workers argument is not int
+
+                    if any of the filters is not valid
+
+                    if failed to browse any of the folders, while iterating
+        """
+        return BrowseWalker(
+            self, path, max_depth, workers, filters, show_deleted_files, page_size
+        )
 
     def restore_in_place(self, paths, overwrite=True, restore_data_and_acl=True):
         """Restores the files/folders specified in the input paths list to the same location.
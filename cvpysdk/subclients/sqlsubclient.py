@@ -38,6 +38,9 @@ class SQLServerSubclient(Subclient):
     """Derived class from Subclient Base class, representing a file system subclient,
         and to perform operations on that subclient."""
 
+    _BACKUP_LEVELS = ['full', 'transaction_log', 'differential']
+    _DEFAULT_BACKUP_LEVEL = 'Differential'
+
     def _get_subclient_content_(self):
         """Gets the appropriate content from the Subclient relevant to the user.
 
@@ -234,16 +237,22 @@ class SQLServerSubclient(Subclient):
 
     def backup(
             self,
-            backup_level="Differential"):
+            backup_level="Differential",
+            reuse_running_job=False):
         """Runs a backup job for the subclient of the level specified.
 
             Args:
-                backup_level    (str)   --  level of backup the user wish to run
+                backup_level        (str)   --  level of backup the user wish to run
                         Full / Transaction_Log / Differential
                     default: Differential
 
+                reuse_running_job   (bool)  --  return the backup job already running for the
+                                                    subclient, instead of starting another one
+                    default: False
+
             Returns:
-                object - instance of the Job class for this backup job
+                object - instance of the Job class for this backup job,
+                             or the backup job already running for the subclient
 
             Raises:
                 SDKException:
@@ -253,9 +262,6 @@ class SQLServerSubclient(Subclient):
 
                     if response is not success
         """
-        backup_level = backup_level.lower()
-
-        if backup_level not in ['full', 'transaction_log', 'differential']:
-            raise SDKException('Subclient', '103')
-
-        return self._process_backup_request(backup_level)
+        return self._process_backup_request(
+            self._get_backup_request(backup_level), reuse_running_job
+        )
@@ -312,7 +312,9 @@ class WorkFlow(object):
             if flag:
                 if response.json():
                     if "jobId" in response.json():
-                        return Job(self._commcell_object, response.json()['jobId'])
+                        return Job(
+                            self._commcell_object, response.json()['jobId'], 'Workflow'
+                        )
                     elif "errorCode" in response.json():
                         error_message = response.json()['errorMessage']
 
@@ -0,0 +1,384 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""File for checkpointing the items of long bulk operations to a local SQLite database.
+
+WorkQueue: Class for the durable queue of the items of a bulk operation, and the job id
+               or error recorded for each of them
+
+Each item moves through the states:
+
+    pending     -   added to the queue, and not yet processed
+
+    started     -   the request for the item is being sent
+
+    done        -   the request succeeded, and the job id, if any, is recorded
+
+    failed      -   the request raised an error, and the error is recorded
+
+Every change of state is committed before moving on, so that if the process dies, a new
+WorkQueue on the same database resumes with the pending, and failed items only. The items left
+in the started state were being sent when the process died, and are returned by in_doubt(),
+instead of being sent again, as the server may have already started a job for them.
+
+Usage:
+    >>> queue = WorkQueue('/tmp/disable_backup.db', 'disable_backup')
+    >>> queue.add((client_name, None) for client_name in client_names)
+    >>> queue.run(lambda key, payload: commcell.clients.get(key).disable_backup())
+
+
+WorkQueue:
+    __init__(database_path,
+             queue_name)        --  opens the SQLite database at the path, and creates the
+                                        queue table, if it does not exist
+
+    __repr__()                  --  returns the string for the instance of the WorkQueue class
+
+    __len__()                   --  returns the number of items in the queue
+
+    _create_table()             --  creates the table to store the items, if not present
+
+    _execute()                  --  runs the SQL query, and returns all the rows fetched
+
+    _set_state()                --  updates the state of the item, and commits it to disk
+
+    _process()                  --  runs the function for the item, and checkpoints its result
+
+    add()                       --  adds the items to the queue, if not already present
+
+    pending()                   --  returns the items which are yet to be processed
+
+    in_doubt()                  --  returns the keys of the items interrupted while being sent
+
+    job_ids()                   --  returns the job id recorded for each of the items done
+
+    errors()                    --  returns the error recorded for each of the items failed
+
+    status()                    --  returns the number of items in each state
+
+    reset()                     --  moves the items given back to the pending state
+
+    run()                       --  runs the function for the pending items, checkpointing each
+
+    clear()                     --  deletes all the items of the queue
+
+    close()                     --  closes the connection to the database
+
+"""
+
+from __future__ import absolute_import
+
+import json
+import sqlite3
+import threading
+import time
+
+from .pool import WorkerPool
+from .exception import SDKException
+
+
+class WorkQueue(object):
+    """Class for the durable queue of the items of a bulk operation."""
+
+    STATES = ('pending', 'started', 'done', 'failed')
+
+    def __init__(self, database_path, queue_name='default'):
+        """Opens the SQLite database at the path given, and creates the queue table,
+            if it does not exist already.
+
+            Args:
+                database_path   (str)   --  full path of the SQLite database file
+
+                queue_name      (str)   --  name of the queue, to keep the items of more than
+                                                one bulk operation in the same database
+                    default: default
+
+            Returns:
+                object - instance of the WorkQueue class
+
+            Raises:
+                SDKException:
+                    if type of the database path, or queue name argument is not string
+        """
+        if not (isinstance(database_path, str) and isinstance(queue_name, str)):
+            raise SDKException('WorkQueue', '101')
+
+        self._database_path = database_path
+        self._queue_name = queue_name
+        self._lock = threading.Lock()
+
+        self._connection = sqlite3.connect(database_path, check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode=WAL')
+
+        self._create_table()
+
+    def __repr__(self):
+        """Representation string for the instance of the WorkQueue class."""
+        return "WorkQueue class instance for queue: '{0}' of database: '{1}'".format(
+            self._queue_name, self._database_path
+        )
+
+    def __len__(self):
+        """Returns the number of items in the queue."""
+        return self._execute(
+            'SELECT COUNT(*) FROM work_items WHERE queue_name = ?', (self._queue_name,)
+        )[0][0]
+
+    def _create_table(self):
+        """Creates the table to store the items of the queues, if it does not exist already."""
+        with self._lock, self._connection:
+            self._connection.executescript('''
+                CREATE TABLE IF NOT EXISTS work_items (
+                    queue_name TEXT NOT NULL,
+                    item_key TEXT NOT NULL,
+                    payload TEXT,
+                    state TEXT NOT NULL,
+                    job_id TEXT,
+                    error TEXT,
+                    update_time INTEGER NOT NULL,
+                    PRIMARY KEY (queue_name, item_key)
+                );
+                CREATE INDEX IF NOT EXISTS work_items_state ON work_items (queue_name, state);
+            ''')
+
+    def _execute(self, query, parameters=()):
+        """Runs the SQL query with the parameters given, commits it, and returns all the rows
+            fetched.
+
+            Args:
+                query       (str)    --  SQL query to run
+
+                parameters  (tuple)  --  values for the placeholders in the query
+                    default: ()
+
+            Returns:
+                list - list of all the rows returned by the query
+        """
+        with self._lock, self._connection:
+            return self._connection.execute(query, parameters).fetchall()
+
+    def _set_state(self, item_key, state, job_id=None, error=None):
+        """Updates the state of the item, along with its job id or error, and commits it.
+
+            Args:
+                item_key    (str)   --  key of the item
+
+                state       (str)   --  new state of the item
+
+                job_id      (str)   --  id of the job started for the item
+                    default: None
+
+                error       (str)   --  error raised for the item
+                    default: None
+        """
+        self._execute(
+            'UPDATE work_items SET state = ?, job_id = ?, error = ?, update_time = ? '
+            'WHERE queue_name = ? AND item_key = ?',
+            (state, job_id, error, int(time.time()), self._queue_name, item_key)
+        )
+
+    def _process(self, function, item):
+        """Runs the function for the item, checkpointing the item before and after it.
+
+            Args:
+                function    (function)  --  function to run, with the key and the payload
+
+                item        (tuple)     --  (key, payload) of the item
+
+            Returns:
+                object - result of the function
+
+            Raises:
+                Exception:
+                    the exception raised by the function, after recording it
+        """
+        item_key, payload = item
+
+        self._set_state(item_key, 'started')
+
+        try:
+            result = function(item_key, payload)
+        except Exception as excp:
+            self._set_state(item_key, 'failed', error=str(excp))
+            raise
+
+        job_id = getattr(result, 'job_id', None)
+
+        self._set_state(item_key, 'done', job_id=None if job_id is None else str(job_id))
+
+        return result
+
+    def add(self, items):
+        """Adds the items to the queue, in the pending state.
+            The items already present in the queue, in any state, are left as they are.
+
+            Args:
+                items   (iterable)  --  (key, payload) tuples of the items to add
+
+                    key     (str)   --  unique key of the item in the queue
+
+                    payload (object)    --  JSON serializable arguments of the item, or None
+
+            Returns:
+                int - number of the items added to the queue
+        """
+        now = int(time.time())
+        rows = [
+            (self._queue_name, str(item_key), json.dumps(payload), 'pending', now)
+            for item_key, payload in items
+        ]
+
+        with self._lock, self._connection:
+            before = self._connection.total_changes
+
+            self._connection.executemany(
+                'INSERT OR IGNORE INTO work_items '
+                '(queue_name, item_key, payload, state, update_time) VALUES (?, ?, ?, ?, ?)',
+                rows
+            )
+
+            return self._connection.total_changes - before
+
+    def pending(self, retry_failed=True):
+        """Returns the items of the queue, which are yet to be processed.
+
+            Args:
+                retry_failed    (bool)  --  include the items failed earlier, or not
+                    default: True
+
+            Returns:
+                list - (key, payload) tuples of the items, in the order they were added
+        """
+        states = ('pending', 'failed') if retry_failed else ('pending',)
+
+        rows = self._execute(
+            'SELECT item_key, payload FROM work_items WHERE queue_name = ? AND state IN ({0}) '
+            'ORDER BY rowid'.format(', '.join('?' * len(states))),
+            (self._queue_name,) + states
+        )
+
+        return [(item_key, json.loads(payload)) for item_key, payload in rows]
+
+    def in_doubt(self):
+        """Returns the keys of the items left in the started state, by a process which died
+            while sending their requests.
+
+            These items are not processed again by run(), as a job may already be running for
+            them. Use reset() to process them again, once verified.
+
+            Returns:
+                list - keys of the items in the started state
+        """
+        return [
+            row[0] for row in self._execute(
+                'SELECT item_key FROM work_items WHERE queue_name = ? AND state = ? '
+                'ORDER BY rowid',
+                (self._queue_name, 'started')
+            )
+        ]
+
+    def job_ids(self):
+        """Returns the job id recorded for each of the items done.
+
+            Returns:
+                dict - job id, or None, with the key of the item as key
+        """
+        return dict(self._execute(
+            'SELECT item_key, job_id FROM work_items WHERE queue_name = ? AND state = ?',
+            (self._queue_name, 'done')
+        ))
+
+    def errors(self):
+        """Returns the error recorded for each of the items failed.
+
+            Returns:
+                dict - error message, with the key of the item as key
+        """
+        return dict(self._execute(
+            'SELECT item_key, error FROM work_items WHERE queue_name = ? AND state = ?',
+            (self._queue_name, 'failed')
+        ))
+
+    def status(self):
+        """Returns the number of items of the queue in each state.
+
+            Returns:
+                dict - number of items, with the state as key
+                    {
+                        "pending": 0,
+                        "started": 0,
+                        "done": 0,
+                        "failed": 0
+                    }
+        """
+        status = dict((state, 0) for state in self.STATES)
+
+        status.update(self._execute(
+            'SELECT state, COUNT(*) FROM work_items WHERE queue_name = ? GROUP BY state',
+            (self._queue_name,)
+        ))
+
+        return status
+
+    def reset(self, item_keys):
+        """Moves the items given back to the pending state, to process them again.
+
+            Args:
+                item_keys   (list)  --  keys of the items to reset
+        """
+        for item_key in item_keys:
+            self._set_state(str(item_key), 'pending')
+
+    def run(self, function, item_keys=None, max_workers=8, stagger=0, retry_failed=True):
+        """Runs the function for all the pending items of the queue, with at most max workers
+            running concurrently, and checkpoints the state of each item to disk.
+
+            Args:
+                function        (function)  --  function to run for each item, with the key,
+                                                    and the payload of the item as arguments
+
+                    the job id of the result, if it is a Job, is recorded for the item
+
+                item_keys       (list)      --  keys of the items to process
+                    default: None; all the pending items of the queue
+
+                max_workers     (int)       --  maximum number of items to process concurrently
+                    default: 8
+
+                stagger         (float)     --  minimum number of seconds between the start of
+                                                    two consecutive items
+                    default: 0
+
+                retry_failed    (bool)      --  process the items failed earlier again, or not
+                    default: True
+
+            Returns:
+                dict - result of the function, or the exception raised, for each of the items
+                           processed, with the key of the item as key
+        """
+        items = self.pending(retry_failed)
+
+        if item_keys is not None:
+            item_keys = set(str(item_key) for item_key in item_keys)
+            items = [item for item in items if item[0] in item_keys]
+
+        results = WorkerPool(max_workers, stagger).map(
+            lambda item: self._process(function, item), items, return_exceptions=True
+        )
+
+        return dict((item[0], result) for item, result in zip(items, results))
+
+    def clear(self):
+        """Deletes all the items of the queue from the database."""
+        self._execute('DELETE FROM work_items WHERE queue_name = ?', (self._queue_name,))
+
+    def close(self):
+        """Closes the connection to the database."""
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,336 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Fake transport of the commcell REST APIs, shared by the tests.
+
+FakeResponse:   response of the fake transport, with the parts of the requests response used
+
+FakeTransport:  fake CVPySDK object, answering the requests from the routes added to it,
+                    and recording the URL of every request
+
+FakeJobServer:  fake transport, serving the summaries and the lists of the jobs set on it
+
+FakeCommcellServer: fake job server, also serving the clients and subclients set on it, and
+                        starting a backup job for every backup request
+
+FakeCommcell:   commcell with the services, job monitor, and job controller, over a fake transport
+
+"""
+
+from __future__ import absolute_import
+
+import json
+import re
+import threading
+
+try:
+    # Python 3 import
+    from urllib.parse import parse_qs
+except ImportError:
+    # Python 2 import
+    from urlparse import parse_qs
+
+from cvpysdk.jobcontroller import JobController
+from cvpysdk.jobmonitor import JobMonitor
+from cvpysdk.services import ApiLibrary
+
+
+WEB_SERVICE = 'http://webconsole/webconsole/api/'
+
+
+class FakeResponse(object):
+    """Response of the fake transport, with the parts of the requests response used."""
+
+    def __init__(self, status_code, body, headers=None):
+        self.status_code = status_code
+        self.ok = status_code < 400
+        self.headers = headers or {}
+        self.text = json.dumps(body)
+        self.content = self.text.encode('utf-8')
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class FakeTransport(object):
+    """Fake CVPySDK object, answering each request with the first route matching its URL.
+
+        A route is a regular expression for the URL, without the web service, and a handler
+        called with the method, the match, and the payload of the request, which returns the
+        status code and the JSON body of the response.
+    """
+
+    def __init__(self):
+        self.requests = []
+        self._routes = []
+        self._lock = threading.Lock()
+
+    def route(self, pattern, handler):
+        self._routes.append((re.compile(pattern + '$'), handler))
+
+    def make_request(self, method, url, payload=None, attempts=0):
+        url = url.replace(WEB_SERVICE, '')
+
+        with self._lock:
+            self.requests.append((method, url, payload))
+
+            for pattern, handler in self._routes:
+                match = pattern.match(url)
+
+                if match:
+                    status_code, body = handler(method, match, payload)
+                    break
+            else:
+                status_code, body = 404, {}
+
+        return status_code == 200, FakeResponse(status_code, body)
+
+    def urls(self, method=None):
+        with self._lock:
+            return [request[1] for request in self.requests if method in (None, request[0])]
+
+    def count(self, url):
+        return self.urls().count(url)
+
+
+class FakeJobServer(FakeTransport):
+    """Fake transport, serving the jobs set on it.
+
+        The jobs with the Running or Pending status are listed as active, and the others as
+        finished. The pages of the job lists honour the offset and limit of the request, and
+        the total number of the jobs is sent only if report_total is set.
+    """
+
+    ACTIVE_STATUSES = ('Running', 'Pending', 'Waiting', 'Suspended')
+
+    def __init__(self, report_total=True):
+        super(FakeJobServer, self).__init__()
+
+        self.jobs = {}
+        self.report_total = report_total
+
+        self.route(r'Job\?(.*)', self._list_jobs)
+        self.route(r'Job/(\d+)', self._get_job)
+        self.route(r'Job/(\d+)/action/(\w+)', self._run_job_action)
+
+    def set_job(self, job_id, status='Running', subclient_id=10, job_type='Backup'):
+        self.jobs[str(job_id)] = {
+            'jobId': int(job_id),
+            'jobType': job_type,
+            'status': status,
+            'jobStartTime': 1500000000,
+            'lastUpdateTime': 0,
+            'pendingReason': '',
+            'subclient': {
+                'clientName': 'client',
+                'appName': 'File System',
+                'subclientName': 'default',
+                'subclientId': subclient_id
+            }
+        }
+
+    def set_status(self, job_id, status):
+        self.jobs[str(job_id)] = dict(self.jobs[str(job_id)], status=status)
+
+    def _list_jobs(self, method, match, payload):
+        query = dict((key, value[0]) for key, value in parse_qs(match.group(1)).items())
+        job_types = query.get('jobFilter', '').split(',')
+        category = query.get('jobCategory', 'Active')
+
+        jobs = [
+            self.jobs[job_id] for job_id in sorted(self.jobs, key=int)
+            if self.jobs[job_id]['jobType'] in job_types and (
+                category == 'All' or
+                (self.jobs[job_id]['status'] in self.ACTIVE_STATUSES) == (category == 'Active')
+            )
+        ]
+
+        offset = int(query.get('offset', 0))
+        page = jobs[offset:offset + int(query['limit'])] if 'limit' in query else jobs[offset:]
+
+        body = {'jobs': [{'jobSummary': job_summary} for job_summary in page]}
+
+        if self.report_total:
+            body['totalRecordsWithoutPaging'] = len(jobs)
+
+        return 200, body
+
+    def _get_job(self, method, match, payload):
+        if match.group(1) not in self.jobs:
+            return 200, {'totalRecordsWithoutPaging': 0}
+
+        return 200, {
+            'totalRecordsWithoutPaging': 1,
+            'jobs': [{'jobSummary': self.jobs[match.group(1)]}]
+        }
+
+    def _run_job_action(self, method, match, payload):
+        if match.group(1) not in self.jobs:
+            return 500, {'errorMessage': 'job not found'}
+
+        return 200, {'errorCode': 0}
+
+
+class FakeCommcellServer(FakeJobServer):
+    """Fake job server, serving the clients and the subclients set on it.
+
+        Each agent of a client has a single instance, and a single default backupset, with all
+        the subclients of the agent. The backup requests are recorded, and each one starts a
+        new running backup job.
+    """
+
+    AGENTS = {'File System': 33, 'SQL Server': 81}
+
+    def __init__(self, report_total=True):
+        super(FakeCommcellServer, self).__init__(report_total)
+
+        self.clients = {}
+        self.subclients = {}
+        self.backups = []
+        self._job_ids = iter(range(1000, 100000))
+
+        self.route(r'Client', self._get_clients)
+        self.route(r'Agent\?clientId=(\d+)', self._get_agents)
+        self.route(r'Instance\?clientId=(\d+)', self._get_instances)
+        self.route(r'Backupset\?clientId=(\d+)(&excludeHidden=0)?', self._get_backupsets)
+        self.route(r'Subclient\?clientId=(\d+)', self._get_subclients)
+        self.route(r'Subclient/(\d+)', self._get_subclient)
+        self.route(r'Subclient/(\d+)/action/backup\?backupLevel=(.+)', self._backup)
+        self.route(r'Schedules\?clientId=(\d+)', lambda *args: (200, {'taskDetail': []}))
+
+    def add_client(self, client_id, client_name):
+        self.clients[int(client_id)] = client_name
+
+    def add_subclient(
+            self,
+            client_id,
+            subclient_id,
+            subclient_name,
+            agent_name='File System',
+            is_backup_enabled=True,
+            storage_policy='SP-Gold',
+            content=None):
+        self.subclients[int(subclient_id)] = {
+            'client_id': int(client_id),
+            'subclient_name': subclient_name,
+            'agent_name': agent_name,
+            'is_backup_enabled': is_backup_enabled,
+            'storage_policy': storage_policy,
+            'content': content if content is not None else [{'path': '/' + subclient_name}]
+        }
+
+    def _agent_names(self, client_id):
+        return sorted(set(
+            subclient['agent_name'] for subclient in self.subclients.values()
+            if subclient['client_id'] == int(client_id)
+        ))
+
+    def _entity(self, client_id, agent_name):
+        application_id = self.AGENTS[agent_name]
+
+        return {
+            'clientId': int(client_id),
+            'clientName': self.clients[int(client_id)],
+            'appName': agent_name,
+            'applicationId': application_id,
+            'instanceName': 'DefaultInstanceName',
+            'instanceId': application_id,
+            'backupsetName': 'defaultBackupSet',
+            'backupsetId': int(client_id) * 100 + application_id
+        }
+
+    def _subclient_properties(self, subclient_id, include_content=False):
+        subclient = self.subclients[subclient_id]
+        entity = self._entity(subclient['client_id'], subclient['agent_name'])
+        entity.update(subclientName=subclient['subclient_name'], subclientId=subclient_id)
+
+        properties = {
+            'subClientEntity': entity,
+            'commonProperties': {
+                'enableBackup': subclient['is_backup_enabled'],
+                'storageDevice': {
+                    'dataBackupStoragePolicy': {'storagePolicyName': subclient['storage_policy']}
+                }
+            }
+        }
+
+        if include_content:
+            properties['content'] = subclient['content']
+
+        return properties
+
+    def _get_clients(self, method, match, payload):
+        return 200, {'clientProperties': [
+            {'client': {'clientEntity': {'clientName': client_name, 'clientId': client_id}}}
+            for client_id, client_name in sorted(self.clients.items())
+        ]}
+
+    def _get_agents(self, method, match, payload):
+        return 200, {'agentProperties': [
+            {'idaEntity': self._entity(match.group(1), agent_name)}
+            for agent_name in self._agent_names(match.group(1))
+        ]}
+
+    def _get_instances(self, method, match, payload):
+        return 200, {'instanceProperties': [
+            {'instance': self._entity(match.group(1), agent_name)}
+            for agent_name in self._agent_names(match.group(1))
+        ]}
+
+    def _get_backupsets(self, method, match, payload):
+        return 200, {'backupsetProperties': [
+            {
+                'backupSetEntity': self._entity(match.group(1), agent_name),
+                'commonBackupSet': {'isDefaultBackupSet': True}
+            } for agent_name in self._agent_names(match.group(1))
+        ]}
+
+    def _get_subclients(self, method, match, payload):
+        return 200, {'subClientProperties': [
+            self._subclient_properties(subclient_id)
+            for subclient_id in sorted(self.subclients)
+            if self.subclients[subclient_id]['client_id'] == int(match.group(1))
+        ]}
+
+    def _get_subclient(self, method, match, payload):
+        if int(match.group(1)) not in self.subclients:
+            return 200, {}
+
+        return 200, {
+            'subClientProperties': [self._subclient_properties(int(match.group(1)), True)]
+        }
+
+    def _backup(self, method, match, payload):
+        subclient_id = int(match.group(1))
+
+        if method != 'POST' or subclient_id not in self.subclients:
+            return 200, {'errorCode': 1, 'errorMessage': 'subclient not found'}
+
+        job_id = next(self._job_ids)
+
+        self.backups.append((subclient_id, match.group(2)))
+        self.set_job(job_id, 'Running', subclient_id)
+
+        return 200, {'jobIds': [str(job_id)]}
+
+
+class FakeCommcell(object):
+    """Commcell with the services, job monitor, and job controller, over the fake transport."""
+
+    def __init__(self, transport=None):
+        self._services = ApiLibrary(WEB_SERVICE)
+        self._cvpysdk_object = transport if transport is not None else FakeJobServer()
+        self._headers = {'Host': 'webconsole', 'Authtoken': 'QSDK token'}
+
+        self.browse_cache = None
+        self.job_monitor = JobMonitor(self, min_interval=0.01, max_interval=0.05)
+        self.jobs = JobController(self)
+
+    def _update_response_(self, response_text):
+        return response_text
@@ -0,0 +1,170 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Tests for the ActiveBackups view of the JobController, against the fake job server."""
+
+from __future__ import absolute_import
+
+import re
+import threading
+import time
+import unittest
+
+from cvpysdk.job import Job
+
+from fakes import FakeCommcell
+
+
+ACTIVE_JOBS = 'Job?clientId=0&jobFilter=Backup&jobCategory=Active&offset=0&limit=100'
+
+
+class ActiveBackupsTest(unittest.TestCase):
+
+    def setUp(self):
+        self.commcell = FakeCommcell()
+        self.server = self.commcell._cvpysdk_object
+        self.active_backups = self.commcell.jobs.active_backups
+
+    def tearDown(self):
+        self.commcell.job_monitor.stop()
+
+    def block_active_jobs(self):
+        """Blocks the requests for the active jobs, until the event returned is set."""
+        fetching = threading.Event()
+        release = threading.Event()
+
+        def list_jobs(method, match, payload):
+            fetching.set()
+            release.wait(5)
+            return self.server._list_jobs(method, match, payload)
+
+        # the first route matching the URL answers it
+        self.server._routes.insert(0, (re.compile(r'Job\?(.*)$'), list_jobs))
+
+        return fetching, release
+
+    def test_view_reused_within_max_age(self):
+        self.server.set_job(1, 'Running', subclient_id=10)
+
+        self.assertEqual(self.active_backups.get(10), 1)
+        self.assertEqual(self.active_backups.get('10'), 1)
+        self.assertEqual(self.active_backups.get(20), None)
+        self.assertEqual(self.server.count(ACTIVE_JOBS), 1)
+
+        self.active_backups.invalidate()
+        self.active_backups.get(10)
+
+        self.assertEqual(self.server.count(ACTIVE_JOBS), 2)
+
+    def test_get_job_returns_tracked_instance(self):
+        self.server.set_job(1, 'Running', subclient_id=10)
+        job = Job(self.commcell, 1, 'Backup')
+
+        self.assertIs(self.active_backups.get_job(10), job)
+        self.assertIs(self.active_backups.get_job(10), job)
+
+    def test_get_job_confirms_the_job_is_running(self):
+        self.server.set_job(1, 'Running', subclient_id=10)
+        self.assertEqual(self.active_backups.get(10), 1)
+
+        # the job was killed after the view was got, and is not tracked by the monitor
+        self.server.set_status(1, 'Killed')
+
+        self.assertEqual(self.active_backups.get_job(10), None)
+        self.assertEqual(self.active_backups.get(10), None)
+        self.assertEqual(self.server.count(ACTIVE_JOBS), 1)
+
+    def test_get_job_for_deleted_job(self):
+        self.active_backups.add(10, 5)
+
+        self.assertEqual(self.active_backups.get_job(10), None)
+        self.assertEqual(self.active_backups.get(10), None)
+
+    def test_finished_job_discarded_by_monitor(self):
+        self.server.set_job(1, 'Running', subclient_id=10)
+        job = Job(self.commcell, 1, 'Backup')
+
+        self.assertEqual(self.active_backups.get(10), 1)
+
+        self.server.set_status(1, 'Completed')
+        self.assertTrue(self.commcell.job_monitor.wait(job, timeout=5))
+
+        # the job is discarded by the poller, right after the waiting threads are notified
+        end_time = time.time() + 5
+
+        while self.active_backups.get(10) is not None and time.time() < end_time:
+            time.sleep(0.01)
+
+        self.assertEqual(self.active_backups.get(10), None)
+        self.assertEqual(self.server.count(ACTIVE_JOBS), 1)
+
+    def test_discard_only_the_subclient_of_the_job(self):
+        self.server.set_job(1, 'Running', subclient_id=10)
+        self.server.set_job(2, 'Running', subclient_id=20)
+        self.active_backups.get(10)
+
+        self.active_backups.discard(1)
+        self.active_backups.discard(3)
+
+        self.assertEqual(self.active_backups.get(10), None)
+        self.assertEqual(self.active_backups.get(20), 2)
+
+        # the job replaced by a new job of the subclient does not discard the new job
+        self.active_backups.add(20, 4)
+        self.active_backups.discard(2)
+
+        self.assertEqual(self.active_backups.get(20), 4)
+
+    def test_view_not_locked_while_getting_active_jobs(self):
+        self.server.set_job(1, 'Running', subclient_id=10)
+        self.server.set_job(2, 'Running', subclient_id=20)
+        fetching, release = self.block_active_jobs()
+
+        results = {}
+        lookup = threading.Thread(
+            target=lambda: results.update(job_id=self.active_backups.get(10))
+        )
+        lookup.start()
+        self.assertTrue(fetching.wait(5))
+
+        # the jobs added and discarded while the active jobs are got are kept in the new view
+        adder = threading.Thread(target=self.active_backups.add, args=(30, 3))
+        adder.start()
+        adder.join(1)
+        self.assertFalse(adder.is_alive())
+
+        self.active_backups.discard(2)
+        release.set()
+        lookup.join(5)
+
+        self.assertEqual(results, {'job_id': 1})
+        self.assertEqual(self.active_backups.get(30), 3)
+        self.assertEqual(self.active_backups.get(20), None)
+        self.assertEqual(self.server.count(ACTIVE_JOBS), 1)
+
+    def test_single_request_for_concurrent_lookups(self):
+        self.server.set_job(1, 'Running', subclient_id=10)
+        fetching, release = self.block_active_jobs()
+
+        lookups = [threading.Thread(target=self.active_backups.get, args=(10, )) for _ in range(4)]
+
+        for lookup in lookups:
+            lookup.start()
+
+        self.assertTrue(fetching.wait(5))
+        release.set()
+
+        for lookup in lookups:
+            lookup.join(5)
+
+        self.assertEqual(self.server.count(ACTIVE_JOBS), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Tests for the JobHistory statistics, with and without NumPy."""
+
+from __future__ import absolute_import
+
+import unittest
+
+try:
+    # Python 3 import
+    from unittest import mock
+except ImportError:
+    # Python 2 import
+    import mock
+
+from cvpysdk import analytics
+from cvpysdk.analytics import JobHistory
+from cvpysdk.exception import SDKException
+
+
+def job_summary(job_id, client_name, status='Completed', duration=10, size=100, **kwargs):
+    summary = {
+        'jobId': job_id,
+        'status': status,
+        'subclient': {'clientName': client_name, 'appName': 'File System'},
+        'storagePolicy': {'storagePolicyName': 'SP-Gold'},
+        'jobElapsedTime': duration,
+        'sizeOfApplication': size
+    }
+    summary.update(kwargs)
+
+    return summary
+
+
+class JobHistoryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.history = JobHistory.from_summaries([
+            job_summary(1, 'client1', duration=10, size=100),
+            job_summary(2, 'client2', 'Failed', duration=20, size=400, delayReason='No media'),
+            job_summary(3, 'client1', 'Killed', duration=30, size=300, pendingReason='Busy'),
+            job_summary(4, 'client1', duration=0, size=50, delayReason='No media'),
+            job_summary(5, 'client2', duration=None, size=None, delayReason='No media')
+        ])
+
+    def test_distribution(self):
+        duration = self.history.distribution('client', 'duration')
+
+        self.assertEqual(duration['client1'], {
+            'count': 3, 'min': 0.0, 'mean': 40 / 3, 'median': 10.0, 'p90': 30.0, 'max': 30.0
+        })
+        self.assertEqual(duration['client2']['count'], 1)
+
+        throughput = self.history.distribution(None, 'throughput')[None]
+        self.assertEqual((throughput['count'], throughput['min'], throughput['max']),
+                         (3, 10.0, 20.0))
+
+    def test_failure_rate(self):
+        self.assertEqual(self.history.failure_rate(), {'client1': 1 / 3, 'client2': 0.5})
+        self.assertEqual(self.history.failure_rate('storage_policy'), {'SP-Gold': 0.4})
+
+    def test_delay_causes(self):
+        self.assertEqual(self.history.delay_causes(), {None: [('No media', 3), ('Busy', 1)]})
+        self.assertEqual(
+            self.history.delay_causes('client', top=1),
+            {'client1': [('Busy', 1)], 'client2': [('No media', 2)]}
+        )
+
+    def test_summary(self):
+        summary = self.history.summary('agent')['File System']
+
+        self.assertEqual(summary['jobs'], 5)
+        self.assertEqual(summary['size']['max'], 400.0)
+
+    def test_empty_history(self):
+        self.assertEqual(JobHistory([]).distribution('client'), {})
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(SDKException):
+            self.history.distribution('subclient')
+
+        with self.assertRaises(SDKException):
+            self.history.distribution('client', 'speed')
+
+
+@unittest.skipIf(analytics._import_numpy() is None, 'NumPy is not installed')
+class JobHistoryNumPyTest(JobHistoryTest):
+    """Runs the tests with the statistics computed by NumPy."""
+
+
+class JobHistoryWithoutNumPyTest(JobHistoryTest):
+    """Runs the tests with the statistics computed by the Python loops."""
+
+    def setUp(self):
+        patcher = mock.patch('cvpysdk.analytics._import_numpy', return_value=None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        super(JobHistoryWithoutNumPyTest, self).setUp()
+
+
+if __name__ == '__main__':
+    unittest.main()
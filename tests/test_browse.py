@@ -0,0 +1,289 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Tests for the paged and the recursive browse of the subclient content, against a fake browse
+server.
+"""
+
+from __future__ import absolute_import
+
+import threading
+import time
+import unittest
+
+from cvpysdk.browse import BrowseEntry
+from cvpysdk.exception import SDKException
+from cvpysdk.subclient import Subclients
+
+from fakes import FakeCommcell, FakeTransport
+
+
+class Entity(object):
+    """Entity of the subclient, with the attributes given."""
+
+    def __init__(self, **kwargs):
+        self.__dict__.update(kwargs)
+
+
+class FakeBrowseServer(FakeTransport):
+    """Fake transport browsing the folders set on it, a page at a time.
+
+        The folders are keyed by their paths without the leading and trailing separators,
+        as sent by the File System subclients, and each one has a list of the
+        (name, size) tuples of its entries, with None as the size of a sub-folder.
+    """
+
+    def __init__(self, folders, report_total=True):
+        super(FakeBrowseServer, self).__init__()
+
+        self.folders = folders
+        self.report_total = report_total
+        self.pages = []
+
+        self.route(r'DoBrowse', self._browse)
+
+    def _results(self, folder):
+        return [
+            {
+                'path': '\\' + '\\'.join(filter(None, (folder, name))),
+                'displayName': name,
+                'flags': {'file': size is not None},
+                'size': size or 0,
+                'modificationTime': 1500000000 + (size or 0)
+            } for name, size in self.folders[folder]
+        ]
+
+    def _browse(self, method, match, payload):
+        query = payload['queries'][0]
+
+        if 'whereClause' in query:
+            name = query['whereClause'][0]['criteria']['values'][0]
+            folder = 'find:' + name
+            results = [
+                result for path in sorted(self.folders) for result in self._results(path)
+                if result['displayName'] == name
+            ]
+        else:
+            folder = payload['paths'][0]['path'].strip('\\')
+
+            if folder not in self.folders:
+                return 200, {'browseResponses': [{
+                    'messages': [{'errorMessage': 'path not found: ' + folder}]
+                }]}
+
+            results = self._results(folder)
+
+        paging = query['dataParam']['paging']
+        first_node, page_size = paging['firstNode'], paging['pageSize']
+
+        # the paging of the request is changed in place for the next page, so it is recorded
+        self.pages.append((folder, first_node))
+
+        browse_result = {'dataResultSet': results[first_node:first_node + page_size]}
+
+        if self.report_total:
+            browse_result['totalItemsFound'] = len(results)
+
+        return 200, {'browseResponses': [{'browseResult': browse_result}]}
+
+
+def make_subclient(commcell):
+    """Returns a File System subclient of the commcell, without getting its properties."""
+    client = Entity(client_name='client1', client_id='1')
+    agent = Entity(agent_id='33', _client_object=client)
+
+    # the subclient classes are loaded by the Subclients class, before any subclient is made
+    subclient_class = Subclients._get_subclient_classes()['file system']
+
+    subclient = subclient_class.__new__(subclient_class)
+    subclient._commcell_object = commcell
+    subclient._subclient_id = '5'
+    subclient._BROWSE = commcell._services.BROWSE
+    subclient._backupset_object = Entity(
+        backupset_id='2', _agent_object=agent, _instance_object=Entity(instance_id='1')
+    )
+
+    return subclient
+
+
+class IterBrowseTest(unittest.TestCase):
+
+    REPORT_TOTAL = True
+
+    FOLDERS = {
+        '': [('data', None), ('readme.txt', 10)],
+        'data': [('file{0}.log'.format(index), 100 * index) for index in range(1, 6)],
+        'data\\empty': []
+    }
+
+    def setUp(self):
+        self.server = FakeBrowseServer(self.FOLDERS, self.REPORT_TOTAL)
+        self.commcell = FakeCommcell(self.server)
+        self.subclient = make_subclient(self.commcell)
+
+    def tearDown(self):
+        self.commcell.job_monitor.stop()
+
+    def test_all_pages(self):
+        entries = list(self.subclient.iter_browse('\\data\\', page_size=2))
+
+        self.assertEqual([entry.name for entry in entries],
+                         ['file{0}.log'.format(index) for index in range(1, 6)])
+        self.assertEqual(entries[0], BrowseEntry(
+            '\\data\\file1.log', 'file1.log', True, 100, 1500000100
+        ))
+        self.assertEqual(self.server.pages, [('data', 0), ('data', 2), ('data', 4)])
+
+    def test_full_last_page(self):
+        self.assertEqual(len(list(self.subclient.iter_browse('\\', page_size=2))), 2)
+
+        # the last page is known only by the total, or a short page without it
+        self.assertEqual(
+            [page[1] for page in self.server.pages], [0] if self.REPORT_TOTAL else [0, 2]
+        )
+
+    def test_empty_folder(self):
+        self.assertEqual(list(self.subclient.iter_browse('\\data\\empty', page_size=2)), [])
+        self.assertEqual(self.server.pages, [('data\\empty', 0)])
+
+    def test_pages_got_lazily(self):
+        entries = self.subclient.iter_browse('\\data', page_size=2)
+
+        self.assertEqual(self.server.pages, [])
+
+        next(entries)
+        next(entries)
+        self.assertEqual(len(self.server.pages), 1)
+
+        next(entries)
+        self.assertEqual(len(self.server.pages), 2)
+
+    def test_iter_find(self):
+        entries = list(self.subclient.iter_find('file3.log', page_size=2))
+
+        self.assertEqual([entry.path for entry in entries], ['\\data\\file3.log'])
+        self.assertEqual(self.server.pages, [('find:file3.log', 0)])
+
+    def test_browse_error(self):
+        self.server.route(r'DoBrowse', lambda *args: (200, {'browseResponses': [{
+            'messages': [{'errorMessage': 'index not available'}]
+        }]}))
+
+        # the first route matching the URL answers it
+        self.server._routes.insert(0, self.server._routes.pop())
+
+        with self.assertRaises(SDKException) as context:
+            list(self.subclient.iter_browse('\\data'))
+
+        self.assertIn('index not available', context.exception.exception_message)
+
+    def test_invalid_page_size(self):
+        for page_size in (0, '10'):
+            with self.assertRaises(SDKException):
+                self.subclient.iter_browse('\\data', page_size=page_size)
+
+
+class IterBrowseWithoutTotalTest(IterBrowseTest):
+    """Runs the tests against a server which does not send the total number of the results."""
+
+    REPORT_TOTAL = False
+
+
+class WalkTest(unittest.TestCase):
+
+    FOLDERS = {
+        '': [('data', None), ('readme.txt', 10)],
+        'data': [('logs', None), ('a.log', 100), ('b.txt', 2000)],
+        'data\\logs': [('c.log', 300), ('old', None)],
+        'data\\logs\\old': [('d.log', 50)]
+    }
+
+    def setUp(self):
+        self.server = FakeBrowseServer(dict(self.FOLDERS))
+        self.commcell = FakeCommcell(self.server)
+        self.subclient = make_subclient(self.commcell)
+
+    def tearDown(self):
+        self.commcell.job_monitor.stop()
+
+    def walk(self, **kwargs):
+        return set(
+            (path, entry.path) for path, entry in self.subclient.walk(workers=3, **kwargs)
+        )
+
+    def test_walk_all_levels(self):
+        self.assertEqual(self.walk(page_size=2), set([
+            ('\\', '\\data'),
+            ('\\', '\\readme.txt'),
+            ('\\data', '\\data\\logs'),
+            ('\\data', '\\data\\a.log'),
+            ('\\data', '\\data\\b.txt'),
+            ('\\data\\logs', '\\data\\logs\\c.log'),
+            ('\\data\\logs', '\\data\\logs\\old'),
+            ('\\data\\logs\\old', '\\data\\logs\\old\\d.log')
+        ]))
+
+        # each folder is browsed once, a page at a time
+        self.assertEqual(sorted(self.server.pages), [
+            ('', 0), ('data', 0), ('data', 2), ('data\\logs', 0), ('data\\logs\\old', 0)
+        ])
+
+    def test_max_depth(self):
+        self.assertEqual(self.walk(path='\\data', max_depth=1), set([
+            ('\\data', '\\data\\logs'),
+            ('\\data', '\\data\\a.log'),
+            ('\\data', '\\data\\b.txt')
+        ]))
+        self.assertEqual(self.server.pages, [('data', 0)])
+
+    def test_filters_applied_on_files(self):
+        entries = self.walk(filters={'name': '*.LOG', 'min_size': 100})
+
+        self.assertEqual(sorted(path for _, path in entries), [
+            '\\data', '\\data\\a.log', '\\data\\logs', '\\data\\logs\\c.log',
+            '\\data\\logs\\old'
+        ])
+
+    def test_browse_error_raised(self):
+        del self.server.folders['data\\logs\\old']
+
+        with self.assertRaises(SDKException) as context:
+            self.walk()
+
+        self.assertIn('data\\logs\\old', context.exception.exception_message)
+
+    def test_workers_stopped_with_walk(self):
+        threads = set(threading.enumerate())
+
+        walker = iter(self.subclient.walk(workers=4))
+        next(walker)
+        workers = set(threading.enumerate()) - threads
+        walker.close()
+
+        end_time = time.time() + 5
+
+        while any(worker.is_alive() for worker in workers) and time.time() < end_time:
+            time.sleep(0.01)
+
+        self.assertEqual(len(workers), 4)
+        self.assertFalse(any(worker.is_alive() for worker in workers))
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(SDKException) as context:
+            self.subclient.walk(filters={'extension': 'log'})
+
+        self.assertEqual(context.exception.exception_id, '113')
+
+        for kwargs in ({'workers': 0}, {'max_depth': '2'}):
+            with self.assertRaises(SDKException):
+                self.subclient.walk(**kwargs)
+
+
+if __name__ == '__main__':
+    unittest.main()
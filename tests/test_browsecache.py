@@ -0,0 +1,223 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Tests for the BrowseCache, and the browse results cached for the subclients."""
+
+from __future__ import absolute_import
+
+import json
+import time
+import unittest
+
+from cvpysdk.browse import BrowseCache, BrowseResult
+from cvpysdk.exception import SDKException
+from cvpysdk.subclient import Subclient, Subclients
+
+from fakes import FakeCommcell, FakeCommcellServer
+
+
+class FakeResponse(object):
+    """Browse response of the fake transport, with the content the results are sized by."""
+
+    def __init__(self, paths):
+        self.text = json.dumps({
+            'browseResponses': [{
+                'browseResult': {
+                    'dataResultSet': [
+                        {
+                            'path': path,
+                            'displayName': path.rsplit('\\', 1)[-1],
+                            'flags': {'file': True},
+                            'size': 1024,
+                            'modificationTime': 1500000000
+                        } for path in paths
+                    ]
+                }
+            }]
+        })
+        self.content = self.text.encode('utf-8')
+
+    def json(self):
+        return json.loads(self.text)
+
+    def result_set(self):
+        return self.json()['browseResponses'][0]['browseResult']['dataResultSet']
+
+
+def put(cache, subclient_id, path, paths):
+    """Stores the result of the fake browse response in the cache, as the subclient does."""
+    response = FakeResponse(paths)
+    result = BrowseResult.from_result_set(response.result_set())
+
+    cache.put(BrowseCache.key(subclient_id, 'Browse', path), result, len(response.content))
+
+    return result, len(response.content)
+
+
+class BrowseCacheTest(unittest.TestCase):
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(SDKException):
+            BrowseCache(max_bytes='1')
+
+        with self.assertRaises(SDKException):
+            BrowseCache(ttl=0)
+
+    def test_key_normalizes_path(self):
+        self.assertEqual(BrowseCache.key(5, 'Browse', 'C:/data/'), ('5', 'Browse', 'C:\\data'))
+        self.assertEqual(BrowseCache.key('5', 'Browse', '\\'), ('5', 'Browse', '\\'))
+
+    def test_get_and_put(self):
+        cache = BrowseCache()
+        result, size = put(cache, 5, '\\data', ['\\data\\a', '\\data\\b'])
+
+        self.assertIs(cache.get(BrowseCache.key(5, 'Browse', '\\data\\')), result)
+        self.assertEqual(cache.get(BrowseCache.key(5, 'Browse', '\\other')), None)
+        self.assertEqual((cache.hits, cache.misses), (1, 1))
+        self.assertEqual(cache.size, size)
+
+    def test_evicts_least_recently_used_by_size(self):
+        size = len(FakeResponse(['\\a\\file']).content)
+        cache = BrowseCache(max_bytes=size * 2)
+
+        put(cache, 5, '\\a', ['\\a\\file'])
+        put(cache, 5, '\\b', ['\\b\\file'])
+
+        # use a, so b is the least recently used
+        self.assertNotEqual(cache.get(BrowseCache.key(5, 'Browse', '\\a')), None)
+
+        put(cache, 5, '\\c', ['\\c\\file'])
+
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.size, size * 2)
+        self.assertEqual(cache.get(BrowseCache.key(5, 'Browse', '\\b')), None)
+        self.assertNotEqual(cache.get(BrowseCache.key(5, 'Browse', '\\a')), None)
+        self.assertNotEqual(cache.get(BrowseCache.key(5, 'Browse', '\\c')), None)
+
+    def test_result_larger_than_cache_not_stored(self):
+        cache = BrowseCache(max_bytes=64)
+        put(cache, 5, '\\a', ['\\a\\file'])
+
+        self.assertEqual((len(cache), cache.size), (0, 0))
+
+    def test_expired_result_removed(self):
+        cache = BrowseCache(ttl=0.05)
+        put(cache, 5, '\\a', ['\\a\\file'])
+
+        time.sleep(0.1)
+
+        self.assertEqual(cache.get(BrowseCache.key(5, 'Browse', '\\a')), None)
+        self.assertEqual((len(cache), cache.size), (0, 0))
+
+    def test_invalidate_subclient(self):
+        cache = BrowseCache()
+        put(cache, 5, '\\a', ['\\a\\file'])
+        _, size = put(cache, 6, '\\a', ['\\a\\file'])
+
+        cache.invalidate(5)
+
+        self.assertEqual(cache.get(BrowseCache.key(5, 'Browse', '\\a')), None)
+        self.assertNotEqual(cache.get(BrowseCache.key(6, 'Browse', '\\a')), None)
+        self.assertEqual(cache.size, size)
+
+        cache.invalidate()
+
+        self.assertEqual((len(cache), cache.size), (0, 0))
+
+    def test_copy_of_result_is_independent(self):
+        cache = BrowseCache()
+        result, _ = put(cache, 5, '\\a', ['\\a\\x', '\\a\\y'])
+
+        copy = cache.get(BrowseCache.key(5, 'Browse', '\\a')).copy()
+        copy.extend(FakeResponse(['\\a\\z']).result_set())
+        copy.paths[0] = '\\changed'
+        copy.sizes[1] = 0
+
+        self.assertEqual(len(copy), 3)
+        self.assertEqual(result.paths, ['\\a\\x', '\\a\\y'])
+        self.assertEqual(list(result.sizes), [1024, 1024])
+
+
+class SubclientBrowseCacheTest(unittest.TestCase):
+
+    PATHS = ['\\data\\a', '\\data\\b']
+
+    def setUp(self):
+        self.server = FakeCommcellServer()
+        self.server.add_client(1, 'client1')
+        self.server.add_subclient(1, 5, 'default')
+        self.server.route(r'DoBrowse', self.browse)
+
+        self.commcell = FakeCommcell(self.server)
+        self.commcell.browse_cache = BrowseCache()
+
+        self.subclient = Subclient.__new__(Subclient)
+        self.subclient._commcell_object = self.commcell
+
+    def tearDown(self):
+        self.commcell.job_monitor.stop()
+
+    def browse(self, method, match, payload):
+        return 200, FakeResponse(self.PATHS).json()
+
+    def get_browse_result(self, columnar=False):
+        return self.subclient._get_browse_result(
+            BrowseCache.key(5, 'Browse', '\\data'),
+            'Browse',
+            'POST',
+            self.commcell._services.BROWSE,
+            {},
+            columnar=columnar
+        )
+
+    def test_result_reused(self):
+        paths, paths_dict = self.get_browse_result()
+
+        self.assertEqual(paths, self.PATHS)
+        self.assertEqual(self.get_browse_result(), (paths, paths_dict))
+        self.assertEqual(self.server.count('DoBrowse'), 1)
+        self.assertEqual(self.commcell.browse_cache.hits, 1)
+
+    def test_result_returned_is_a_copy(self):
+        paths, paths_dict = self.get_browse_result()
+        paths.append('\\data\\c')
+        paths_dict.clear()
+
+        paths, paths_dict = self.get_browse_result()
+
+        self.assertEqual(paths, self.PATHS)
+        self.assertEqual(sorted(paths_dict), self.PATHS)
+
+    def test_columnar_result_returned_is_a_copy(self):
+        result = self.get_browse_result(columnar=True)
+        result.paths[0] = '\\changed'
+        result.extend(FakeResponse(['\\data\\c']).result_set())
+
+        result = self.get_browse_result(columnar=True)
+
+        self.assertEqual(result.paths, self.PATHS)
+        self.assertEqual(list(result.sizes), [1024, 1024])
+        self.assertEqual(self.server.count('DoBrowse'), 1)
+
+        # the columnar and the formatted results of the same browse are cached separately
+        self.get_browse_result()
+        self.assertEqual(self.server.count('DoBrowse'), 2)
+
+    def test_result_invalidated_by_backup(self):
+        self.get_browse_result()
+
+        Subclients._backup_subclient(self.commcell, '5', 'incremental')
+        self.get_browse_result()
+
+        self.assertEqual(self.server.backups, [(5, 'incremental')])
+        self.assertEqual(self.server.count('DoBrowse'), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
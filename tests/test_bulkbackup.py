@@ -0,0 +1,164 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Tests for the BulkBackup, against the fake commcell server."""
+
+from __future__ import absolute_import
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from cvpysdk.bulkbackup import BulkBackup
+from cvpysdk.exception import SDKException
+from cvpysdk.inventory import InventoryCrawler
+from cvpysdk.workqueue import WorkQueue
+
+from fakes import FakeCommcell, FakeCommcellServer
+
+
+FS_PATH = 'client1/file system/defaultinstancename/defaultbackupset/{0}'
+SQL_PATH = 'client1/sql server/defaultinstancename/defaultbackupset/{0}'
+
+
+class ClientGroups(object):
+    """Client groups of the fake commcell, without any client group."""
+
+    def has_clientgroup(self, clientgroup_name):
+        return False
+
+
+class BulkBackupCommcell(FakeCommcell):
+    """Fake commcell, with the snapshot of the inventory used by the bulk backup."""
+
+    def __init__(self):
+        super(BulkBackupCommcell, self).__init__(FakeCommcellServer())
+        self.client_groups = ClientGroups()
+
+    def snapshot(self):
+        return InventoryCrawler(self).crawl()
+
+
+class BulkBackupTest(unittest.TestCase):
+
+    def setUp(self):
+        self.commcell = BulkBackupCommcell()
+        self.server = self.commcell._cvpysdk_object
+
+        self.server.add_client(1, 'client1')
+        self.server.add_subclient(1, 11, 'default')
+        self.server.add_subclient(1, 12, 'logs', is_backup_enabled=False)
+        self.server.add_subclient(1, 21, 'sqldb', agent_name='SQL Server')
+
+    def tearDown(self):
+        self.commcell.job_monitor.stop()
+
+    def run_backup(self, targets, **kwargs):
+        return BulkBackup(self.commcell).run(targets, **kwargs)
+
+    def test_default_level_of_each_agent(self):
+        result = self.run_backup(['client1'])
+
+        self.assertEqual(sorted(self.server.backups), [(11, 'incremental'), (21, 'differential')])
+        self.assertEqual(
+            sorted(result.job_ids['client1']), [FS_PATH.format('default'), SQL_PATH.format('sqldb')]
+        )
+        self.assertEqual(result.failures, {'client1': {}})
+
+    def test_level_not_supported_by_agent(self):
+        result = self.run_backup(['client1'], level='Transaction_Log')
+
+        self.assertEqual(self.server.backups, [(21, 'transaction_log')])
+        self.assertEqual(list(result.job_ids['client1']), [SQL_PATH.format('sqldb')])
+
+        failure = result.failures['client1'][FS_PATH.format('default')]
+        self.assertEqual(failure.exception_id, '103')
+        self.assertIn('file system', failure.exception_message)
+
+    def test_synthetic_full_options(self):
+        result = self.run_backup(['client1'], level='Synthetic_full', incremental_backup=True)
+
+        self.assertEqual(
+            self.server.backups,
+            [(11, 'synthetic_full&runIncrementalBackup=True&incLevel=before_synth')]
+        )
+        self.assertEqual(list(result.failures['client1']), [SQL_PATH.format('sqldb')])
+
+    def test_level_not_supported_by_any_agent(self):
+        with self.assertRaises(SDKException):
+            self.run_backup(['client1'], level='Weekly')
+
+        self.assertEqual(self.server.urls('POST'), [])
+
+    def test_new_snapshot_for_each_run(self):
+        self.run_backup([{'client': 'client1', 'agent': 'file system'}])
+        self.server.add_subclient(1, 13, 'home')
+
+        result = self.run_backup([{'client': 'client1', 'agent': 'file system'}])
+
+        self.assertEqual(self.server.count('Client'), 2)
+        self.assertIn(FS_PATH.format('home'), result.job_ids['agent=file system, client=client1'])
+
+    def test_given_inventory(self):
+        inventory = self.commcell.snapshot()
+        self.server.add_subclient(1, 13, 'home')
+
+        result = self.run_backup(['client1'], inventory=inventory)
+
+        self.assertEqual(self.server.count('Client'), 1)
+        self.assertNotIn(FS_PATH.format('home'), result.job_ids['client1'])
+
+    def test_unknown_target(self):
+        result = self.run_backup(['client1', 'client2'])
+
+        self.assertEqual(result.job_ids['client2'], {})
+        self.assertEqual(result.failures['client2']['client2'].exception_id, '102')
+        self.assertEqual(len(result), 2)
+
+
+class BulkBackupWorkQueueTest(BulkBackupTest):
+
+    def setUp(self):
+        super(BulkBackupWorkQueueTest, self).setUp()
+
+        self.directory = tempfile.mkdtemp()
+        self.work_queue = WorkQueue(os.path.join(self.directory, 'queue.db'), 'backup')
+
+    def tearDown(self):
+        self.work_queue.close()
+        shutil.rmtree(self.directory)
+
+        super(BulkBackupWorkQueueTest, self).tearDown()
+
+    def run_backup(self, targets, **kwargs):
+        kwargs.setdefault('work_queue', self.work_queue)
+        return super(BulkBackupWorkQueueTest, self).run_backup(targets, **kwargs)
+
+    def test_resumed_jobs(self):
+        first_result = self.run_backup(['client1'])
+        second_result = self.run_backup(['client1'])
+
+        self.assertEqual(len(self.server.backups), 2)
+        self.assertEqual(second_result.job_ids, first_result.job_ids)
+        self.assertEqual(second_result.resumed, first_result.job_ids)
+        self.assertEqual(first_result.resumed, {'client1': {}})
+
+    def test_cleared_queue(self):
+        self.run_backup(['client1'])
+        self.work_queue.clear()
+
+        result = self.run_backup(['client1'])
+
+        self.assertEqual(len(self.server.backups), 4)
+        self.assertEqual(result.resumed, {'client1': {}})
+
+
+if __name__ == '__main__':
+    unittest.main()
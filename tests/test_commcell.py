@@ -0,0 +1,112 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Tests for the background refresh of the cached collections of the Commcell."""
+
+from __future__ import absolute_import
+
+import threading
+import unittest
+
+from requests.exceptions import ConnectionError
+
+from cvpysdk.commcell import Commcell
+from cvpysdk.exception import SDKException
+
+
+class FakeCollection(object):
+    """Collection counting its refreshes, and raising the error set on it, if any."""
+
+    def __init__(self, error=None):
+        self.error = error
+        self.refreshes = 0
+        self.started = threading.Event()
+        self.refreshed = threading.Event()
+        self.release = threading.Event()
+        self.release.set()
+
+    def refresh(self):
+        self.started.set()
+        self.release.wait(5)
+        self.refreshes += 1
+        self.refreshed.set()
+
+        if self.error is not None:
+            raise self.error
+
+
+def make_commcell(**collections):
+    """Returns a Commcell with the collections given, without logging in to the commcell."""
+    commcell = Commcell.__new__(Commcell)
+    commcell._refresh_thread = None
+    commcell._refresh_event = threading.Event()
+
+    for name in ('clients', 'client_groups', 'storage_policies', 'schedule_policies'):
+        setattr(commcell, name, collections.get(name))
+
+    return commcell
+
+
+class AutoRefreshTest(unittest.TestCase):
+
+    def test_refresh_errors_skipped(self):
+        clients = FakeCollection(SDKException('Response', '101'))
+        client_groups = FakeCollection(ConnectionError())
+        storage_policies = FakeCollection()
+        commcell = make_commcell(
+            clients=clients, client_groups=client_groups, storage_policies=storage_policies
+        )
+
+        commcell.start_auto_refresh(0.01)
+
+        self.assertTrue(storage_policies.refreshed.wait(5))
+        clients.refreshed.clear()
+        self.assertTrue(clients.refreshed.wait(5))
+
+        self.assertTrue(commcell.stop_auto_refresh(5))
+        self.assertIsNone(commcell._refresh_thread)
+
+    def test_stop_waits_for_refresh_in_progress(self):
+        clients = FakeCollection()
+        storage_policies = FakeCollection()
+        commcell = make_commcell(clients=clients, storage_policies=storage_policies)
+
+        clients.release.clear()
+        commcell.start_auto_refresh(0.01)
+        refresh_thread = commcell._refresh_thread
+        self.assertTrue(clients.started.wait(5))
+
+        self.assertFalse(commcell.stop_auto_refresh(0.1))
+        self.assertTrue(refresh_thread.is_alive())
+
+        clients.release.set()
+        refresh_thread.join(5)
+
+        # the refresh stops before the collections left in the cycle
+        self.assertFalse(refresh_thread.is_alive())
+        self.assertEqual(storage_policies.refreshes, 0)
+
+    def test_restart(self):
+        clients = FakeCollection()
+        commcell = make_commcell(clients=clients)
+
+        commcell.start_auto_refresh(60)
+        first_thread = commcell._refresh_thread
+        commcell.start_auto_refresh(0.01)
+
+        self.assertFalse(first_thread.is_alive())
+        self.assertTrue(clients.refreshed.wait(5))
+        self.assertTrue(commcell.stop_auto_refresh(5))
+
+    def test_stop_without_refresh(self):
+        self.assertTrue(make_commcell().stop_auto_refresh())
+
+
+if __name__ == '__main__':
+    unittest.main()
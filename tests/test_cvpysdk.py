@@ -0,0 +1,139 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Tests for the conditional GET requests of the CVPySDK class."""
+
+from __future__ import absolute_import
+
+import json
+import unittest
+
+try:
+    # Python 3 import
+    from unittest import mock
+except ImportError:
+    # Python 2 import
+    import mock
+
+import requests
+
+from cvpysdk.cvpysdk import CVPySDK
+from cvpysdk.services import ApiLibrary
+
+from fakes import WEB_SERVICE
+
+
+def make_response(status_code, body=None, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.encoding = 'utf-8'
+    response.headers.update(headers or {})
+    response._content = json.dumps(body).encode('utf-8') if body is not None else b''
+
+    return response
+
+
+class ConditionalGetCommcell(object):
+    """Commcell with the services, and the headers used by the CVPySDK class."""
+
+    def __init__(self):
+        self._services = ApiLibrary(WEB_SERVICE)
+        self._headers = {'Host': 'webconsole', 'Authtoken': 'QSDK token'}
+
+
+class ConditionalGetTest(unittest.TestCase):
+
+    BODY = {'clientProperties': [{'client': {'clientEntity': {'clientName': 'client1'}}}]}
+
+    def setUp(self):
+        self.commcell = ConditionalGetCommcell()
+        self.cvpysdk = CVPySDK(self.commcell)
+        self.url = self.commcell._services.GET_ALL_CLIENTS
+
+        patcher = mock.patch('cvpysdk.cvpysdk.requests.get')
+        self.get = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def request_headers(self, call_index):
+        return self.get.call_args_list[call_index][1]['headers']
+
+    def test_not_modified_response(self):
+        self.get.side_effect = [
+            make_response(200, self.BODY, {'ETag': '"v1"', 'Last-Modified': 'Mon'}),
+            make_response(304)
+        ]
+
+        self.cvpysdk.make_request('GET', self.url)
+        flag, response = self.cvpysdk.make_request('GET', self.url)
+
+        self.assertTrue(flag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json(), self.BODY)
+        self.assertEqual(response.headers['etag'], '"v1"')
+        self.assertEqual(json.loads(response.text), self.BODY)
+
+        self.assertNotIn('If-None-Match', self.request_headers(0))
+        self.assertEqual(self.request_headers(1)['If-None-Match'], '"v1"')
+        self.assertEqual(self.request_headers(1)['If-Modified-Since'], 'Mon')
+
+        # the headers of the commcell are not changed by the conditional request
+        self.assertNotIn('If-None-Match', self.commcell._headers)
+
+    def test_json_not_shared(self):
+        self.get.side_effect = [
+            make_response(200, self.BODY, {'ETag': '"v1"'}), make_response(304), make_response(304)
+        ]
+
+        _, first_response = self.cvpysdk.make_request('GET', self.url)
+        first_response.json()['clientProperties'].pop()
+
+        _, second_response = self.cvpysdk.make_request('GET', self.url)
+        second_response.json()['clientProperties'].pop()
+
+        _, third_response = self.cvpysdk.make_request('GET', self.url)
+
+        self.assertEqual(third_response.json(), self.BODY)
+        self.assertIsNot(third_response.json(), third_response.json())
+
+    def test_modified_response(self):
+        body = {'clientProperties': []}
+        self.get.side_effect = [
+            make_response(200, self.BODY, {'ETag': '"v1"'}),
+            make_response(200, body, {'ETag': '"v2"'}),
+            make_response(304)
+        ]
+
+        self.cvpysdk.make_request('GET', self.url)
+        self.cvpysdk.make_request('GET', self.url)
+        _, response = self.cvpysdk.make_request('GET', self.url)
+
+        self.assertEqual(self.request_headers(2)['If-None-Match'], '"v2"')
+        self.assertEqual(response.json(), body)
+
+    def test_response_without_validators(self):
+        self.get.side_effect = [make_response(200, self.BODY), make_response(200, self.BODY)]
+
+        self.cvpysdk.make_request('GET', self.url)
+        self.cvpysdk.make_request('GET', self.url)
+
+        self.assertNotIn('If-None-Match', self.request_headers(1))
+        self.assertEqual(self.cvpysdk._validators, {})
+
+    def test_unconditional_url(self):
+        url = self.commcell._services.GET_JOBS % (0, 'Backup')
+        self.get.side_effect = [make_response(200, {'jobs': []}, {'ETag': '"v1"'})] * 2
+
+        self.cvpysdk.make_request('GET', url)
+        self.cvpysdk.make_request('GET', url)
+
+        self.assertNotIn('If-None-Match', self.request_headers(1))
+
+
+if __name__ == '__main__':
+    unittest.main()
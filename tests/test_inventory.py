@@ -0,0 +1,114 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Tests for the InventoryCrawler and the Inventory records, against the fake commcell server."""
+
+from __future__ import absolute_import
+
+import pickle
+import unittest
+
+from cvpysdk.exception import SDKException
+from cvpysdk.inventory import InventoryCrawler, SubclientRecord, _checksum
+
+from fakes import FakeCommcell, FakeCommcellServer
+
+
+class InventoryCrawlerTest(unittest.TestCase):
+
+    def setUp(self):
+        self.commcell = FakeCommcell(FakeCommcellServer())
+        self.server = self.commcell._cvpysdk_object
+
+        self.server.add_client(1, 'Client1')
+        self.server.add_client(2, 'client2')
+        self.server.add_subclient(1, 10, 'default')
+        self.server.add_subclient(1, 11, 'Logs', is_backup_enabled=False, storage_policy=None)
+        self.server.add_subclient(1, 12, 'default', agent_name='SQL Server')
+        self.server.add_subclient(2, 20, 'default', content=[{'path': '/data'}])
+
+    def tearDown(self):
+        self.commcell.job_monitor.stop()
+
+    def crawl(self, include_content=False):
+        return InventoryCrawler(self.commcell, 4, include_content).crawl()
+
+    def test_crawl(self):
+        inventory = self.crawl()
+
+        self.assertEqual(len(inventory), 2)
+        self.assertEqual(inventory.failed_clients, {})
+
+        client = inventory.get_client('CLIENT1')
+        self.assertIs(inventory.get_client_by_id('1'), client)
+        self.assertEqual(client.client_name, 'client1')
+        self.assertEqual([agent.agent_name for agent in client.agents],
+                         ['file system', 'sql server'])
+
+        instance = client.agents[0].instances[0]
+        backupset = instance.backupsets[0]
+        self.assertEqual(instance.instance_name, 'defaultinstancename')
+        self.assertEqual((backupset.backupset_id, backupset.is_default), (133, True))
+        self.assertEqual(backupset.subclients, (
+            SubclientRecord(10, 'default', 'sp-gold', True, None, None, None),
+            SubclientRecord(11, 'logs', None, False, None, None, None)
+        ))
+
+        # a single request is sent for each entity type of a client, and none for the content
+        for url in ('Agent?clientId=1', 'Instance?clientId=1', 'Subclient?clientId=1',
+                    'Backupset?clientId=1&excludeHidden=0', 'Schedules?clientId=1'):
+            self.assertEqual(self.server.count(url), 1)
+
+        self.assertEqual(self.server.count('Subclient/10'), 0)
+
+    def test_crawl_with_content(self):
+        inventory = self.crawl(include_content=True)
+        backupset = inventory.get_client('client2').agents[0].instances[0].backupsets[0]
+        subclient = backupset.subclients[0]
+
+        self.assertEqual(subclient.content_checksum, _checksum([{'path': '/data'}]))
+        self.assertEqual(
+            [self.server.count('Subclient/{0}'.format(subclient_id)) for subclient_id in
+             (10, 11, 12, 20)], [1, 1, 1, 1]
+        )
+
+    def test_failed_client_skipped(self):
+        self.server.route(r'Agent\?clientId=2', lambda *args: (500, {}))
+
+        # the first route matching the URL answers it
+        self.server._routes.insert(0, self.server._routes.pop())
+
+        inventory = self.crawl()
+
+        self.assertEqual([client.client_name for client in inventory.clients], ['client1'])
+        self.assertEqual(list(inventory.failed_clients), ['client2'])
+        self.assertFalse(inventory.has_client('client2'))
+
+    def test_clients_not_listed(self):
+        self.server.route(r'Client', lambda *args: (200, {}))
+        self.server._routes.insert(0, self.server._routes.pop())
+
+        with self.assertRaises(SDKException):
+            self.crawl()
+
+    def test_records_immutable(self):
+        client = self.crawl().get_client('client1')
+
+        with self.assertRaises(AttributeError):
+            client.client_name = 'client3'
+
+        self.assertEqual(pickle.loads(pickle.dumps(client)), client)
+        self.assertEqual(hash(pickle.loads(pickle.dumps(client))), hash(client))
+
+        with self.assertRaises(TypeError):
+            SubclientRecord(10, 'default')
+
+
+if __name__ == '__main__':
+    unittest.main()
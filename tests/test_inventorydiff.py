@@ -0,0 +1,125 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Tests for the diff between two inventories crawled from the fake commcell server."""
+
+from __future__ import absolute_import
+
+import unittest
+
+from cvpysdk.exception import SDKException
+from cvpysdk.inventory import InventoryCrawler
+
+from fakes import FakeCommcell, FakeCommcellServer
+
+
+class InventoryDiffTest(unittest.TestCase):
+
+    def setUp(self):
+        self.commcell = FakeCommcell(FakeCommcellServer())
+        self.server = self.commcell._cvpysdk_object
+
+        self.server.add_client(1, 'client1')
+        self.server.add_client(2, 'client2')
+        self.server.add_subclient(1, 10, 'default')
+        self.server.add_subclient(1, 11, 'logs')
+        self.server.add_subclient(1, 12, 'data', is_backup_enabled=False)
+        self.server.add_subclient(2, 20, 'default')
+
+    def tearDown(self):
+        self.commcell.job_monitor.stop()
+
+    def crawl(self, include_content=True):
+        return InventoryCrawler(self.commcell, 2, include_content).crawl()
+
+    def update_subclient(self, subclient_id, **kwargs):
+        self.server.subclients[subclient_id].update(kwargs)
+
+    def test_no_changes(self):
+        diff = self.crawl().diff(self.crawl())
+
+        self.assertFalse(diff)
+        self.assertEqual(len(diff), 0)
+        self.assertTrue(diff.content_compared)
+
+    def test_changes(self):
+        old_inventory = self.crawl()
+
+        self.server.add_client(3, 'client3')
+        self.server.add_subclient(3, 30, 'default')
+        self.server.add_subclient(1, 13, 'archive')
+        del self.server.clients[2]
+        del self.server.subclients[20]
+        del self.server.subclients[11]
+
+        self.update_subclient(10, storage_policy='SP-Silver', content=[{'path': '/data'}])
+        self.update_subclient(12, is_backup_enabled=True, subclient_name='documents')
+
+        diff = self.crawl().diff(old_inventory)
+
+        self.assertEqual([client.client_name for client in diff.clients_added], ['client3'])
+        self.assertEqual([client.client_name for client in diff.clients_removed], ['client2'])
+        self.assertEqual([row[4].subclient_id for row in diff.subclients_added], [13, 30])
+        self.assertEqual([row[4].subclient_id for row in diff.subclients_removed], [11, 20])
+
+        change = diff.storage_policy_changed[0]
+        self.assertEqual(
+            (change.client_name, change.agent_name, change.subclient_name),
+            ('client1', 'file system', 'default')
+        )
+        self.assertEqual((change.old_value, change.new_value), ('sp-gold', 'sp-silver'))
+
+        self.assertEqual([change.subclient_id for change in diff.content_changed], [10])
+
+        # the renamed subclient is matched by its id, and reported with its new name
+        self.assertEqual([change.subclient_name for change in diff.backup_enabled], ['documents'])
+        self.assertEqual(diff.backup_disabled, ())
+
+        self.assertEqual(diff.summary(), {
+            'clients_added': 1,
+            'clients_removed': 1,
+            'subclients_added': 2,
+            'subclients_removed': 2,
+            'storage_policy_changed': 1,
+            'content_changed': 1,
+            'backup_enabled': 1,
+            'backup_disabled': 0
+        })
+        self.assertEqual(len(diff), 9)
+
+    def test_content_not_compared(self):
+        old_inventory = self.crawl(include_content=False)
+        self.update_subclient(10, content=[{'path': '/data'}])
+
+        diff = self.crawl().diff(old_inventory)
+
+        self.assertFalse(diff.content_compared)
+        self.assertEqual(diff.content_changed, ())
+        self.assertIsNone(diff.summary()['content_changed'])
+        self.assertFalse(diff)
+
+    def test_failed_client_skipped(self):
+        old_inventory = self.crawl()
+        self.server.route(r'Agent\?clientId=2', lambda *args: (500, {}))
+
+        # the first route matching the URL answers it
+        self.server._routes.insert(0, self.server._routes.pop())
+
+        diff = self.crawl().diff(old_inventory)
+
+        self.assertEqual(diff.clients_removed, ())
+        self.assertEqual(diff.subclients_removed, ())
+
+    def test_invalid_inventory(self):
+        with self.assertRaises(SDKException):
+            self.crawl().diff({})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Tests for the queries over the subclients of an inventory."""
+
+from __future__ import absolute_import
+
+import unittest
+
+from cvpysdk.exception import SDKException
+from cvpysdk.inventory import (
+    Inventory, ClientRecord, AgentRecord, InstanceRecord, BackupsetRecord, SubclientRecord
+)
+
+
+def make_client(client_id, client_name, agents):
+    """Returns the record of a client, with a single instance and backupset for each agent,
+        from the dict of the agent names, and the subclient records of the agents.
+    """
+    return ClientRecord(client_id, client_name, tuple(
+        AgentRecord(agent_id, agent_name, (
+            InstanceRecord(1, 'defaultinstancename', (
+                BackupsetRecord(1, 'defaultbackupset', True, tuple(agents[agent_name])),
+            )),
+        )) for agent_id, agent_name in enumerate(sorted(agents), 1)
+    ), ())
+
+
+def make_inventory():
+    return Inventory([
+        make_client(1, 'client1', {
+            'file system': [
+                SubclientRecord(10, 'default', 'sp-gold', True, 100, 500, None),
+                SubclientRecord(11, 'logs', 'sp-silver', False, None, None, None)
+            ],
+            'sql server': [
+                SubclientRecord(12, 'default', 'sp-gold', True, 300, 400, None)
+            ]
+        }),
+        make_client(2, 'client2', {
+            'file system': [
+                SubclientRecord(20, 'default', None, True, 200, 600, None)
+            ]
+        })
+    ])
+
+
+class SubclientQueryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.subclients = make_inventory().subclients
+
+    def subclient_ids(self, query):
+        return [row[4].subclient_id for row in query]
+
+    def test_all_subclients(self):
+        self.assertEqual(len(self.subclients), 4)
+        self.assertEqual(self.subclient_ids(self.subclients.where()), [10, 11, 12, 20])
+
+        client, agent, instance, backupset, subclient = self.subclients.all()[2]
+        self.assertEqual((client.client_name, agent.agent_name, subclient.subclient_id),
+                         ('client1', 'sql server', 12))
+
+    def test_names(self):
+        query = self.subclients.where(storage_policy='SP-Gold', agent='File System')
+
+        self.assertEqual(self.subclient_ids(query), [10])
+        self.assertEqual(
+            self.subclient_ids(self.subclients.where(storage_policy=['sp-silver', None])),
+            [11, 20]
+        )
+        self.assertEqual(self.subclient_ids(self.subclients.where(client='client3')), [])
+
+    def test_flags(self):
+        self.assertEqual(self.subclient_ids(self.subclients.where(is_backup_enabled=False)), [11])
+
+    def test_backup_times(self):
+        # the subclient never backed up is treated as backed up at 0
+        self.assertEqual(self.subclient_ids(self.subclients.where(last_backup_before=200)),
+                         [10, 11])
+        self.assertEqual(self.subclient_ids(self.subclients.where(last_backup_after=200)), [12])
+
+        # the subclient without a next backup is left out of both the filters
+        self.assertEqual(self.subclient_ids(self.subclients.where(next_backup_after=450)),
+                         [10, 20])
+        self.assertEqual(self.subclient_ids(self.subclients.where(next_backup_before=450)), [12])
+
+    def test_chained_filters(self):
+        query = self.subclients.where(subclient='default')
+
+        self.assertEqual(self.subclient_ids(query), [10, 12, 20])
+        self.assertEqual(self.subclient_ids(query.where(client='client1')), [10, 12])
+        self.assertEqual(self.subclient_ids(query.where(last_backup_after=250)), [12])
+
+    def test_index_reused(self):
+        inventory = make_inventory()
+
+        self.assertIs(inventory.subclients._index, inventory.subclients._index)
+
+    def test_invalid_filters(self):
+        with self.assertRaises(SDKException) as context:
+            self.subclients.where(schedule='daily')
+
+        self.assertEqual(context.exception.exception_id, '103')
+
+        with self.assertRaises(SDKException):
+            self.subclients.where(last_backup_before='yesterday')
+
+        with self.assertRaises(SDKException):
+            self.subclients.where(last_backup_before=True)
+
+
+if __name__ == '__main__':
+    unittest.main()
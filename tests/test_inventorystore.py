@@ -0,0 +1,129 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Tests for the InventoryStore, against the fake commcell server."""
+
+from __future__ import absolute_import
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from cvpysdk.inventory import InventoryCrawler
+from cvpysdk.inventorystore import InventoryStore
+
+from fakes import FakeCommcell, FakeCommcellServer
+
+
+class InventoryStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.commcell = FakeCommcell(FakeCommcellServer())
+        self.server = self.commcell._cvpysdk_object
+
+        for client_id in (1, 2):
+            self.server.add_client(client_id, 'client{0}'.format(client_id))
+            self.server.add_subclient(client_id, client_id * 10, 'default')
+
+        self.directory = tempfile.mkdtemp()
+        self.store = InventoryStore(
+            os.path.join(self.directory, 'inventory.db'), self.commcell, max_age=3600
+        )
+
+    def tearDown(self):
+        self.store.close()
+        self.commcell.job_monitor.stop()
+        shutil.rmtree(self.directory)
+
+    def save_snapshot(self, include_content=False):
+        self.store.save(InventoryCrawler(self.commcell, 1, include_content).crawl())
+        del self.server.requests[:]
+
+    def expire(self, client_name):
+        with self.store._connection:
+            self.store._connection.execute(
+                'UPDATE clients SET refresh_time = 0 WHERE client_name = ?', (client_name, )
+            )
+
+    def test_fresh_client_answered_from_store(self):
+        self.save_snapshot()
+
+        self.assertEqual(self.store.get_subclient_id('client1', 'file system',
+                                                     'defaultbackupset', 'default'), 10)
+        self.assertEqual(self.server.requests, [])
+
+    def test_stale_client_crawled_alone(self):
+        self.save_snapshot()
+        self.expire('client1')
+        self.server.add_subclient(1, 11, 'logs')
+
+        self.assertTrue(self.store.has_subclient('client1', 'file system',
+                                                 'defaultbackupset', 'logs'))
+        self.assertEqual(self.server.count('Client'), 0)
+        self.assertEqual(self.server.count('Agent?clientId=1'), 1)
+        self.assertEqual(self.server.count('Agent?clientId=2'), 0)
+        self.assertFalse(self.store._is_stale(self.store.refresh_time('client1')))
+
+    def test_new_client_crawled_alone(self):
+        self.save_snapshot()
+        self.server.add_client(3, 'client3')
+
+        self.assertTrue(self.store.has_client('client3'))
+        self.assertEqual(self.store.get_client_name(3), 'client3')
+        self.assertEqual(self.server.count('Client'), 1)
+        self.assertEqual(self.server.count('Agent?clientId=3'), 1)
+        self.assertEqual(self.server.count('Agent?clientId=1'), 0)
+
+        # the clients listed recently are not listed again, for another unknown client
+        self.assertFalse(self.store.has_client('client4'))
+        self.assertEqual(self.server.count('Client'), 1)
+
+    def test_content_checksums_kept(self):
+        self.save_snapshot(include_content=True)
+        self.expire('client1')
+
+        self.store.has_client('client1')
+        self.assertEqual(self.server.count('Subclient/10'), 1)
+
+        client = self.store.load().get_client('client1')
+        backupset = client.agents[0].instances[0].backupsets[0]
+        self.assertIsNotNone(backupset.subclients[0].content_checksum)
+
+    def test_content_checksums_not_requested(self):
+        self.save_snapshot()
+        self.expire('client1')
+
+        self.store.has_client('client1')
+        self.assertEqual(self.server.count('Subclient/10'), 0)
+
+    def test_revalidate(self):
+        self.save_snapshot(include_content=True)
+        self.expire('client1')
+        del self.server.clients[2]
+
+        self.assertEqual(self.store.revalidate(), ['client1'])
+        self.assertEqual(self.server.count('Agent?clientId=2'), 0)
+        self.assertEqual(self.server.count('Subclient/10'), 1)
+        self.assertEqual([client.client_name for client in self.store.load().clients],
+                         ['client1'])
+
+    def test_commcell_not_reachable(self):
+        self.save_snapshot()
+        self.expire('client1')
+        self.server.route(r'Agent\?clientId=1', lambda *args: (500, {}))
+
+        # the first route matching the URL answers it
+        self.server._routes.insert(0, self.server._routes.pop())
+
+        self.assertEqual(self.store.get_client_id('client1'), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,135 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Tests for the Job handles, against the fake job server."""
+
+from __future__ import absolute_import
+
+import asyncio
+import time
+import unittest
+
+from cvpysdk.exception import SDKException
+from cvpysdk.job import Job
+
+from fakes import FakeCommcell
+
+
+async def wait_for(job, timeout=5):
+    return await asyncio.wait_for(job, timeout)
+
+
+async def gather(jobs):
+    return await asyncio.gather(*[wait_for(job) for job in jobs])
+
+
+class AwaitJobTest(unittest.TestCase):
+
+    def setUp(self):
+        self.commcell = FakeCommcell()
+        self.server = self.commcell._cvpysdk_object
+        self.monitor = self.commcell.job_monitor
+        self.loop = asyncio.new_event_loop()
+
+    def tearDown(self):
+        self.monitor.stop()
+        self.loop.close()
+
+    def test_await_job(self):
+        self.server.set_job(1, 'Running')
+        job = Job(self.commcell, 1, 'Backup')
+
+        self.loop.call_later(0.1, self.server.set_status, 1, 'Completed')
+
+        self.assertIs(self.loop.run_until_complete(wait_for(job)), job)
+        self.assertTrue(job._finished)
+
+    def test_await_finished_job(self):
+        self.server.set_job(1, 'Failed')
+        job = Job(self.commcell, 1, 'Backup')
+        self.monitor.wait(job, timeout=5)
+
+        self.assertIs(self.loop.run_until_complete(wait_for(job)), job)
+
+    def test_await_invalid_job(self):
+        self.monitor._VALIDATION_PERIOD = 0
+        job = Job(self.commcell, 99)
+
+        with self.assertRaises(SDKException) as context:
+            self.loop.run_until_complete(wait_for(job))
+
+        self.assertEqual(context.exception.exception_id, '103')
+
+        # awaiting the job again, after it was rejected
+        with self.assertRaises(SDKException):
+            self.loop.run_until_complete(wait_for(job))
+
+    def test_await_cancelled_when_monitor_stops(self):
+        self.server.set_job(1, 'Running')
+        job = Job(self.commcell, 1, 'Backup')
+
+        self.loop.call_later(0.1, self.monitor.stop)
+
+        with self.assertRaises(asyncio.CancelledError):
+            self.loop.run_until_complete(wait_for(job))
+
+        self.assertFalse(job._finished)
+
+    def test_gather_jobs(self):
+        for job_id in (1, 2):
+            self.server.set_job(job_id, 'Running')
+
+        jobs = [Job(self.commcell, job_id, 'Backup') for job_id in (1, 2)]
+
+        for job_id in (1, 2):
+            self.loop.call_later(0.05 * job_id, self.server.set_status, job_id, 'Completed')
+
+        self.assertEqual(self.loop.run_until_complete(gather(jobs)), jobs)
+
+
+class JobPropertiesTest(unittest.TestCase):
+
+    def setUp(self):
+        self.commcell = FakeCommcell()
+        self.server = self.commcell._cvpysdk_object
+        self.monitor = self.commcell.job_monitor
+        self.monitor._VALIDATION_PERIOD = 60
+
+    def tearDown(self):
+        self.monitor.stop()
+
+    def test_properties_loaded_once(self):
+        self.server.set_job(1, 'Running')
+        job = Job(self.commcell, 1)
+
+        self.assertEqual(job.status, 'Running')
+        self.assertEqual(job.job_type, 'Backup')
+
+    def test_job_not_found_yet(self):
+        job = Job(self.commcell, 99)
+        start_time = time.time()
+
+        with self.assertRaises(SDKException) as context:
+            job.status
+
+        # a single request, without waiting for the records of the job to appear
+        self.assertLess(time.time() - start_time, 1)
+        self.assertEqual(context.exception.exception_id, '103')
+        self.assertIn('99', context.exception.exception_message)
+
+        # the job is still tracked, and is loaded once the server has its records
+        self.assertFalse(job._invalid)
+        self.server.set_job(99, 'Completed')
+
+        self.assertTrue(self.monitor.wait(job, timeout=5))
+        self.assertEqual(job.status, 'Completed')
+
+
+if __name__ == '__main__':
+    unittest.main()
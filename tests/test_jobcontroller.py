@@ -0,0 +1,85 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Tests for the paging of the jobs listed by the JobController, against the fake job server."""
+
+from __future__ import absolute_import
+
+import unittest
+
+from fakes import FakeCommcell, FakeJobServer
+
+
+JOBS_PAGE = 'Job?clientId=0&jobFilter=Backup&jobCategory=All&offset={0}&limit=2'
+
+
+class JobControllerTest(unittest.TestCase):
+
+    REPORT_TOTAL = True
+
+    def setUp(self):
+        self.server = FakeJobServer(report_total=self.REPORT_TOTAL)
+        self.commcell = FakeCommcell(self.server)
+
+    def tearDown(self):
+        self.commcell.job_monitor.stop()
+
+    def set_jobs(self, number_of_jobs):
+        for job_id in range(1, number_of_jobs + 1):
+            self.server.set_job(job_id, 'Completed' if job_id % 2 else 'Running')
+
+    def list_job_ids(self, **kwargs):
+        return [
+            record.job_id
+            for record in self.commcell.jobs.iter_jobs(job_types=['Backup'], page_size=2, **kwargs)
+        ]
+
+    def test_all_pages(self):
+        self.set_jobs(5)
+
+        self.assertEqual(self.list_job_ids(), [1, 2, 3, 4, 5])
+        self.assertEqual(
+            self.server.urls(), [JOBS_PAGE.format(offset) for offset in (0, 2, 4)]
+        )
+
+    def test_full_last_page(self):
+        self.set_jobs(4)
+
+        self.assertEqual(self.list_job_ids(), [1, 2, 3, 4])
+        self.assertEqual(self.server.urls()[-1], JOBS_PAGE.format(2 if self.REPORT_TOTAL else 4))
+
+    def test_statuses_of_each_page(self):
+        self.set_jobs(5)
+
+        self.assertEqual(self.list_job_ids(statuses=['Running']), [2, 4])
+
+    def test_no_jobs(self):
+        self.assertEqual(self.list_job_ids(), [])
+        self.assertEqual(self.server.urls(), [JOBS_PAGE.format(0)])
+
+    def test_limit_ignored_by_server(self):
+        self.set_jobs(5)
+
+        # the query of the jobs is matched without the offset and limit, and the first route
+        # matching the URL answers it
+        self.server.route(r'Job\?(.*)&offset=\d+&limit=\d+', self.server._list_jobs)
+        self.server._routes.insert(0, self.server._routes.pop())
+
+        self.assertEqual(self.list_job_ids(), [1, 2, 3, 4, 5])
+        self.assertEqual(len(self.server.urls()), 1)
+
+
+class JobControllerWithoutTotalTest(JobControllerTest):
+    """Runs the tests against a server which does not send the total number of the jobs."""
+
+    REPORT_TOTAL = False
+
+
+if __name__ == '__main__':
+    unittest.main()
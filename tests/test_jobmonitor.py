@@ -0,0 +1,154 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Tests for the JobMonitor, against a fake transport of the job APIs of the commcell."""
+
+from __future__ import absolute_import
+
+import threading
+import unittest
+
+from cvpysdk.exception import SDKException
+from cvpysdk.job import Job
+from cvpysdk.jobmonitor import JobEvent
+
+from fakes import FakeCommcell
+
+
+class JobMonitorTest(unittest.TestCase):
+
+    def setUp(self):
+        self.commcell = FakeCommcell()
+        self.server = self.commcell._cvpysdk_object
+        self.monitor = self.commcell.job_monitor
+
+    def tearDown(self):
+        self.monitor.stop()
+
+    def test_wait_for_completed_job(self):
+        self.server.set_job(1, 'Completed')
+        job = Job(self.commcell, 1)
+
+        self.assertTrue(self.monitor.wait(job, timeout=5))
+        self.assertEqual(job.status, 'Completed')
+        self.assertEqual(len(self.monitor), 0)
+
+    def test_wait_all_duplicate_instances(self):
+        self.server.set_job(1, 'Running')
+        first_job = Job(self.commcell, 1, 'Backup')
+        second_job = Job(self.commcell, 1, 'Backup')
+
+        self.assertFalse(self.monitor.wait_all([first_job], timeout=0.2))
+        self.assertEqual(second_job._status, 'Running')
+
+        self.server.set_job(1, 'Completed')
+
+        self.assertTrue(self.monitor.wait_all([first_job, second_job], timeout=5))
+        self.assertTrue(first_job._finished and second_job._finished)
+        self.assertEqual(second_job._status, 'Completed')
+
+    def test_instance_created_after_the_job_finished(self):
+        self.server.set_job(1, 'Killed')
+        self.monitor.wait(Job(self.commcell, 1, 'Backup'), timeout=5)
+
+        requests = len(self.server.requests)
+        job = Job(self.commcell, 1, 'Backup')
+
+        self.assertTrue(job._finished)
+        self.assertEqual(job._status, 'Killed')
+        self.assertEqual(len(self.server.requests), requests)
+        self.assertEqual(self.monitor.get_job(1), None)
+
+    def test_wait_for_invalid_job_id(self):
+        self.monitor._VALIDATION_PERIOD = 0
+        job = Job(self.commcell, 99)
+
+        with self.assertRaises(SDKException) as context:
+            self.monitor.wait(job, timeout=5)
+
+        self.assertEqual(context.exception.exception_id, '103')
+        self.assertTrue(job._invalid)
+        self.assertEqual(len(self.monitor), 0)
+
+        with self.assertRaises(SDKException):
+            job.status
+
+        # a later instance for the same job id is rejected without polling
+        self.assertTrue(Job(self.commcell, 99)._invalid)
+
+    def test_missing_job_kept_within_validation_period(self):
+        self.monitor._VALIDATION_PERIOD = 60
+        job = Job(self.commcell, 99)
+
+        self.assertEqual(self.monitor.wait_any([job], timeout=0.2), None)
+        self.assertFalse(job._invalid)
+        self.assertEqual(self.monitor.get_job(99), job)
+
+    def test_typed_job_read_in_batch(self):
+        self.server.set_job(1, 'Running')
+        job = Job(self.commcell, 1, 'Backup')
+
+        self.assertEqual(self.monitor.wait_any([job], timeout=0.2), None)
+        self.assertGreater(self.server.count('Job?clientId=0&jobFilter=Backup'), 0)
+        self.assertEqual(self.server.count('Job/1'), 0)
+
+    def test_track_events(self):
+        self.server.set_job(1, 'Running')
+        job = Job(self.commcell, 1, 'Backup')
+        completed = threading.Event()
+
+        self.monitor.subscribe(
+            lambda event: completed.set(), jobs=[job], event_types=[JobEvent.COMPLETED]
+        )
+        self.server.set_job(1, 'Completed')
+
+        # the callbacks are called by the poller, after the waiting threads are notified
+        self.assertTrue(completed.wait(5))
+        self.assertTrue(job._finished)
+
+    def test_invalid_event(self):
+        self.monitor._VALIDATION_PERIOD = 0
+        job = Job(self.commcell, 99)
+        invalid = threading.Event()
+
+        self.monitor.subscribe(
+            lambda event: invalid.set(), jobs=[job], event_types=[JobEvent.INVALID]
+        )
+
+        self.assertTrue(invalid.wait(5))
+        self.assertTrue(job._invalid)
+
+    def test_stopped_event(self):
+        self.server.set_job(1, 'Running')
+        self.server.set_job(2, 'Running')
+        jobs = [Job(self.commcell, 1, 'Backup'), Job(self.commcell, 2, 'Backup')]
+        stopped = []
+
+        self.monitor.subscribe(
+            lambda event: stopped.append(event.job.job_id), event_types=[JobEvent.STOPPED]
+        )
+
+        self.monitor.untrack(jobs[0])
+        self.assertEqual(stopped, ['1'])
+
+        self.monitor.stop()
+        self.assertEqual(stopped, ['1', '2'])
+
+    def test_events_end_when_monitor_stops(self):
+        self.server.set_job(1, 'Running')
+        job = Job(self.commcell, 1, 'Backup')
+
+        threading.Timer(0.1, self.monitor.stop).start()
+        events = [event.event_type for event in self.monitor.events([job], timeout=5)]
+
+        self.assertEqual(events[-1], JobEvent.STOPPED)
+
+
+if __name__ == '__main__':
+    unittest.main()
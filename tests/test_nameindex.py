@@ -0,0 +1,106 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Tests for the NameIndex, and the search of the clients of the fake commcell server."""
+
+from __future__ import absolute_import
+
+import unittest
+
+from cvpysdk.client import Clients
+from cvpysdk.exception import SDKException
+from cvpysdk.nameindex import NameIndex
+
+from fakes import FakeCommcell, FakeCommcellServer
+
+
+NAMES = ['SQL-Prod-01', 'sql-prod-02', 'sql-test-01', 'web-prod-01', 'sql', 'sqlite']
+
+
+class NameIndexTest(unittest.TestCase):
+
+    def setUp(self):
+        self.index = NameIndex(NAMES + ['SQL'])
+
+    def test_names_lower_case_and_unique(self):
+        self.assertEqual(len(self.index), 6)
+        self.assertIn('SQL-PROD-01', self.index)
+        self.assertNotIn('sql-prod', self.index)
+
+    def test_prefix(self):
+        self.assertEqual(self.index.prefix('SQL-'), ['sql-prod-01', 'sql-prod-02', 'sql-test-01'])
+        self.assertEqual(self.index.prefix('oracle'), [])
+        self.assertEqual(len(self.index.prefix('')), 6)
+
+    def test_glob(self):
+        self.assertEqual(self.index.glob('sql-*-01'), ['sql-prod-01', 'sql-test-01'])
+        self.assertEqual(self.index.glob('*-prod-0?'),
+                         ['sql-prod-01', 'sql-prod-02', 'web-prod-01'])
+        self.assertEqual(self.index.glob('sql'), ['sql'])
+
+    def test_regex(self):
+        self.assertEqual(self.index.regex('^SQL-prod'), ['sql-prod-01', 'sql-prod-02'])
+        self.assertEqual(self.index.regex('prod-0[2-9]$'), ['sql-prod-02'])
+
+        # the literal followed by a quantifier is optional, and not a part of the prefix
+        self.assertEqual(self.index.regex('^sqlx?-test'), ['sql-test-01'])
+        self.assertEqual(self.index.regex('^sqlite|^web'), ['sqlite', 'web-prod-01'])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(SDKException) as context:
+            self.index.search('sql*', 'wildcard')
+
+        self.assertEqual(context.exception.exception_id, '102')
+
+        with self.assertRaises(SDKException) as context:
+            self.index.regex('sql(')
+
+        self.assertEqual(context.exception.exception_id, '103')
+
+        with self.assertRaises(SDKException):
+            self.index.glob(None)
+
+
+class ClientsSearchTest(unittest.TestCase):
+
+    def setUp(self):
+        self.server = FakeCommcellServer()
+        self.commcell = FakeCommcell(self.server)
+
+        for client_id, client_name in enumerate(NAMES, 1):
+            self.server.add_client(client_id, client_name)
+
+        self.clients = Clients(self.commcell)
+
+    def tearDown(self):
+        self.commcell.job_monitor.stop()
+
+    def test_search(self):
+        self.assertEqual(self.clients.search('sql-prod-*'), ['sql-prod-01', 'sql-prod-02'])
+        self.assertEqual(self.clients.search('sql', 'prefix'),
+                         ['sql', 'sql-prod-01', 'sql-prod-02', 'sql-test-01', 'sqlite'])
+        self.assertEqual(self.clients.search('test', 'regex'), ['sql-test-01'])
+
+    def test_index_built_again_on_refresh(self):
+        self.clients.search('sql*')
+        index = self.clients._name_index()
+
+        self.clients.search('web*')
+        self.assertIs(self.clients._name_index(), index)
+
+        self.server.add_client(10, 'sql-prod-03')
+        self.clients.refresh()
+
+        self.assertIsNot(self.clients._name_index(), index)
+        self.assertEqual(self.clients.search('sql-prod-*'),
+                         ['sql-prod-01', 'sql-prod-02', 'sql-prod-03'])
+
+
+if __name__ == '__main__':
+    unittest.main()
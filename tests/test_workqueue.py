@@ -0,0 +1,141 @@
+#!/usr/bin/env python
+# -*- coding: utf-8 -*-
+
+# --------------------------------------------------------------------------
+# Copyright ©2016 Commvault Systems, Inc.
+# See LICENSE.txt in the project root for
+# license information.
+# --------------------------------------------------------------------------
+
+"""Tests for resuming the WorkQueue, with a fake submitter starting the jobs of the items."""
+
+from __future__ import absolute_import
+
+import os
+import shutil
+import tempfile
+import threading
+import unittest
+
+from cvpysdk.exception import SDKException
+from cvpysdk.workqueue import WorkQueue
+
+
+class FakeJob(object):
+    """Job returned by the fake submitter, with the job id recorded by the queue."""
+
+    def __init__(self, job_id):
+        self.job_id = job_id
+
+
+class FakeSubmitter(object):
+    """Fake submitter, starting a job for each item, and failing for the items given."""
+
+    def __init__(self, failing_keys=()):
+        self.failing_keys = set(failing_keys)
+        self.submitted = []
+        self._lock = threading.Lock()
+
+    def submit(self, item_key, payload):
+        with self._lock:
+            self.submitted.append(item_key)
+
+            if item_key in self.failing_keys:
+                raise SDKException('Response', '101', 'backup of {0} failed'.format(item_key))
+
+            return FakeJob(100 + payload['index'])
+
+
+class WorkQueueTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.database_path = os.path.join(self.directory, 'queue.db')
+
+        self.queue = self.open_queue()
+        self.queue.add((key, {'index': index}) for index, key in enumerate(['a', 'b', 'c']))
+
+    def tearDown(self):
+        self.queue.close()
+        shutil.rmtree(self.directory)
+
+    def open_queue(self):
+        return WorkQueue(self.database_path, 'backup')
+
+    def reopen_queue(self):
+        self.queue.close()
+        self.queue = self.open_queue()
+
+    def test_add_ignores_items_present(self):
+        self.assertEqual(self.queue.add([('a', None), ('d', None)]), 1)
+        self.assertEqual(len(self.queue), 4)
+
+    def test_resume_after_failure(self):
+        submitter = FakeSubmitter(failing_keys=['b'])
+        results = self.queue.run(submitter.submit, max_workers=2)
+
+        self.assertIsInstance(results['b'], SDKException)
+        self.assertEqual(self.queue.job_ids(), {'a': '100', 'c': '102'})
+
+        self.reopen_queue()
+
+        self.assertEqual(self.queue.pending(), [('b', {'index': 1})])
+        self.assertEqual(self.queue.pending(retry_failed=False), [])
+        self.assertIn('backup of b failed', self.queue.errors()['b'])
+
+        submitter = FakeSubmitter()
+        self.queue.run(submitter.submit)
+
+        self.assertEqual(submitter.submitted, ['b'])
+        self.assertEqual(self.queue.job_ids(), {'a': '100', 'b': '101', 'c': '102'})
+        self.assertEqual(
+            self.queue.status(), {'pending': 0, 'started': 0, 'done': 3, 'failed': 0}
+        )
+
+    def test_in_doubt_items_not_sent_again(self):
+        # the process died while sending the request for b, after a was done
+        self.queue._process(FakeSubmitter().submit, ('a', {'index': 0}))
+        self.queue._set_state('b', 'started')
+
+        self.reopen_queue()
+
+        self.assertEqual(self.queue.in_doubt(), ['b'])
+
+        submitter = FakeSubmitter()
+        self.queue.run(submitter.submit)
+
+        self.assertEqual(submitter.submitted, ['c'])
+        self.assertEqual(self.queue.in_doubt(), ['b'])
+
+        self.queue.reset(self.queue.in_doubt())
+        self.queue.run(submitter.submit)
+
+        self.assertEqual(submitter.submitted, ['c', 'b'])
+        self.assertEqual(self.queue.in_doubt(), [])
+        self.assertEqual(self.queue.status()['done'], 3)
+
+    def test_run_selected_items(self):
+        submitter = FakeSubmitter()
+        self.queue.run(submitter.submit, item_keys=['c'])
+
+        self.assertEqual(submitter.submitted, ['c'])
+        self.assertEqual([item[0] for item in self.queue.pending()], ['a', 'b'])
+
+    def test_done_items_not_sent_again_until_cleared(self):
+        self.queue.run(FakeSubmitter().submit)
+        self.queue.add([('a', {'index': 0})])
+
+        submitter = FakeSubmitter()
+        self.assertEqual(self.queue.run(submitter.submit), {})
+        self.assertEqual(submitter.submitted, [])
+
+        self.queue.clear()
+        self.queue.add((key, {'index': index}) for index, key in enumerate(['a', 'b']))
+        self.queue.run(submitter.submit)
+
+        self.assertEqual(sorted(submitter.submitted), ['a', 'b'])
+        self.assertEqual(self.queue.job_ids(), {'a': '100', 'b': '101'})
+
+
+if __name__ == '__main__':
+    unittest.main()